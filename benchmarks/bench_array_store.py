@@ -0,0 +1,105 @@
+# -*- coding:utf-8 -*-
+##############################################################
+# Created Date: Monday, October 19th 2026
+# Contact Info: luoxiangyong01@gmail.com
+# Author/Copyright: Mr. Xiangyong Luo
+##############################################################
+"""Load time and peak RSS of load_arrays compared with pickle_load, for a skim matrix and a distance
+table. Each load runs in a new process, the peak RSS is the growth of ru_maxrss during the load and
+a lookup of 1000 random cells. The RSS of a memory map counts the pages of the shared page cache,
+the memory not backed by a file is the growth of RssAnon and RssShmem on Linux.
+
+Usage:
+    python benchmarks/bench_array_store.py [--mb 512]
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from pyufunc.util_pathio._io import pickle_save, pickle_load  # noqa: E402
+from pyufunc.util_pathio._array_store import save_arrays, load_arrays  # noqa: E402
+
+
+def _make_payload(size_mb: int) -> dict:
+    import numpy as np
+
+    side = int((size_mb * 1024 * 1024 // 2 // 8) ** 0.5)
+    rng = np.random.default_rng(0)
+    return {"skim_time": rng.random((side, side)) * 60, "distance": rng.random((side, side)) * 100}
+
+
+def _max_rss_mb() -> float:
+    # kilobytes on Linux, bytes on macOS
+    scale = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / scale
+
+
+def _rss_anon_mb() -> float:
+    # the large buffers of pickle_load are anonymous memory maps, counted in RssShmem
+    with contextlib.suppress(OSError), open("/proc/self/status") as f:
+        return sum(int(line.split()[1]) for line in f if line.startswith(("RssAnon:", "RssShmem:"))) / 1024
+    return float("nan")
+
+
+def _worker(case: str, op: str, path: str, size_mb: int) -> dict:
+    import numpy as np
+
+    if op == "save":
+        payload = _make_payload(size_mb)
+        time_start = time.perf_counter()
+        if case == "pickle_load":
+            pickle_save(payload, path)
+        else:
+            save_arrays(payload, path)
+        return {"save": time.perf_counter() - time_start}
+
+    rss_start = _max_rss_mb()
+    anon_start = _rss_anon_mb()
+    time_start = time.perf_counter()
+    arrays = pickle_load(path) if case == "pickle_load" else load_arrays(path)
+    load_seconds = time.perf_counter() - time_start
+
+    skim = arrays["skim_time"]
+    rows, cols = np.random.default_rng(1).integers(0, skim.shape[0], (2, 1000))
+    float(skim[rows, cols].sum())
+    return {"load": load_seconds, "lookup": time.perf_counter() - time_start - load_seconds,
+            "peak_mb": _max_rss_mb() - rss_start, "anon_mb": _rss_anon_mb() - anon_start}
+
+
+def _run(case: str, op: str, path: str, size_mb: int) -> dict:
+    # ru_maxrss is kept across exec on Linux, the payload is never made in the parent
+    out = subprocess.run([sys.executable, __file__, "--worker", case, op, path, str(size_mb)],
+                         check=True, capture_output=True, text=True).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--mb", type=int, default=512, help="the size of the payload in MB")
+    parser.add_argument("--worker", nargs=4, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        case, op, path, size_mb = args.worker
+        print(json.dumps(_worker(case, op, path, int(size_mb))))
+        sys.exit(0)
+
+    print(f"  payload: {args.mb} MB of NumPy arrays, read from the page cache")
+    print(f"  {'':<12} {'save (s)':>9} {'load (s)':>9} {'lookup (s)':>11} {'load peak (MB)':>15} {'anon (MB)':>10}")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for case in ("pickle_load", "load_arrays"):
+            path = os.path.join(tmp_dir, "payload.pkl" if case == "pickle_load" else "store")
+            save = _run(case, "save", path, args.mb)
+            result = _run(case, "load", path, args.mb)
+            print(f"  {case:<12} {save['save']:>9.2f} {result['load']:>9.3f} "
+                  f"{result['lookup']:>11.3f} {result['peak_mb']:>15.0f} {result['anon_mb']:>10.0f}")
@@ -0,0 +1,72 @@
+# -*- coding:utf-8 -*-
+##############################################################
+# Created Date: Monday, October 19th 2026
+# Contact Info: luoxiangyong01@gmail.com
+# Author/Copyright: Mr. Xiangyong Luo
+##############################################################
+"""Time of write_many and read_many compared with a loop writing one file at a time, by a temporary
+file, fsync and a rename, and reading one file at a time, for many small CSV files.
+
+Usage:
+    python benchmarks/bench_bulk_io.py [--files 2000] [--dir /path/on/the/disk/to/test] [--cold]
+
+With --cold, the page cache is dropped before each read, which needs root on Linux.
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from pyufunc.util_pathio._bulk_io import read_many, write_many  # noqa: E402
+
+
+def _write_loop(items: dict) -> None:
+    for path, text in items.items():
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+
+
+def _drop_page_cache() -> None:
+    os.sync()
+    with open("/proc/sys/vm/drop_caches", "w") as f:
+        f.write("3\n")
+
+
+def _read_loop(paths: list) -> None:
+    for path in paths:
+        with open(path, "r", encoding="utf-8") as f:
+            f.read()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--files", type=int, default=2000, help="the number of files")
+    parser.add_argument("--dir", default=None, help="the directory of the files. Defaults to a temporary directory")
+    parser.add_argument("--cold", action="store_true", help="drop the page cache before each read")
+    args = parser.parse_args()
+
+    text = "".join(f"{i},{i * 0.5},{i % 7}\n" for i in range(200))
+    print(f"  {args.files} CSV files of {len(text) / 1024:.1f} KB, {os.cpu_count()} CPUs")
+    with tempfile.TemporaryDirectory(dir=args.dir) as tmp_dir:
+        items = {os.path.join(tmp_dir, f"zone_{i}.csv"): text for i in range(args.files)}
+        cases = {"write, loop": lambda: _write_loop(items),
+                 "write_many fsync=each": lambda: list(write_many(items, fsync="each")),
+                 "write_many fsync=batch": lambda: list(write_many(items, fsync="batch")),
+                 "write_many fsync=None": lambda: list(write_many(items, fsync=None)),
+                 "read, loop": lambda: _read_loop(list(items)),
+                 "read_many": lambda: list(read_many(items))}
+        for case, func in cases.items():
+            if args.cold and case.startswith("read"):
+                _drop_page_cache()
+            time_start = time.perf_counter()
+            func()
+            print(f"  {case:<24} {time.perf_counter() - time_start:>8.3f} s")
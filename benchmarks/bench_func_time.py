@@ -0,0 +1,36 @@
+# -*- coding:utf-8 -*-
+##############################################################
+# Created Date: Monday, October 19th 2026
+# Contact Info: luoxiangyong01@gmail.com
+# Author/Copyright: Mr. Xiangyong Luo
+##############################################################
+"""Per-call overhead of func_time recording into the timing registry.
+
+Usage:
+    python benchmarks/bench_func_time.py
+"""
+
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from pyufunc.pkg_configs import config_func_time  # noqa: E402
+from pyufunc.util_magic._func_time_decorator import func_time, get_func_time_stats  # noqa: E402
+
+
+def _noop():
+    return 1
+
+
+if __name__ == "__main__":
+    config_func_time["print_mode"] = "off"
+    timed_noop = func_time(_noop)
+    number = 200000
+
+    plain = min(timeit.repeat(_noop, number=number, repeat=5)) / number * 1e9
+    timed = min(timeit.repeat(timed_noop, number=number, repeat=5)) / number * 1e9
+    print(f"  plain call: {plain:,.0f} ns")
+    print(f"  func_time : {timed:,.0f} ns (overhead {timed - plain:,.0f} ns)")
+    print(f"  recorded  : {get_func_time_stats(f'{__name__}._noop')['count']:,} calls")
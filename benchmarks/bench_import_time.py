@@ -0,0 +1,47 @@
+# -*- coding:utf-8 -*-
+##############################################################
+# Created Date: Monday, October 19th 2026
+# Contact Info: luoxiangyong01@gmail.com
+# Author/Copyright: Mr. Xiangyong Luo
+##############################################################
+"""Start-up time of a fresh interpreter importing pyufunc, and using one helper of it.
+With --max-ms, exit with an error if the plain import is slower, e.g. in CI.
+
+Usage:
+    python benchmarks/bench_import_time.py [--max-ms 100]
+"""
+
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+
+CASES = {
+    "python": "pass",
+    "import pyufunc": "import pyufunc",
+    "pyufunc.path2linux": "import pyufunc; pyufunc.path2linux('a/b')",
+    "pyufunc.group_dt_daily": "import pyufunc; pyufunc.group_dt_daily",
+}
+
+
+def _startup_ms(code: str, repeat: int = 7) -> float:
+    elapsed = []
+    for _ in range(repeat):
+        time_start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", code], check=True, cwd=ROOT)
+        elapsed.append((time.perf_counter() - time_start) * 1000)
+    return statistics.median(elapsed)
+
+
+if __name__ == "__main__":
+    max_ms = float(sys.argv[sys.argv.index("--max-ms") + 1]) if "--max-ms" in sys.argv else None
+    results = {name: _startup_ms(code) for name, code in CASES.items()}
+    for name, elapsed in results.items():
+        print(f"  {name:<24} {elapsed:>8.1f} ms  (+{elapsed - results['python']:.1f} ms)")
+
+    import_ms = results["import pyufunc"] - results["python"]
+    if max_ms is not None and import_ms > max_ms:
+        sys.exit(f"  import pyufunc took {import_ms:.1f} ms, over the limit of {max_ms} ms")
@@ -0,0 +1,49 @@
+# -*- coding:utf-8 -*-
+##############################################################
+# Created Date: Monday, October 19th 2026
+# Contact Info: luoxiangyong01@gmail.com
+# Author/Copyright: Mr. Xiangyong Luo
+##############################################################
+"""Per-call latency of KuaiLogger.info with sync and async file writing.
+
+Usage:
+    python benchmarks/bench_log_async.py [num_calls]
+"""
+
+import logging
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from pyufunc.util_log._lg_logger import KuaiLogger  # noqa: E402
+
+
+def percentiles(latencies_ns: list, pcts=(50, 90, 99, 99.9)) -> dict:
+    latencies_ns = sorted(latencies_ns)
+    return {p: latencies_ns[min(len(latencies_ns) - 1, int(len(latencies_ns) * p / 100))] / 1000 for p in pcts}
+
+
+def bench(num_calls: int, **kwargs) -> dict:
+    with tempfile.TemporaryDirectory() as log_dir:
+        logger = KuaiLogger("bench", level=logging.INFO, is_add_file_handler=True,
+                            log_path=log_dir, log_filename="bench.log",
+                            formatter_template="{asctime} - {name} - {levelname} - {message}", **kwargs)
+        latencies = []
+        for i in range(num_calls):
+            t0 = time.perf_counter_ns()
+            logger.info(f"message {i}")
+            latencies.append(time.perf_counter_ns() - t0)
+        logger.flush()
+        return percentiles(latencies)
+
+
+if __name__ == "__main__":
+    num_calls = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    for mode, kwargs in (("sync", {}),
+                         ("async block", {"is_async": True}),
+                         ("async drop", {"is_async": True, "async_overflow": "drop"})):
+        res = bench(num_calls, **kwargs)
+        print(f"{mode:>12}: " + ", ".join(f"p{p}={v:.1f}us" for p, v in res.items()))
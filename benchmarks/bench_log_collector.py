@@ -0,0 +1,60 @@
+# -*- coding:utf-8 -*-
+##############################################################
+# Created Date: Monday, October 19th 2026
+# Contact Info: luoxiangyong01@gmail.com
+# Author/Copyright: Mr. Xiangyong Luo
+##############################################################
+"""Throughput of N producer processes logging to one file through a LogCollector.
+
+Each run also checks that every line in the log files is complete.
+
+Usage:
+    python benchmarks/bench_log_collector.py [msgs_per_process]
+"""
+
+import logging
+import multiprocessing
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from pyufunc.util_log._lg_collector import LogCollector  # noqa: E402
+from pyufunc.util_log._lg_logger import KuaiLogger  # noqa: E402
+
+_FMT = "{name} - {levelname} - {message}"
+
+
+def producer(address, proc_id: int, num_msgs: int):
+    logger = KuaiLogger(f"p{proc_id}", level=logging.INFO, is_add_file_handler=True,
+                        formatter_template=_FMT, log_collector_address=address)
+    for i in range(num_msgs):
+        logger.info(f"{i:08d}" + "x" * 80)
+    logger.flush()
+
+
+def bench(num_procs: int, num_msgs: int) -> float:
+    with tempfile.TemporaryDirectory() as log_dir:
+        collector = LogCollector("bench.log", log_path=log_dir, max_bytes=10 * 1000 * 1000)
+        t0 = time.perf_counter()
+        procs = [multiprocessing.Process(target=producer, args=(collector.address, i, num_msgs))
+                 for i in range(num_procs)]
+        for proc in procs:
+            proc.start()
+        for proc in procs:
+            proc.join()
+        collector.close()
+        elapsed = time.perf_counter() - t0
+
+        lines = [line for f in Path(log_dir).iterdir() for line in f.read_text(encoding="utf8").splitlines()]
+        assert len(lines) == num_procs * num_msgs, f"expected {num_procs * num_msgs} lines, got {len(lines)}"
+        assert all(len(line.rsplit(" - ", 1)[-1]) == 88 for line in lines), "corrupted lines found"
+        return len(lines) / elapsed
+
+
+if __name__ == "__main__":
+    num_msgs = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    for num_procs in (1, 2, 4, 8):
+        print(f"{num_procs} producer process(es): {bench(num_procs, num_msgs):,.0f} msgs/s")
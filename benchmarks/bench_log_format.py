@@ -0,0 +1,58 @@
+# -*- coding:utf-8 -*-
+##############################################################
+# Created Date: Monday, October 19th 2026
+# Contact Info: luoxiangyong01@gmail.com
+# Author/Copyright: Mr. Xiangyong Luo
+##############################################################
+"""Cost of formatting a KuaiLogger.info call, the file handler discards the output.
+
+The throttled cases log the same message in a loop, which is dropped before formatting.
+
+Usage:
+    python benchmarks/bench_log_format.py [num_calls]
+"""
+
+import logging
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from pyufunc.util_log._lg_logger import KuaiLogger  # noqa: E402
+
+
+class _NullWriter:
+    need_write_2_file = True
+
+    def write_2_file(self, msg):
+        pass
+
+
+TEMPLATES = {
+    "no frame fields": "{asctime} - {name} - {levelname} - {message}",
+    "frame fields": '{asctime} - {name} - "{pathname}:{lineno}" - {funcName} - {levelname} - {message}',
+}
+
+
+THROTTLES = {
+    "dedup_window": {"dedup_window": 60},
+    "rate_limit": {"rate_limit": 100},
+    "call_site_rate_limit": {"call_site_rate_limit": 100},
+    "sample_rates": {"sample_rates": {logging.INFO: 0.001}},
+}
+
+
+def bench(template: str, num_calls: int, **kwargs) -> float:
+    logger = KuaiLogger("bench", level=logging.INFO, formatter_template=template, **kwargs)
+    logger._is_add_file_handler = True
+    logger._fw = _NullWriter()
+    return min(timeit.repeat(lambda: logger.info("message"), number=num_calls, repeat=5)) / num_calls * 1e9
+
+
+if __name__ == "__main__":
+    num_calls = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    for desc, template in TEMPLATES.items():
+        print(f"{desc:>20}: {bench(template, num_calls):,.0f} ns/call")
+    for desc, kwargs in THROTTLES.items():
+        print(f"{desc:>20}: {bench(TEMPLATES['frame fields'], num_calls, **kwargs):,.0f} ns/call")
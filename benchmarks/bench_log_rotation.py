@@ -0,0 +1,44 @@
+# -*- coding:utf-8 -*-
+##############################################################
+# Created Date: Monday, October 19th 2026
+# Contact Info: luoxiangyong01@gmail.com
+# Author/Copyright: Mr. Xiangyong Luo
+##############################################################
+"""Write throughput of FileWriter in log directories with many rotated files.
+
+Usage:
+    python benchmarks/bench_log_rotation.py [num_msgs]
+"""
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from pyufunc.util_log._lg_rotate_file_writer import FileWriter  # noqa: E402
+
+
+def bench(num_old_files: int, num_msgs: int, compress: str = None) -> float:
+    with tempfile.TemporaryDirectory() as log_dir:
+        # rotated files from previous days
+        for i in range(num_old_files):
+            Path(log_dir, f"2020-{i // 28 % 12 + 1:02d}-{i % 28 + 1:02d}.{i // 336 + 1:04d}.bench.log").touch()
+
+        msg = "x" * 100 + "\n"
+        t0 = time.perf_counter()
+        fw = FileWriter("bench.log", log_path=log_dir, max_bytes=num_msgs * len(msg) // 20,
+                        back_count=num_old_files + 100, compress=compress)
+        for _ in range(num_msgs):
+            fw.write_2_file(msg)
+        throughput = num_msgs / (time.perf_counter() - t0)
+        fw.flush_tasks()
+        return throughput
+
+
+if __name__ == "__main__":
+    num_msgs = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    for num_old_files in (0, 1000, 10000):
+        print(f"{num_old_files:>6} rotated files: {bench(num_old_files, num_msgs):,.0f} msgs/s, "
+              f"with gzip: {bench(num_old_files, num_msgs, compress='gzip'):,.0f} msgs/s")
@@ -0,0 +1,57 @@
+# -*- coding:utf-8 -*-
+##############################################################
+# Created Date: Monday, October 19th 2026
+# Contact Info: luoxiangyong01@gmail.com
+# Author/Copyright: Mr. Xiangyong Luo
+##############################################################
+"""Caller thread cost of the json file handler and the speed of filtered reads.
+
+Usage:
+    python benchmarks/bench_log_structured.py [num_calls]
+"""
+
+import logging
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from pyufunc.util_log._lg_logger import KuaiLogger  # noqa: E402
+from pyufunc.util_log._lg_structured import read_structured_logs  # noqa: E402
+
+TEMPLATE = "{asctime} - {host} - {name} - {levelname} - {message}"
+
+
+def bench(structured_format, num_calls: int, log_dir: str):
+    logger = KuaiLogger(f"bench_{structured_format}", level=logging.INFO, is_add_json_file_handler=True,
+                        json_log_path=log_dir, log_filename=f"{structured_format}.log",
+                        formatter_template=TEMPLATE, structured_format=structured_format)
+
+    start = time.perf_counter()
+    for i in range(num_calls):
+        logger.log(logging.ERROR if i % 100 == 0 else logging.INFO, "message", extra={"request_id": i})
+    caller_ns = (time.perf_counter() - start) / num_calls * 1e9
+    logger.flush()
+    total_ns = (time.perf_counter() - start) / num_calls * 1e9
+    return caller_ns, total_ns
+
+
+def bench_read(structured_format, log_dir: str):
+    start = time.perf_counter()
+    num_errors = sum(1 for _ in read_structured_logs(log_dir, f"{structured_format}.log", structured_format,
+                                                     level="ERROR"))
+    return num_errors, time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    num_calls = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    with tempfile.TemporaryDirectory() as log_dir:
+        for structured_format in (None, "jsonl", "binary"):
+            caller_ns, total_ns = bench(structured_format, num_calls, log_dir)
+            print(f"{str(structured_format):>6}: {caller_ns:,.0f} ns/call on the caller thread, "
+                  f"{total_ns:,.0f} ns/call until flushed")
+        for structured_format in ("jsonl", "binary"):
+            num_errors, elapsed = bench_read(structured_format, log_dir)
+            print(f"{structured_format:>6}: read {num_errors} ERROR records of {num_calls} in {elapsed:.3f} s")
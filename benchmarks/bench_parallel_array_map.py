@@ -0,0 +1,56 @@
+# -*- coding:utf-8 -*-
+##############################################################
+# Created Date: Monday, October 19th 2026
+# Contact Info: luoxiangyong01@gmail.com
+# Author/Copyright: Mr. Xiangyong Luo
+##############################################################
+"""Scaling of parallel_array_map with calc_distance_on_unit_haversine, compared with the serial
+kernel and with run_parallel over pickled slices.
+
+Usage:
+    python benchmarks/bench_parallel_array_map.py [num_points]
+"""
+
+import os
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from pyufunc.util_geo._geo_distance import calc_distance_on_unit_haversine  # noqa: E402
+from pyufunc.util_magic._parallel_array_map import parallel_array_map  # noqa: E402
+from pyufunc.util_magic._run_parallel_decorator import run_parallel  # noqa: E402
+from pyufunc.util_magic._worker_pool import WorkerPool  # noqa: E402
+
+
+def _haversine_slice(coords):
+    return calc_distance_on_unit_haversine(*coords)
+
+
+def _timeit(func) -> float:
+    time_start = time.perf_counter()
+    func()
+    return time.perf_counter() - time_start
+
+
+if __name__ == "__main__":
+    num_points = int(sys.argv[1]) if len(sys.argv) > 1 else 20000000
+    coords = np.random.default_rng(0).uniform(-90, 90, (4, num_points))
+    print(f"{os.cpu_count()} cpus, {num_points:,} point pairs")
+
+    serial = _timeit(lambda: calc_distance_on_unit_haversine(*coords))
+    print(f"                  serial: {serial:.2f} s")
+
+    slices = [coords[:, i:i + num_points // 32] for i in range(0, num_points, num_points // 32)]
+    elapsed = _timeit(lambda: run_parallel(_haversine_slice, slices, chunksize=1))
+    print(f"run_parallel with slices: {elapsed:.2f} s")
+
+    for num_processes in (1, 2, 4, 8):
+        if num_processes > (os.cpu_count() or 1) * 2:
+            break
+        with WorkerPool(num_processes) as pool:
+            elapsed = _timeit(lambda: parallel_array_map(calc_distance_on_unit_haversine, tuple(coords), pool=pool))
+        print(f"parallel_array_map x{num_processes:<3}: {elapsed:.2f} s, speed-up {serial / elapsed:.1f}")
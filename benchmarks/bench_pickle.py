@@ -0,0 +1,128 @@
+# -*- coding:utf-8 -*-
+##############################################################
+# Created Date: Monday, October 19th 2026
+# Contact Info: luoxiangyong01@gmail.com
+# Author/Copyright: Mr. Xiangyong Luo
+##############################################################
+"""Save and load time and peak RSS of pickle_save/pickle_load compared with a plain pickle.dump/load,
+for a large NumPy matrix and a pandas DataFrame, and for a network of plain Python objects. Each save
+and load runs in a new process, the peak RSS is the growth of ru_maxrss during the call.
+
+Usage:
+    python benchmarks/bench_pickle.py [--mb 512] [--payload numpy|python|all]
+"""
+
+import argparse
+import json
+import os
+import pickle
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from pyufunc.util_pathio._io import pickle_save, pickle_load  # noqa: E402
+from pyufunc.util_magic._import_package import is_module_importable  # noqa: E402
+
+_CASES = {
+    "pickle.dump protocol 4": {"plain": True},
+    "pickle_save": {},
+    "pickle_save lz4": {"compression": "lz4"},
+    "pickle_save zstd": {"compression": "zstd"},
+}
+
+
+def _make_python_payload(size_mb: int) -> dict:
+    # about size_mb in memory, a link is about 600 bytes of dicts, ints, floats and strings
+    num_links = size_mb * 1024 * 1024 // 600
+    return {"links": [{"link_id": i, "from_node": i, "to_node": i + 1, "length": i * 0.01,
+                       "name": f"link {i}", "lanes": [i % 3, i % 5]} for i in range(num_links)]}
+
+
+def _make_payload(size_mb: int, kind: str) -> dict:
+    if kind == "python":
+        return _make_python_payload(size_mb)
+
+    import numpy as np
+    import pandas as pd
+
+    num_rows = size_mb * 1024 * 1024 // 2 // 8
+    rng = np.random.default_rng(0)
+    # a skim matrix with repeated travel times and a link table, half of the payload each
+    side = int(num_rows ** 0.5)
+    return {"skim": np.round(rng.random((side, side)) * 60, 1),
+            "links": pd.DataFrame({"link_id": np.arange(num_rows // 2),
+                                   "length": rng.random(num_rows // 2)})}
+
+
+def _max_rss_mb() -> float:
+    # kilobytes on Linux, bytes on macOS
+    scale = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / scale
+
+
+def _worker(case: str, op: str, path: str, size_mb: int, kind: str) -> dict:
+    options = dict(_CASES[case])
+    is_plain = options.pop("plain", False)
+    if op == "save":
+        payload = _make_payload(size_mb, kind)
+        rss_start = _max_rss_mb()
+        time_start = time.perf_counter()
+        if is_plain:
+            with open(path, "wb") as f:
+                pickle.dump(payload, f, protocol=4)
+        else:
+            pickle_save(payload, path, **options)
+    else:
+        import numpy  # noqa: F401
+        import pandas  # noqa: F401
+        rss_start = _max_rss_mb()
+        time_start = time.perf_counter()
+        if is_plain:
+            with open(path, "rb") as f:
+                pickle.load(f)
+        else:
+            pickle_load(path)
+    return {"seconds": time.perf_counter() - time_start, "peak_mb": _max_rss_mb() - rss_start}
+
+
+def _run(case: str, op: str, path: str, size_mb: int, kind: str) -> dict:
+    out = subprocess.run([sys.executable, __file__, "--worker", case, op, path, str(size_mb), kind],
+                         check=True, capture_output=True, text=True).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--mb", type=int, default=512, help="the size of the payload in MB")
+    parser.add_argument("--payload", choices=["numpy", "python", "all"], default="all",
+                        help="NumPy and pandas data, plain Python objects or both")
+    parser.add_argument("--worker", nargs=5, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        case, op, path, size_mb, kind = args.worker
+        print(json.dumps(_worker(case, op, path, int(size_mb), kind)))
+        sys.exit(0)
+
+    kinds = ["numpy", "python"] if args.payload == "all" else [args.payload]
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for kind in kinds:
+            print(f"  payload: {args.mb} MB of {'NumPy and pandas data' if kind == 'numpy' else 'Python objects'}")
+            print(f"  {'':<24} {'save (s)':>9} {'save peak (MB)':>15} {'load (s)':>9} "
+                  f"{'load peak (MB)':>15} {'file (MB)':>10}")
+            for case, options in _CASES.items():
+                compression = options.get("compression")
+                if compression and not is_module_importable({"lz4": "lz4", "zstd": "zstandard"}[compression]):
+                    print(f"  {case:<24} skipped, the package is not installed")
+                    continue
+                path = os.path.join(tmp_dir, "payload.pkl")
+                save = _run(case, "save", path, args.mb, kind)
+                load = _run(case, "load", path, args.mb, kind)
+                print(f"  {case:<24} {save['seconds']:>9.2f} {save['peak_mb']:>15.0f} "
+                      f"{load['seconds']:>9.2f} {load['peak_mb']:>15.0f} {os.path.getsize(path) / 1024 ** 2:>10.0f}")
+                os.remove(path)
@@ -0,0 +1,74 @@
+# -*- coding:utf-8 -*-
+##############################################################
+# Created Date: Monday, October 19th 2026
+# Contact Info: luoxiangyong01@gmail.com
+# Author/Copyright: Mr. Xiangyong Luo
+##############################################################
+"""Throughput and peak memory of run_parallel on tiny tasks, compared with Pool.map,
+and the run_parallel backends on tasks waiting 1 ms on I/O.
+
+Usage:
+    python benchmarks/bench_run_parallel.py [num_items]
+"""
+
+import asyncio
+import multiprocessing
+import os
+import resource
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from pyufunc.util_magic._run_parallel_decorator import run_parallel  # noqa: E402
+
+
+def _square(x):
+    return x * x
+
+
+def _wait_io(x):
+    time.sleep(0.001)
+    return x
+
+
+async def _wait_io_async(x):
+    await asyncio.sleep(0.001)
+    return x
+
+
+def _max_rss_mb() -> float:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def bench_pool_map(num_items: int) -> float:
+    time_start = time.perf_counter()
+    with multiprocessing.Pool(os.cpu_count()) as pool:
+        pool.map(_square, range(num_items))
+    return time.perf_counter() - time_start
+
+
+def bench_stream(num_items: int) -> float:
+    time_start = time.perf_counter()
+    total = sum(run_parallel(_square, (x for x in range(num_items)), stream=True, ordered=False))
+    assert total == sum(x * x for x in range(num_items))
+    return time.perf_counter() - time_start
+
+
+def bench_backends(num_items: int):
+    for backend in ("serial", "process", "thread", "asyncio", "auto"):
+        func = _wait_io_async if backend == "asyncio" else _wait_io
+        time_start = time.perf_counter()
+        run_parallel(func, range(num_items), backend=backend)
+        print(f"{backend:>19}: {num_items / (time.perf_counter() - time_start):,.0f} I/O tasks/s")
+
+
+if __name__ == "__main__":
+    num_items = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    # the streaming run goes first, so the peak memory is not inflated by Pool.map
+    elapsed = bench_stream(num_items)
+    print(f"run_parallel stream: {num_items / elapsed:,.0f} items/s, max rss {_max_rss_mb():.0f} MB")
+    elapsed = bench_pool_map(num_items)
+    print(f"           Pool.map: {num_items / elapsed:,.0f} items/s, max rss {_max_rss_mb():.0f} MB")
+    bench_backends(2000)
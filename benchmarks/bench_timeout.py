@@ -0,0 +1,75 @@
+# -*- coding:utf-8 -*-
+##############################################################
+# Created Date: Monday, October 19th 2026
+# Contact Info: luoxiangyong01@gmail.com
+# Author/Copyright: Mr. Xiangyong Luo
+##############################################################
+"""Overhead of the trace-based timeout decorator compared with the process-based TimeoutExecutor,
+for a trivial call, a pure Python loop and a blocking call exceeding its deadline.
+
+Usage:
+    python benchmarks/bench_timeout.py
+"""
+
+import sys
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from pyufunc.util_magic._time_out import timeout  # noqa: E402
+from pyufunc.util_magic._timeout_executor import TimeoutExecutor  # noqa: E402
+
+
+def _noop():
+    return 1
+
+
+def _loop(n):
+    total = 0
+    for i in range(n):
+        total += i * i
+    return total
+
+
+def _timeit(func, repeat: int) -> float:
+    time_start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - time_start) / repeat
+
+
+if __name__ == "__main__":
+    noop_traced = timeout(10)(_noop)
+    loop_traced = timeout(10)(_loop)
+    sleep_traced = timeout(0.2)(time.sleep)
+
+    with TimeoutExecutor(1) as executor:
+        executor.run(_noop)
+        print(f"  {'':<28} {'direct':>10} {'timeout':>10} {'executor':>10}")
+        print(f"  {'trivial call (ms)':<28} {_timeit(_noop, 1000) * 1000:>10.4f} "
+              f"{_timeit(noop_traced, 200) * 1000:>10.4f} "
+              f"{_timeit(lambda: executor.run(_noop, timeout=10), 200) * 1000:>10.4f}")
+        print(f"  {'loop of 10^6 (ms)':<28} {_timeit(lambda: _loop(10 ** 6), 3) * 1000:>10.1f} "
+              f"{_timeit(lambda: loop_traced(10 ** 6), 3) * 1000:>10.1f} "
+              f"{_timeit(lambda: executor.run(_loop, 10 ** 6, timeout=10), 3) * 1000:>10.1f}")
+
+        # a blocking call is not interrupted by the trace, its thread keeps running after the timeout
+        num_threads = threading.active_count()
+        time_start = time.perf_counter()
+        try:
+            sleep_traced(2)
+        except Exception:
+            pass
+        elapsed_traced = time.perf_counter() - time_start
+        leaked = threading.active_count() - num_threads
+        time_start = time.perf_counter()
+        try:
+            executor.run(time.sleep, 2, timeout=0.2)
+        except TimeoutError:
+            pass
+        print(f"  {'sleep(2), 0.2 s limit (ms)':<28} {'':>10} {elapsed_traced * 1000:>10.1f} "
+              f"{(time.perf_counter() - time_start) * 1000:>10.1f}")
+        print(f"  threads still running after the trace-based timeout: {leaked}, "
+              f"workers replaced by the executor: {executor.num_replaced}")
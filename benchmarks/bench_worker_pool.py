@@ -0,0 +1,55 @@
+# -*- coding:utf-8 -*-
+##############################################################
+# Created Date: Monday, October 19th 2026
+# Contact Info: luoxiangyong01@gmail.com
+# Author/Copyright: Mr. Xiangyong Luo
+##############################################################
+"""Per-call cost of run_parallel with a fresh pool, compared with a long-lived WorkerPool
+holding a large NumPy array in shared memory.
+
+Usage:
+    python benchmarks/bench_worker_pool.py [start_method]
+"""
+
+import functools
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from pyufunc.util_magic._run_parallel_decorator import run_parallel  # noqa: E402
+from pyufunc.util_magic._worker_pool import WorkerPool, get_shared  # noqa: E402
+
+
+def _row_sum_arg(i, matrix):
+    return float(matrix[i].sum())
+
+
+def _row_sum_shared(i):
+    return float(get_shared("matrix")[i].sum())
+
+
+def _timeit(func, repeat: int = 5) -> float:
+    time_start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - time_start) / repeat
+
+
+if __name__ == "__main__":
+    start_method = sys.argv[1] if len(sys.argv) > 1 else None
+    matrix = np.random.rand(2000, 2000)  # 32 MB
+    rows = range(100)
+
+    elapsed = _timeit(lambda: run_parallel(functools.partial(_row_sum_arg, matrix=matrix), rows,
+                                           num_processes=2, start_method=start_method))
+    print(f"  fresh pool, array in args: {elapsed * 1000:,.1f} ms/call")
+
+    time_start = time.perf_counter()
+    with WorkerPool(2, shared={"matrix": matrix}, start_method=start_method) as pool:
+        print(f"        WorkerPool start-up: {(time.perf_counter() - time_start) * 1000:,.1f} ms")
+        elapsed = _timeit(lambda: pool.map(_row_sum_shared, rows))
+        print(f"   WorkerPool, array in shm: {elapsed * 1000:,.1f} ms/call")
@@ -7,49 +7,16 @@
 
 import itertools
 
-from pyufunc import util_ai
-from pyufunc import util_algorithm
-from pyufunc import util_magic
-from pyufunc import util_data_processing
-from pyufunc import util_datetime
-from pyufunc import util_fullstack
-from pyufunc import util_geo
-from pyufunc import util_git_pypi
-from pyufunc import util_gui
-from pyufunc import util_img
-from pyufunc import util_log
-from pyufunc import util_network
-from pyufunc import util_office
-from pyufunc import util_optimization
-from pyufunc import util_pathio
-from pyufunc import util_test
-from pyufunc import util_vis
-
 from .pkg_configs import config_FUNC_KEYWORD
+from .pkg_func_index import FUNC_INDEX
 
+# the function lists are read from the static index, nothing is imported
+_CATEGORY_NAME = {"util_magic": "util_common"}
 
-config_FUNC_CATEGORY = {
-    "util_ai": util_ai.__all__,
-    "util_algorithm": util_algorithm.__all__,
-    "util_common": util_magic.__all__,
-    "util_data_processing": util_data_processing.__all__,
-    "util_datetime": util_datetime.__all__,
-    "util_fullstack": util_fullstack.__all__,
-    "util_geo": util_geo.__all__,
-    "util_git_pypi": util_git_pypi.__all__,
-    "util_gui": util_gui.__all__,
-    "util_img": util_img.__all__,
-    "util_log": util_log.__all__,
-    "util_network": util_network.__all__,
-    "util_office": util_office.__all__,
-    "util_optimization": util_optimization.__all__,
-    "util_pathio": util_pathio.__all__,
-    "util_test": util_test.__all__,
-    "util_vis": util_vis.__all__,
-    "pkg_utils": ["show_util_func_by_category",
-                  "show_util_func_by_keyword",
-                  "find_util_func_by_keyword"],
-}
+config_FUNC_CATEGORY = {_CATEGORY_NAME.get(subpkg, subpkg): list(names) for subpkg, names in FUNC_INDEX.items()}
+config_FUNC_CATEGORY["pkg_utils"] = ["show_util_func_by_category",
+                                     "show_util_func_by_keyword",
+                                     "find_util_func_by_keyword"]
 
 
 def show_util_func_by_category(verbose: bool = True) -> None:
@@ -10,24 +10,10 @@
 
 import sys
 
-# import all modules
-from .util_ai import *  # machine learning functions  # noqa: F403
-from .util_algorithm import *  # algorithm functions  # noqa: F403
-from .util_magic import *  # unclassified functions are here  # noqa: F403
-from .util_data_processing import *  # data processing functions including algorithms  # noqa: F403
-from .util_datetime import *  # datetime functions  # noqa: F403
-from .util_fullstack import *  # fullstack functions, including front end and back end  # noqa: F403
-from .util_geo import *  # geographic functions  # noqa: F403
-from .util_git_pypi import *  # git and pypi functions  # noqa: F403
-from .util_gui import *  # GUI functions    # noqa: F403
-from .util_img import *  # image functions   # noqa: F403
-from .util_log import *  # logging functions    # noqa: F403
-from .util_network import *  # network functions    # noqa: F403
-from .util_office import *  # office functions  # noqa: F403
-from .util_optimization import *  # optimization functions  # noqa: F403
-from .util_pathio import *  # path and IO functions  # noqa: F403
-from .util_test import *  # test functions  # noqa: F403
-from .util_vis import *  # visualization functions  # noqa: F403
+# the util_* modules are imported on first access of their functions, see pkg_func_index
+import importlib
+
+from .pkg_func_index import FUNC_INDEX, SUBPACKAGES, resolve
 
 # import package configurations and utilities
 from .pkg_configs import *  # noqa: F403
@@ -54,4 +40,26 @@ def check_python_version(min_version: str = "3.10") -> tuple:
 
 check_python_version()
 
-__all__ = [func for fn_lst in list(config_FUNC_CATEGORY.values()) for func in fn_lst]
\ No newline at end of file
+__all__ = [func for fn_lst in list(config_FUNC_CATEGORY.values()) for func in fn_lst]
+
+_FUNC_MODULE = {name: target for names in FUNC_INDEX.values() for name, target in names.items()}
+
+
+def __getattr__(name: str):
+    # PEP 562: import a function from its module on first access, e.g. pyufunc.path2linux
+    if name in _FUNC_MODULE:
+        value = resolve(*_FUNC_MODULE[name])
+    elif name == "computer_ip":
+        # resolved on first access, it can block on DNS
+        from .pkg_configs import _get_computer_ip
+        value = _get_computer_ip()
+    elif name in SUBPACKAGES:
+        value = importlib.import_module(f"{__name__}.{name}")
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(_FUNC_MODULE) | set(SUBPACKAGES) | {"computer_ip"})
\ No newline at end of file
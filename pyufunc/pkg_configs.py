@@ -9,7 +9,32 @@ import os
 import socket
 
 computer_name = socket.gethostname()
-computer_ip = socket.gethostbyname(computer_name)
+
+
+def _get_computer_ip() -> str:
+    # resolving the host ip can block on DNS, so it is only done on first use of computer_ip
+    global computer_ip
+    if "computer_ip" not in globals():
+        computer_ip = socket.gethostbyname(computer_name)
+    return computer_ip
+
+
+def _get_log_fmt_host() -> str:
+    # the log format with the host ip and name, the former log_fmt 9
+    global log_fmt_host
+    if "log_fmt_host" not in globals():
+        log_fmt_host = (f'%(asctime)s-({_get_computer_ip()},{computer_name})-[p%(process)d_t%(thread)d] - '
+                        '%(name)s - "%(filename)s:%(lineno)d" - %(funcName)s - %(levelname)s - %(message)s')
+    return log_fmt_host
+
+
+def __getattr__(name: str):
+    if name == "computer_ip":
+        return _get_computer_ip()
+    if name == "log_fmt_host":
+        return _get_log_fmt_host()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 # ############## Package Configurations ############## #
 pkg_version = "0.3.8"
@@ -30,6 +55,9 @@ __all__ = [
     "config_email",
     "config_gmns",
     "config_color",
+    "config_func_time",
+    "config_profile",
+    "config_dir_index",
 ]
 
 # ############### Function Keywords Configuration ############### #
@@ -89,7 +117,7 @@ config_logging = {
 
         8: '[p%(process)d_t%(thread)d] %(asctime)s - %(name)s - "%(filename)s:%(lineno)d" - %(levelname)s - %(message)s',
 
-        9: f'%(asctime)s-({computer_ip},{computer_name})-[p%(process)d_t%(thread)d] - %(name)s - "%(filename)s:%(lineno)d" - %(funcName)s - %(levelname)s - %(message)s',
+        # the format with the host ip and name resolves the ip on first use, see pkg_configs.log_fmt_host
     },
 
     # default log date format
@@ -245,3 +273,38 @@ config_color = {
     "BRIGHT_WHITE"  : ('\x1b[97m', '\x1b[107m'),
     # "END"           : ('\x1b[0m',  '\x1b[0m'),
 }
+
+# ############### Function Timing Configuration ############### #
+config_func_time = {
+    # print mode of func_time and func_running_time:
+    # "off", "call" (after each call) or "summary" (all functions at exit)
+    "print_mode": os.environ.get("PYUFUNC_FUNC_TIME_PRINT", "call"),
+}
+
+# ############### Profiling Configuration ############### #
+config_profile = {
+    # comma separated patterns of the functions decorated by func_time or func_running_time to profile,
+    # e.g. "read_link,find_k_nearest_points,group_dt_*", empty to disable
+    "funcs": os.environ.get("PYUFUNC_PROFILE", ""),
+
+    # "sample" (a thread sampling the stacks) or "cprofile"
+    "mode": os.environ.get("PYUFUNC_PROFILE_MODE", "sample"),
+
+    # sampling interval in seconds
+    "interval": float(os.environ.get("PYUFUNC_PROFILE_INTERVAL", "0.005")),
+
+    # the profiles of each process are saved and merged in this folder at exit,
+    # if "funcs" is set or "dump_at_exit" is True
+    "profile_dir": os.environ.get("PYUFUNC_PROFILE_DIR", "pyufunc_profile"),
+
+    # also save the profiles of profile_block and profile_func at exit, they are kept in memory otherwise
+    "dump_at_exit": os.environ.get("PYUFUNC_PROFILE_DUMP", "").lower() in ("1", "true", "yes"),
+}
+
+# ############### Directory Index Configuration ############### #
+config_dir_index = {
+    # the folder of the directory indexes used by get_files_by_ext, check_files_in_dir and get_dir_size
+    # with index=True, one file per indexed directory
+    "index_dir": os.environ.get("PYUFUNC_DIR_INDEX_DIR",
+                                os.path.join(os.path.expanduser("~"), ".cache", "pyufunc", "dir_index")),
+}
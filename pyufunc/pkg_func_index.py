@@ -0,0 +1,349 @@
+# -*- coding:utf-8 -*-
+##############################################################
+# Created Date: Monday, October 19th 2026
+# Contact Info: luoxiangyong01@gmail.com
+# Author/Copyright: Mr. Xiangyong Luo
+##############################################################
+"""The static index of the public names of pyufunc and the modules defining them.
+
+``import pyufunc`` does not import any util_* module, a public name is imported from its module
+on first access (PEP 562), and the function lists are read from the index without importing anything.
+
+The index is generated from the imports in the ``__init__.py`` of each util_* subpackage,
+regenerate it after adding or renaming a public function:
+
+    python -m pyufunc.pkg_func_index
+"""
+
+from __future__ import absolute_import
+import ast
+import importlib
+import sys
+from pathlib import Path
+
+SUBPACKAGES = (
+    "util_ai",
+    "util_algorithm",
+    "util_magic",
+    "util_data_processing",
+    "util_datetime",
+    "util_fullstack",
+    "util_geo",
+    "util_git_pypi",
+    "util_gui",
+    "util_img",
+    "util_log",
+    "util_network",
+    "util_office",
+    "util_optimization",
+    "util_pathio",
+    "util_test",
+    "util_vis",
+)
+
+_GENERATED_MARKER = "# ############### Generated by python -m pyufunc.pkg_func_index, do not edit ############### #\n"
+
+
+def _literal_list(node) -> list:
+    return [elt.value for elt in node.elts if isinstance(elt, ast.Constant)]
+
+
+def build_func_index(pkg_dir: str = None) -> dict:
+    """Build the index from the source of the util_* subpackages, without importing them.
+
+    Args:
+        pkg_dir (str, optional): the folder of the pyufunc package. Defaults to None, this package.
+
+    Returns:
+        dict: {subpackage: {public name: (module name, attribute name or None for a module)}},
+            in the order of the __all__ of each subpackage.
+    """
+    pkg_dir = Path(pkg_dir or Path(__file__).parent)
+    index = {}
+    for subpkg in SUBPACKAGES:
+        tree = ast.parse((pkg_dir / subpkg / "__init__.py").read_text(encoding="utf-8"))
+        imported = {}
+        public = []
+        for node in ast.walk(tree):
+            if isinstance(node, ast.ImportFrom):
+                module = node.module or ""
+                if node.level:
+                    module = f"pyufunc.{subpkg}.{module}" if module else f"pyufunc.{subpkg}"
+                for alias in node.names:
+                    imported[alias.asname or alias.name] = (module, alias.name)
+            elif isinstance(node, ast.Import):
+                for alias in node.names:
+                    if alias.asname:
+                        imported[alias.asname] = (alias.name, None)
+            elif isinstance(node, ast.Assign) and any(
+                    isinstance(target, ast.Name) and target.id == "__all__" for target in node.targets):
+                public = _literal_list(node.value)
+        index[subpkg] = {name: imported[name] for name in public if name in imported}
+    return index
+
+
+def write_func_index(pkg_dir: str = None) -> dict:
+    """Regenerate FUNC_INDEX at the end of this file, see build_func_index."""
+    index = build_func_index(pkg_dir)
+    lines = ["FUNC_INDEX = {\n"]
+    for subpkg, names in index.items():
+        lines.append(f"    {subpkg!r}: {{\n")
+        lines.extend(f"        {name!r}: {target!r},\n" for name, target in names.items())
+        lines.append("    },\n")
+    lines.append("}\n")
+
+    path = Path(__file__)
+    source = path.read_text(encoding="utf-8")
+    path.write_text(source[:source.index(_GENERATED_MARKER) + len(_GENERATED_MARKER)] + "".join(lines),
+                    encoding="utf-8")
+    return index
+
+
+def resolve(module_name: str, attr_name: str = None):
+    """Import a public name of the index."""
+    module = importlib.import_module(module_name)
+    return module if attr_name is None else getattr(module, attr_name)
+
+
+def lazy_module(package_name: str) -> tuple:
+    """Return the module level __getattr__ and __dir__ of a util_* subpackage, which import its
+    public names on first access.
+
+    Examples:
+        >>> __getattr__, __dir__ = lazy_module(__name__)  # at the end of util_xxx/__init__.py
+    """
+    package = sys.modules[package_name]
+    names = FUNC_INDEX[package_name.rsplit(".", 1)[-1]]
+
+    def __getattr__(name: str):
+        if name not in names:
+            raise AttributeError(f"module {package_name!r} has no attribute {name!r}")
+        value = resolve(*names[name])
+        # the next access does not go through __getattr__
+        setattr(package, name, value)
+        return value
+
+    def __dir__() -> list:
+        return sorted(set(package.__dict__) | set(names))
+
+    return __getattr__, __dir__
+
+
+if __name__ == "__main__":
+    num_names = sum(len(names) for names in write_func_index().values())
+    print(f"  :Info: FUNC_INDEX regenerated with {num_names} public names.")
+
+
+# ############### Generated by python -m pyufunc.pkg_func_index, do not edit ############### #
+FUNC_INDEX = {
+    'util_ai': {
+        'mean_absolute_error': ('pyufunc.util_ai._error_measurement', 'mean_absolute_error'),
+        'mean_squared_error': ('pyufunc.util_ai._error_measurement', 'mean_squared_error'),
+        'root_mean_squared_error': ('pyufunc.util_ai._error_measurement', 'root_mean_squared_error'),
+        'mean_squared_log_error': ('pyufunc.util_ai._error_measurement', 'mean_squared_log_error'),
+        'mean_absolute_percentage_error': ('pyufunc.util_ai._error_measurement', 'mean_absolute_percentage_error'),
+        'mean_percentage_error': ('pyufunc.util_ai._error_measurement', 'mean_percentage_error'),
+        'r2_score': ('pyufunc.util_ai._error_measurement', 'r2_score'),
+    },
+    'util_algorithm': {
+        'algo_quick_sort': ('pyufunc.util_algorithm._sort', 'algo_quick_sort'),
+        'algo_merge_sort': ('pyufunc.util_algorithm._sort', 'algo_merge_sort'),
+        'algo_heap_sort': ('pyufunc.util_algorithm._sort', 'algo_heap_sort'),
+        'algo_selection_sort': ('pyufunc.util_algorithm._sort', 'algo_selection_sort'),
+        'algo_insertion_sort': ('pyufunc.util_algorithm._sort', 'algo_insertion_sort'),
+        'algo_bubble_sort': ('pyufunc.util_algorithm._sort', 'algo_bubble_sort'),
+    },
+    'util_magic': {
+        'show_docstring_headers': ('pyufunc.util_magic._google_numpy_docstring', 'show_docstring_headers'),
+        'show_docstring_google': ('pyufunc.util_magic._google_numpy_docstring', 'show_docstring_google'),
+        'show_docstring_numpy': ('pyufunc.util_magic._google_numpy_docstring', 'show_docstring_numpy'),
+        'generate_password': ('pyufunc.util_magic._password_generator', 'generate_password'),
+        'import_package': ('pyufunc.util_magic._import_package', 'import_package'),
+        'is_module_importable': ('pyufunc.util_magic._import_package', 'is_module_importable'),
+        'get_user_defined_func': ('pyufunc.util_magic._import_package', 'get_user_defined_func'),
+        'get_user_defined_module': ('pyufunc.util_magic._import_package', 'get_user_defined_module'),
+        'get_user_imported_module': ('pyufunc.util_magic._import_package', 'get_user_imported_module'),
+        'is_user_defined_func': ('pyufunc.util_magic._import_package', 'is_user_defined_func'),
+        'requires': ('pyufunc.util_magic._dependency_requires_decorator', 'requires'),
+        'func_running_time': ('pyufunc.util_magic._func_time_decorator', 'func_running_time'),
+        'func_time': ('pyufunc.util_magic._func_time_decorator', 'func_time'),
+        'get_func_time_stats': ('pyufunc.util_magic._func_time_decorator', 'get_func_time_stats'),
+        'export_func_time_stats': ('pyufunc.util_magic._func_time_decorator', 'export_func_time_stats'),
+        'reset_func_time_stats': ('pyufunc.util_magic._func_time_decorator', 'reset_func_time_stats'),
+        'profile_func': ('pyufunc.util_magic._profiling', 'profile_func'),
+        'profile_block': ('pyufunc.util_magic._profiling', 'profile_block'),
+        'get_profile_stacks': ('pyufunc.util_magic._profiling', 'get_profile_stacks'),
+        'get_profile_pstats': ('pyufunc.util_magic._profiling', 'get_profile_pstats'),
+        'export_collapsed_stacks': ('pyufunc.util_magic._profiling', 'export_collapsed_stacks'),
+        'reset_profile_stats': ('pyufunc.util_magic._profiling', 'reset_profile_stats'),
+        'memoize': ('pyufunc.util_magic._memoize', 'memoize'),
+        'memoize_key': ('pyufunc.util_magic._memoize', 'memoize_key'),
+        'retry': ('pyufunc.util_magic._retry', 'retry'),
+        'RetryBudget': ('pyufunc.util_magic._retry', 'RetryBudget'),
+        'CircuitBreaker': ('pyufunc.util_magic._retry', 'CircuitBreaker'),
+        'CircuitOpenError': ('pyufunc.util_magic._retry', 'CircuitOpenError'),
+        'run_parallel': ('pyufunc.util_magic._run_parallel_decorator', 'run_parallel'),
+        'WorkerPool': ('pyufunc.util_magic._worker_pool', 'WorkerPool'),
+        'get_shared': ('pyufunc.util_magic._worker_pool', 'get_shared'),
+        'parallel_array_map': ('pyufunc.util_magic._parallel_array_map', 'parallel_array_map'),
+        'end_of_life': ('pyufunc.util_magic._end_of_life_decorator', 'end_of_life'),
+        'count_lines_of_code': ('pyufunc.util_magic._count_code_size', 'count_lines_of_code'),
+        'timeout': ('pyufunc.util_magic._time_out', 'timeout'),
+        'timeout_linux': ('pyufunc.util_magic._time_out', 'timeout_linux'),
+        'TimeoutExecutor': ('pyufunc.util_magic._timeout_executor', 'TimeoutExecutor'),
+        'timeout_process': ('pyufunc.util_magic._timeout_executor', 'timeout_process'),
+    },
+    'util_data_processing': {
+        'get_layer_boundary': ('pyufunc.util_data_processing._data_cleaning', 'get_layer_boundary'),
+        'dict_split_by_chunk': ('pyufunc.util_data_processing._dict', 'dict_split_by_chunk'),
+        'dict_delete_keys': ('pyufunc.util_data_processing._dict', 'dict_delete_keys'),
+        'cvt_int_to_alpha': ('pyufunc.util_data_processing._int_to_alpha', 'cvt_int_to_alpha'),
+        'list_split_by_equal_sublist': ('pyufunc.util_data_processing._list', 'list_split_by_equal_sublist'),
+        'list_split_by_fixed_length': ('pyufunc.util_data_processing._list', 'list_split_by_fixed_length'),
+        'list_flatten_nested': ('pyufunc.util_data_processing._list', 'list_flatten_nested'),
+        'is_float': ('pyufunc.util_data_processing._float', 'is_float'),
+        'str_strip': ('pyufunc.util_data_processing._str', 'str_strip'),
+        'cvt_digit_str_to_int': ('pyufunc.util_data_processing._str', 'cvt_digit_str_to_int'),
+        'cvt_digit_str_to_float': ('pyufunc.util_data_processing._str', 'cvt_digit_str_to_float'),
+        'create_dataclass': ('pyufunc.util_data_processing._dataclass', 'create_dataclass'),
+        'create_dataclass_from_dict': ('pyufunc.util_data_processing._dataclass', 'create_dataclass_from_dict'),
+        'merge_dataclass': ('pyufunc.util_data_processing._dataclass', 'merge_dataclass'),
+        'extend_dataclass': ('pyufunc.util_data_processing._dataclass', 'extend_dataclass'),
+        'dataclass_dict_wrapper': ('pyufunc.util_data_processing._dataclass', 'dataclass_dict_wrapper'),
+    },
+    'util_datetime': {
+        'fmt_dt_to_str': ('pyufunc.util_datetime._dt_format', 'fmt_dt_to_str'),
+        'fmt_str_to_dt': ('pyufunc.util_datetime._dt_format', 'fmt_str_to_dt'),
+        'list_all_timezones': ('pyufunc.util_datetime._dt_timezone', 'list_all_timezones'),
+        'get_timezone': ('pyufunc.util_datetime._dt_timezone', 'get_timezone'),
+        'cvt_current_dt_to_tz': ('pyufunc.util_datetime._dt_timezone', 'cvt_current_dt_to_tz'),
+        'get_time_diff_in_unit': ('pyufunc.util_datetime._dt_time_difference', 'get_time_diff_in_unit'),
+        'group_dt_yearly': ('pyufunc.util_datetime._dt_group', 'group_dt_yearly'),
+        'group_dt_monthly': ('pyufunc.util_datetime._dt_group', 'group_dt_monthly'),
+        'group_dt_weekly': ('pyufunc.util_datetime._dt_group', 'group_dt_weekly'),
+        'group_dt_daily': ('pyufunc.util_datetime._dt_group', 'group_dt_daily'),
+        'group_dt_hourly': ('pyufunc.util_datetime._dt_group', 'group_dt_hourly'),
+        'group_dt_minutely': ('pyufunc.util_datetime._dt_group', 'group_dt_minutely'),
+    },
+    'util_fullstack': {
+    },
+    'util_geo': {
+        'calc_area_from_wkt_geometry': ('pyufunc.util_geo._geo_area', 'calc_area_from_wkt_geometry'),
+        'create_circle_at_point_with_radius': ('pyufunc.util_geo._geo_circle', 'create_circle_at_point_with_radius'),
+        'proj_point_to_line': ('pyufunc.util_geo._geo_distance', 'proj_point_to_line'),
+        'calc_distance_on_unit_sphere': ('pyufunc.util_geo._geo_distance', 'calc_distance_on_unit_sphere'),
+        'calc_distance_on_unit_haversine': ('pyufunc.util_geo._geo_distance', 'calc_distance_on_unit_haversine'),
+        'find_closest_point': ('pyufunc.util_geo._geo_distance', 'find_closest_point'),
+        'get_coordinates_from_geom': ('pyufunc.util_geo._geo_distance', 'get_coordinates_from_geom'),
+        'find_k_nearest_points': ('pyufunc.util_geo._geo_distance', 'find_k_nearest_points'),
+        'gmns_geo': ('pyufunc.util_geo._gmns', None),
+        'GMNSNode': ('pyufunc.util_geo._gmns', 'Node'),
+        'GMNSLink': ('pyufunc.util_geo._gmns', 'Link'),
+        'GMNSPOI': ('pyufunc.util_geo._gmns', 'POI'),
+        'GMNSZone': ('pyufunc.util_geo._gmns', 'Zone'),
+        'GMNSAgent': ('pyufunc.util_geo._gmns', 'Agent'),
+        'gmns_read_node': ('pyufunc.util_geo._gmns', 'read_node'),
+        'gmns_read_poi': ('pyufunc.util_geo._gmns', 'read_poi'),
+        'gmns_read_link': ('pyufunc.util_geo._gmns', 'read_link'),
+        'gmns_read_zone': ('pyufunc.util_geo._gmns', 'read_zone'),
+        'cvt_wgs84_to_baidu09': ('pyufunc.util_geo._coordinate_convert', 'cvt_wgs84_to_baidu09'),
+        'cvt_wgs84_to_gcj02': ('pyufunc.util_geo._coordinate_convert', 'cvt_wgs84_to_gcj02'),
+        'cvt_gcj02_to_baidu09': ('pyufunc.util_geo._coordinate_convert', 'cvt_gcj02_to_baidu09'),
+        'cvt_gcj02_to_wgs84': ('pyufunc.util_geo._coordinate_convert', 'cvt_gcj02_to_wgs84'),
+        'cvt_baidu09_to_wgs84': ('pyufunc.util_geo._coordinate_convert', 'cvt_baidu09_to_wgs84'),
+        'cvt_baidu09_to_gcj02': ('pyufunc.util_geo._coordinate_convert', 'cvt_baidu09_to_gcj02'),
+        'get_osm_place': ('pyufunc.util_geo._get_osm_place', 'get_osm_place'),
+        'download_elevation_tif_by': ('pyufunc.util_geo._geo_tif', 'download_elevation_tif_by'),
+    },
+    'util_git_pypi': {
+        'github_file_downloader': ('pyufunc.util_git_pypi._github', 'github_file_downloader'),
+        'pypi_downloads': ('pyufunc.util_git_pypi._pypi', 'pypi_downloads'),
+        'pypi_downloads_bulk': ('pyufunc.util_git_pypi._pypi', 'pypi_downloads_bulk'),
+        'github_get_status': ('pyufunc.util_git_pypi._github', 'github_get_status'),
+    },
+    'util_gui': {
+    },
+    'util_img': {
+        'img_to_bytes': ('pyufunc.util_img._img_cvt', 'img_to_bytes'),
+        'img_PIL_to_bytes': ('pyufunc.util_img._img_cvt', 'img_PIL_to_bytes'),
+        'img_CV_to_bytes': ('pyufunc.util_img._img_cvt', 'img_CV_to_bytes'),
+        'img_bytes_to_PIL': ('pyufunc.util_img._img_cvt', 'img_bytes_to_PIL'),
+        'img_bytes_to_CV': ('pyufunc.util_img._img_cvt', 'img_bytes_to_CV'),
+        'is_PIL_img': ('pyufunc.util_img._img_operate', 'is_PIL_img'),
+        'is_CV_img': ('pyufunc.util_img._img_operate', 'is_CV_img'),
+        'img_PIL_to_CV': ('pyufunc.util_img._img_operate', 'img_PIL_to_CV'),
+        'img_CV_to_PIL': ('pyufunc.util_img._img_operate', 'img_CV_to_PIL'),
+        'img_translate': ('pyufunc.util_img._img_operate', 'img_translate'),
+        'img_rotate': ('pyufunc.util_img._img_operate', 'img_rotate'),
+        'img_rotate_bound': ('pyufunc.util_img._img_operate', 'img_rotate_bound'),
+        'img_resize': ('pyufunc.util_img._img_operate', 'img_resize'),
+        'img_show': ('pyufunc.util_img._img_operate', 'img_show'),
+    },
+    'util_log': {
+        'add_date_in_filename': ('pyufunc.util_log._log_dir', 'add_date_in_filename'),
+        'generate_dir_with_date': ('pyufunc.util_log._log_dir', 'generate_dir_with_date'),
+        'log_writer': ('pyufunc.util_log._log_writer', 'log_writer'),
+        'log_logger': ('pyufunc.util_log._log_loguru', 'log_logger'),
+    },
+    'util_network': {
+        'get_host_ip': ('pyufunc.util_network._network', 'get_host_ip'),
+        'validate_url': ('pyufunc.util_network._network', 'validate_url'),
+        'get_host_name': ('pyufunc.util_network._network', 'get_host_name'),
+    },
+    'util_office': {
+        'is_valid_email': ('pyufunc.util_office._email', 'is_valid_email'),
+        'send_email': ('pyufunc.util_office._email', 'send_email'),
+        'printer_file': ('pyufunc.util_office._printer', 'printer_file'),
+    },
+    'util_optimization': {
+    },
+    'util_pathio': {
+        'with_argparse': ('pyufunc.util_pathio._argparse', 'with_argparse'),
+        'get_file_size': ('pyufunc.util_pathio._io', 'get_file_size'),
+        'get_dir_size': ('pyufunc.util_pathio._io', 'get_dir_size'),
+        'create_tempfile': ('pyufunc.util_pathio._io', 'create_tempfile'),
+        'remove_file': ('pyufunc.util_pathio._io', 'remove_file'),
+        'add_dir_to_env': ('pyufunc.util_pathio._io', 'add_dir_to_env'),
+        'pickle_save': ('pyufunc.util_pathio._io', 'pickle_save'),
+        'pickle_load': ('pyufunc.util_pathio._io', 'pickle_load'),
+        'find_duplicate_files': ('pyufunc.util_pathio._io', 'find_duplicate_files'),
+        'remove_duplicate_files': ('pyufunc.util_pathio._io', 'remove_duplicate_files'),
+        'path2linux': ('pyufunc.util_pathio._path', 'path2linux'),
+        'path2uniform': ('pyufunc.util_pathio._path', 'path2uniform'),
+        'get_filenames_by_ext': ('pyufunc.util_pathio._path', 'get_filenames_by_ext'),
+        'get_files_by_ext': ('pyufunc.util_pathio._path', 'get_files_by_ext'),
+        'check_files_in_dir': ('pyufunc.util_pathio._path', 'check_files_in_dir'),
+        'check_filename': ('pyufunc.util_pathio._path', 'check_filename'),
+        'check_file_existence': ('pyufunc.util_pathio._path', 'check_file_existence'),
+        'generate_unique_filename': ('pyufunc.util_pathio._path', 'generate_unique_filename'),
+        'create_unique_filename': ('pyufunc.util_pathio._path', 'create_unique_filename'),
+        'show_dir_in_tree': ('pyufunc.util_pathio._path', 'show_dir_in_tree'),
+        'add_pkg_to_sys_path': ('pyufunc.util_pathio._path', 'add_pkg_to_sys_path'),
+        'find_executable_from_PATH_on_win': ('pyufunc.util_pathio._path', 'find_executable_from_PATH_on_win'),
+        'find_fn_from_PATH_on_win': ('pyufunc.util_pathio._path', 'find_fn_from_PATH_on_win'),
+        'walk_dir': ('pyufunc.util_pathio._walk', 'walk_dir'),
+        'DirIndex': ('pyufunc.util_pathio._dir_index', 'DirIndex'),
+        'save_arrays': ('pyufunc.util_pathio._array_store', 'save_arrays'),
+        'load_arrays': ('pyufunc.util_pathio._array_store', 'load_arrays'),
+        'read_many': ('pyufunc.util_pathio._bulk_io', 'read_many'),
+        'write_many': ('pyufunc.util_pathio._bulk_io', 'write_many'),
+        'check_platform': ('pyufunc.util_pathio._platform', 'check_platform'),
+        'is_windows': ('pyufunc.util_pathio._platform', 'is_windows'),
+        'is_linux': ('pyufunc.util_pathio._platform', 'is_linux'),
+        'is_mac': ('pyufunc.util_pathio._platform', 'is_mac'),
+        'get_terminal_width': ('pyufunc.util_pathio._platform', 'get_terminal_width'),
+        'get_terminal_height': ('pyufunc.util_pathio._platform', 'get_terminal_height'),
+    },
+    'util_test': {
+        'pytest_show_naming_convention': ('pyufunc.util_test._pytest', 'pytest_show_naming_convention'),
+        'pytest_show_assert': ('pyufunc.util_test._pytest', 'pytest_show_assert'),
+        'pytest_show_raise': ('pyufunc.util_test._pytest', 'pytest_show_raise'),
+        'pytest_show_warning': ('pyufunc.util_test._pytest', 'pytest_show_warning'),
+        'pytest_show_fixture': ('pyufunc.util_test._pytest', 'pytest_show_fixture'),
+        'pytest_show_parametrize': ('pyufunc.util_test._pytest', 'pytest_show_parametrize'),
+        'pytest_show_database': ('pyufunc.util_test._pytest', 'pytest_show_database'),
+        'pytest_show_skip_xfail': ('pyufunc.util_test._pytest', 'pytest_show_skip_xfail'),
+    },
+    'util_vis': {
+    },
+}
@@ -5,14 +5,19 @@
 # Author/Copyright: Mr. Xiangyong Luo
 ##############################################################
 
-from ._error_measurement import (mean_absolute_error,
-                                 mean_squared_error,
-                                 root_mean_squared_error,
-                                 mean_squared_log_error,
-                                 mean_absolute_percentage_error,
-                                 mean_percentage_error,
-                                 r2_score,
-                                 )
+from typing import TYPE_CHECKING
+from pyufunc.pkg_func_index import lazy_module
+
+# the public names are imported on first access, see pyufunc.pkg_func_index
+if TYPE_CHECKING:
+    from ._error_measurement import (mean_absolute_error,
+                                     mean_squared_error,
+                                     root_mean_squared_error,
+                                     mean_squared_log_error,
+                                     mean_absolute_percentage_error,
+                                     mean_percentage_error,
+                                     r2_score,
+                                     )
 
 __all__ = [
     # error measure
@@ -23,4 +28,6 @@ __all__ = [
     "mean_absolute_percentage_error",
     "mean_percentage_error",
     "r2_score",
-]
\ No newline at end of file
+]
+
+__getattr__, __dir__ = lazy_module(__name__)
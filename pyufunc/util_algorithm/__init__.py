@@ -5,15 +5,20 @@
 # Author/Copyright: Mr. Xiangyong Luo
 ##############################################################
 
-from ._sort import (
-    algo_quick_sort,
-    algo_merge_sort,
-    algo_heap_sort,
-    algo_selection_sort,
-    algo_insertion_sort,
-    algo_bubble_sort,
+from typing import TYPE_CHECKING
+from pyufunc.pkg_func_index import lazy_module
 
-)
+# the public names are imported on first access, see pyufunc.pkg_func_index
+if TYPE_CHECKING:
+    from ._sort import (
+        algo_quick_sort,
+        algo_merge_sort,
+        algo_heap_sort,
+        algo_selection_sort,
+        algo_insertion_sort,
+        algo_bubble_sort,
+
+    )
 
 __all__ = [
     # _sort.py
@@ -24,3 +29,5 @@ __all__ = [
     "algo_insertion_sort",
     "algo_bubble_sort",
 ]
+
+__getattr__, __dir__ = lazy_module(__name__)
@@ -5,22 +5,27 @@
 # Author/Copyright: Mr. Xiangyong Luo
 ##############################################################
 
-from ._dict import (dict_split_by_chunk,
-                    dict_delete_keys)
-from ._list import (list_split_by_equal_sublist,
-                    list_split_by_fixed_length,
-                    list_flatten_nested)
-from ._str import (str_strip,
-                   cvt_digit_str_to_int,
-                   cvt_digit_str_to_float)
-from ._dataclass import (create_dataclass,
-                         create_dataclass_from_dict,
-                         merge_dataclass,
-                         extend_dataclass,
-                         dataclass_dict_wrapper)
-from ._float import is_float
-from ._data_cleaning import get_layer_boundary
-from ._int_to_alpha import cvt_int_to_alpha
+from typing import TYPE_CHECKING
+from pyufunc.pkg_func_index import lazy_module
+
+# the public names are imported on first access, see pyufunc.pkg_func_index
+if TYPE_CHECKING:
+    from ._dict import (dict_split_by_chunk,
+                        dict_delete_keys)
+    from ._list import (list_split_by_equal_sublist,
+                        list_split_by_fixed_length,
+                        list_flatten_nested)
+    from ._str import (str_strip,
+                       cvt_digit_str_to_int,
+                       cvt_digit_str_to_float)
+    from ._dataclass import (create_dataclass,
+                             create_dataclass_from_dict,
+                             merge_dataclass,
+                             extend_dataclass,
+                             dataclass_dict_wrapper)
+    from ._float import is_float
+    from ._data_cleaning import get_layer_boundary
+    from ._int_to_alpha import cvt_int_to_alpha
 
 
 __all__ = [
@@ -56,3 +61,5 @@ __all__ = [
     "extend_dataclass",
     "dataclass_dict_wrapper",
 ]
+
+__getattr__, __dir__ = lazy_module(__name__)
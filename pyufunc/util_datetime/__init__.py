@@ -5,18 +5,23 @@
 # Author/Copyright: Mr. Xiangyong Luo
 ##############################################################
 
-from ._dt_format import (fmt_dt_to_str,
-                         fmt_str_to_dt)
-from ._dt_timezone import (list_all_timezones,
-                           get_timezone,
-                           cvt_current_dt_to_tz)
-from ._dt_time_difference import get_time_diff_in_unit
-from ._dt_group import (group_dt_yearly,
-                        group_dt_monthly,
-                        group_dt_weekly,
-                        group_dt_daily,
-                        group_dt_hourly,
-                        group_dt_minutely)
+from typing import TYPE_CHECKING
+from pyufunc.pkg_func_index import lazy_module
+
+# the public names are imported on first access, see pyufunc.pkg_func_index
+if TYPE_CHECKING:
+    from ._dt_format import (fmt_dt_to_str,
+                             fmt_str_to_dt)
+    from ._dt_timezone import (list_all_timezones,
+                               get_timezone,
+                               cvt_current_dt_to_tz)
+    from ._dt_time_difference import get_time_diff_in_unit
+    from ._dt_group import (group_dt_yearly,
+                            group_dt_monthly,
+                            group_dt_weekly,
+                            group_dt_daily,
+                            group_dt_hourly,
+                            group_dt_minutely)
 
 __all__ = [
     # _dt_format
@@ -39,3 +44,5 @@ __all__ = [
     "group_dt_hourly",
     "group_dt_minutely"
 ]
+
+__getattr__, __dir__ = lazy_module(__name__)
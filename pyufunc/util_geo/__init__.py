@@ -6,38 +6,43 @@
 ##############################################################
 
 
-from pyufunc.util_geo._geo_distance import (proj_point_to_line,
-                                            calc_distance_on_unit_sphere,
-                                            calc_distance_on_unit_haversine,
-                                            find_closest_point,
-                                            get_coordinates_from_geom,
-                                            find_k_nearest_points,
-                                            )
-from pyufunc.util_geo._coordinate_convert import (
-    cvt_wgs84_to_baidu09,
-    cvt_wgs84_to_gcj02,
-    cvt_gcj02_to_baidu09,
-    cvt_gcj02_to_wgs84,
-    cvt_baidu09_to_wgs84,
-    cvt_baidu09_to_gcj02,
-)
-from pyufunc.util_geo._geo_circle import create_circle_at_point_with_radius
+from typing import TYPE_CHECKING
+from pyufunc.pkg_func_index import lazy_module
 
-from pyufunc.util_geo._geo_area import calc_area_from_wkt_geometry
-from pyufunc.util_geo._geo_tif import download_elevation_tif_by
+# the public names are imported on first access, see pyufunc.pkg_func_index
+if TYPE_CHECKING:
+    from pyufunc.util_geo._geo_distance import (proj_point_to_line,
+                                                calc_distance_on_unit_sphere,
+                                                calc_distance_on_unit_haversine,
+                                                find_closest_point,
+                                                get_coordinates_from_geom,
+                                                find_k_nearest_points,
+                                                )
+    from pyufunc.util_geo._coordinate_convert import (
+        cvt_wgs84_to_baidu09,
+        cvt_wgs84_to_gcj02,
+        cvt_gcj02_to_baidu09,
+        cvt_gcj02_to_wgs84,
+        cvt_baidu09_to_wgs84,
+        cvt_baidu09_to_gcj02,
+    )
+    from pyufunc.util_geo._geo_circle import create_circle_at_point_with_radius
 
-# GMNS: General Modeling Network Specification
-import pyufunc.util_geo._gmns as gmns_geo
-from pyufunc.util_geo._gmns import Node as GMNSNode
-from pyufunc.util_geo._gmns import Link as GMNSLink
-from pyufunc.util_geo._gmns import POI as GMNSPOI
-from pyufunc.util_geo._gmns import Zone as GMNSZone
-from pyufunc.util_geo._gmns import Agent as GMNSAgent
-from pyufunc.util_geo._gmns import read_node as gmns_read_node
-from pyufunc.util_geo._gmns import read_poi as gmns_read_poi
-from pyufunc.util_geo._gmns import read_link as gmns_read_link
-from pyufunc.util_geo._gmns import read_zone as gmns_read_zone
-from pyufunc.util_geo._get_osm_place import get_osm_place
+    from pyufunc.util_geo._geo_area import calc_area_from_wkt_geometry
+    from pyufunc.util_geo._geo_tif import download_elevation_tif_by
+
+    # GMNS: General Modeling Network Specification
+    import pyufunc.util_geo._gmns as gmns_geo
+    from pyufunc.util_geo._gmns import Node as GMNSNode
+    from pyufunc.util_geo._gmns import Link as GMNSLink
+    from pyufunc.util_geo._gmns import POI as GMNSPOI
+    from pyufunc.util_geo._gmns import Zone as GMNSZone
+    from pyufunc.util_geo._gmns import Agent as GMNSAgent
+    from pyufunc.util_geo._gmns import read_node as gmns_read_node
+    from pyufunc.util_geo._gmns import read_poi as gmns_read_poi
+    from pyufunc.util_geo._gmns import read_link as gmns_read_link
+    from pyufunc.util_geo._gmns import read_zone as gmns_read_zone
+    from pyufunc.util_geo._get_osm_place import get_osm_place
 
 __all__ = [
     # geo_area
@@ -82,4 +87,6 @@ __all__ = [
     # geo_tif
     "download_elevation_tif_by",
 
-]
\ No newline at end of file
+]
+
+__getattr__, __dir__ = lazy_module(__name__)
@@ -17,12 +17,16 @@ import time
 import importlib
 from pyufunc.util_magic._dependency_requires_decorator import requires
 from pyufunc.util_magic._import_package import import_package
+from pyufunc.util_magic._retry import retry, CircuitBreaker
 from typing import Any, TYPE_CHECKING
 
 if TYPE_CHECKING:
     import shapely
     import requests
 
+# shared by all OSMPlaceFinder instances, the requests fail fast while the API keeps failing
+_NOMINATIM_BREAKER = CircuitBreaker(failure_threshold=5, recovery_timeout=60, name="Nominatim API")
+
 # capture getaddrinfo function to use original later after mutating it
 _original_getaddrinfo = socket.getaddrinfo
 
@@ -122,7 +126,8 @@ class OSMPlaceFinder:
                            *,
                            request_type: str = "search",
                            pause: float = 1,
-                           error_pause: float = 60) -> list[dict[str, Any]]:
+                           error_pause: float = 60,
+                           max_attempts: int = 5) -> list[dict[str, Any]]:
         """
         Send a HTTP GET request to the Nominatim API and return response.
 
@@ -137,7 +142,10 @@ class OSMPlaceFinder:
             How long to pause before request, in seconds. Per the Nominatim usage
             policy: "an absolute maximum of 1 request per second" is allowed.
         error_pause
-            How long to pause in seconds before re-trying request if error.
+            The maximum pause in seconds before re-trying request if error,
+            the pauses grow exponentially with random jitter up to error_pause.
+        max_attempts
+            The attempts of the request, including the first one.
 
         Returns
         -------
@@ -158,41 +166,40 @@ class OSMPlaceFinder:
         if isinstance(cached_response_json, list):
             return cached_response_json
 
-        # pause then request this URL
         domain = self._hostname_from_url(url)
-        msg = f"Pausing {pause} second(s) before making HTTP GET request to {domain!r}"
-        if self.verbose:
-            print(f"  :{msg}")
-        time.sleep(pause)
 
-        # transmit the HTTP GET request
-        msg = f"Get {prepared_url} with timeout={settings['requests_timeout']}"
-        if self.verbose:
-            print(f"  :{msg}")
-        response = requests.get(
-            url,
-            params=params,
-            timeout=settings["requests_timeout"],
-            headers=self._get_http_headers(),
-            **settings["requests_kwargs"],
-        )
-
-        # handle 429 and 504 errors by pausing then recursively re-trying request
-        if response.status_code in {429, 504}:  # pragma: no cover
-            msg = (
-                f"{domain!r} responded {response.status_code} {response.reason}: "
-                f"we'll retry in {error_pause} secs"
-            )
+        def _get_with_pause() -> requests.Response:
+            # pause before every attempt to respect the rate limit of the API
+            msg = f"Pausing {pause} second(s) before making HTTP GET request to {domain!r}"
             if self.verbose:
                 print(f"  :{msg}")
-            time.sleep(error_pause)
-            return self._nominatim_request(
-                params,
-                request_type=request_type,
-                pause=pause,
-                error_pause=error_pause,
+            time.sleep(pause)
+
+            # transmit the HTTP GET request
+            msg = f"Get {prepared_url} with timeout={settings['requests_timeout']}"
+            if self.verbose:
+                print(f"  :{msg}")
+            return requests.get(
+                url,
+                params=params,
+                timeout=settings["requests_timeout"],
+                headers=self._get_http_headers(),
+                **settings["requests_kwargs"],
             )
 
+        # retry the 429 and 504 errors and the connection errors with exponential backoff,
+        # and fail fast while the API keeps failing
+        response = retry(
+            _get_with_pause,
+            max_attempts=max_attempts,
+            exceptions=(requests.ConnectionError, requests.Timeout),
+            retry_on_result=lambda resp: resp.status_code in {429, 504},
+            base_delay=min(5, error_pause),
+            max_delay=error_pause,
+            circuit_breaker=_NOMINATIM_BREAKER,
+            verbose=self.verbose,
+        )()
+
         response_json = self._parse_response(response)
         if not isinstance(response_json, list):
             msg = "Nominatim API did not return a list of results."
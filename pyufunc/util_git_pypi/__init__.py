@@ -1,5 +1,12 @@
 
-from ._github import github_file_downloader, github_get_status
-from ._pypi import pypi_downloads
+from typing import TYPE_CHECKING
+from pyufunc.pkg_func_index import lazy_module
 
-__all__ = ["github_file_downloader", "pypi_downloads", "github_get_status"]
\ No newline at end of file
+# the public names are imported on first access, see pyufunc.pkg_func_index
+if TYPE_CHECKING:
+    from ._github import github_file_downloader, github_get_status
+    from ._pypi import pypi_downloads, pypi_downloads_bulk
+
+__all__ = ["github_file_downloader", "pypi_downloads", "pypi_downloads_bulk", "github_get_status"]
+
+__getattr__, __dir__ = lazy_module(__name__)
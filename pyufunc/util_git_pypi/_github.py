@@ -8,6 +8,7 @@ from __future__ import annotations
 import contextlib
 import re
 import os
+import urllib.error
 import urllib.request
 import json
 import sys
@@ -20,6 +21,7 @@ import shutil
 from pathlib import Path
 from typing import TYPE_CHECKING
 from pyufunc.util_magic import requires, import_package
+from pyufunc.util_magic._retry import retry, CircuitBreaker
 
 path_user_agent_strings = Path(__file__).parent.joinpath("static/user-agent-strings.json")
 
@@ -33,6 +35,22 @@ if TYPE_CHECKING:
     from requests import Session
     import urllib3
 
+# shared by all downloads, stop hitting GitHub while it keeps failing, e.g. when rate limited
+_GITHUB_BREAKER = CircuitBreaker(failure_threshold=5, recovery_timeout=60, name="GitHub")
+
+
+def _is_transient_url_error(error: Exception) -> bool:
+    """The connection errors, 429 and 5xx responses are retried, the other responses are not."""
+    code = getattr(error, "code", None)
+    return not isinstance(code, int) or code == 429 or code >= 500
+
+
+@retry(max_attempts=4, exceptions=(urllib.error.URLError, ConnectionError, TimeoutError),
+       retry_on_exception=_is_transient_url_error, base_delay=1, max_delay=30, circuit_breaker=_GITHUB_BREAKER)
+def _urlretrieve(url: str, filename: str | None = None) -> tuple:
+    """urllib.request.urlretrieve with exponential backoff."""
+    return urllib.request.urlretrieve(url, filename)
+
 
 class _FakeUserAgentParser(html.parser.HTMLParser):
 
@@ -481,7 +499,7 @@ class GitHubFileDownloader:
 
     def download_single_file(self, file_url: str, dir_out: str):
         # Download the file
-        _, _ = urllib.request.urlretrieve(file_url, dir_out)
+        _, _ = _urlretrieve(file_url, dir_out)
 
         if self.flatten:
             if self.output_dir == "./":
@@ -510,7 +528,7 @@ class GitHubFileDownloader:
 
         # Get response from GutHub response
         try:
-            response = urllib.request.urlretrieve(api_url_local)
+            response = _urlretrieve(api_url_local)
         except KeyboardInterrupt:
             print(
                 "Can not get response from GitHub API, please check the url again or try later.")
@@ -4,11 +4,88 @@
 # Contact Info: luoxiangyong01@gmail.com
 # Author/Copyright: Mr. Xiangyong Luo
 ##############################################################
-
+from __future__ import annotations
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, TYPE_CHECKING
 from pyufunc.util_magic import requires
+from pyufunc.util_magic._retry import retry, RetryBudget, CircuitBreaker
+
+if TYPE_CHECKING:
+    from requests import Session
+
+# the pepy.tech page of a package, formatted with the package name
+_PYPI_DOWNLOADS_URL = "https://www.pepy.tech/projects/{pkg_name}"
+
+# the text node of the label, e.g. >Total downloads<
+_RE_DOWNLOADS_LABEL = re.compile(r">([^<>]*Total downloads[^<>]*)<")
+
+# the first number inside the next <div> after the label, nested tags are skipped
+_RE_DOWNLOADS_VALUE = re.compile(r"<div\b[^>]*>(?:\s|<[^>]*>)*([0-9][0-9,]*(?:\.[0-9]+)?)")
+
+# cached results: {(url, pkg_name): (timestamp, result)}
+_PYPI_DOWNLOADS_CACHE = {}
+_PYPI_DOWNLOADS_CACHE_LOCK = threading.Lock()
+
+# shared by pypi_downloads and pypi_downloads_bulk, a bulk call to a failing site
+# neither multiplies its load by the retries nor waits for every request to time out
+_PYPI_RETRY_BUDGET = RetryBudget(ratio=0.2, capacity=10)
+_PYPI_BREAKER = CircuitBreaker(failure_threshold=5, recovery_timeout=60, name="pepy.tech")
+
+
+def _extract_total_downloads(html_str: str) -> dict:
+    """Extract the total downloads from the html content of the pepy.tech page.
+
+    Only the label text and the next <div> are scanned, the html is not parsed into a tree.
+
+    Args:
+        html_str (str): the html content.
+
+    Returns:
+        dict: {label: downloads}, empty if the label is not found.
+    """
+
+    downloads_dict = {}
+    for label_match in _RE_DOWNLOADS_LABEL.finditer(html_str):
+        value_match = _RE_DOWNLOADS_VALUE.search(html_str, label_match.end())
+        if value_match:
+            downloads_dict[label_match.group(1).strip()] = float(value_match.group(1).replace(",", ""))
+    return downloads_dict
+
+
+def _is_transient_http_error(error: Exception) -> bool:
+    """The connection errors, 429 and 5xx responses are retried, the other responses are not."""
+    response = getattr(error, "response", None)
+    return response is None or response.status_code == 429 or response.status_code >= 500
+
+
+# requests.RequestException is a subclass of OSError
+@retry(max_attempts=3, exceptions=(OSError,), retry_on_exception=_is_transient_http_error,
+       base_delay=1, max_delay=10, budget=_PYPI_RETRY_BUDGET, circuit_breaker=_PYPI_BREAKER)
+def _get_page_text(session: Session, page_url: str, timeout: float) -> str:
+    response = session.get(page_url, timeout=timeout)
+    response.raise_for_status()
+    return response.text
+
+
+def _fetch_pypi_downloads(pkg_name: str, session: Session, url: str, timeout: float) -> dict:
+    """Request the package page and return {pkg_name: downloads_dict} or {pkg_name: 0}."""
+
+    try:
+        downloads_dict = _extract_total_downloads(_get_page_text(session, url.format(pkg_name=pkg_name), timeout))
+    except Exception:
+        downloads_dict = {}
 
+    # if the package is not found, return 0
+    if not downloads_dict:
+        print(f"Error: {pkg_name} not found. returning 0 instead.")
+        return {pkg_name: 0}
+    return {pkg_name: downloads_dict}
 
-@requires("requests", "bs4")
+
+@requires("requests")
 def pypi_downloads(pkg_name: str) -> dict:
     """Get the total downloads of a package from PyPI.
 
@@ -18,6 +95,9 @@ def pypi_downloads(pkg_name: str) -> dict:
     Returns:
         dict: A dictionary containing the total downloads of the package.
 
+    See Also:
+        pypi_downloads_bulk: get the total downloads of many packages concurrently.
+
     Examples:
         >>> pypi_downloads("pandas")  # package is found
         {'pandas': {'Total downloads': 4051345849.0}}
@@ -28,36 +108,99 @@ def pypi_downloads(pkg_name: str) -> dict:
 
     # import packages required for this function
     import requests
-    from bs4 import BeautifulSoup
 
     # prepare the url and get the response
-    # url = 'https://api.pepy.tech/api/projects/' + package_name
-    url = f"https://www.pepy.tech/projects/{pkg_name}"
+    url = _PYPI_DOWNLOADS_URL.format(pkg_name=pkg_name)
     print(f"..Getting data from {url}")
 
-    try:
-        # get data from url
-        response = requests.get(url)
+    with requests.Session() as session:
+        return _fetch_pypi_downloads(pkg_name, session, _PYPI_DOWNLOADS_URL, timeout=30)
 
-        # convert the response to a dictionary
-        # content_dict = json.loads(response.content.decode("utf-8"))
-        web_content = BeautifulSoup(response.content, "html.parser")
-        total_downloads_str_list = web_content.find_all(string=lambda t: "Total downloads" in t.text)
 
-        # if the package is not found, return 0
-        if len(total_downloads_str_list) == 0:
-            print(f"Error: {pkg_name} not found. returning 0 instead.")
-            return {pkg_name: 0}
+@requires("requests")
+def pypi_downloads_bulk(pkg_names: Iterable[str],
+                        *,
+                        max_workers: int = 8,
+                        cache_ttl: float = 3600,
+                        timeout: float = 30,
+                        url: str = _PYPI_DOWNLOADS_URL,
+                        verbose: bool = True) -> dict:
+    """Get the total downloads of many packages from PyPI concurrently.
 
-        # get the total downloads and save it to a dictionary
-        downloads_dict = {}
-        for total_downloads_str in total_downloads_str_list:
-            download_str = web_content.find(string=total_downloads_str).parent.find_next("div").text
-            download_float = float(download_str.replace(",", ""))
-            downloads_dict[total_downloads_str] = download_float
+    All requests share one pooled ``requests.Session`` and the pages are scanned by a
+    targeted extractor instead of a full html parse. Results are cached in memory for
+    ``cache_ttl`` seconds, so repeated calls for the same packages return immediately.
 
-        # return the dictionary containing the total downloads of the package
-        return {pkg_name: downloads_dict}
-    except Exception:
-        print(f"Error: {pkg_name} not found. returning 0 instead.")
-        return {pkg_name: 0}
+    Args:
+        pkg_names (Iterable[str]): the names of the packages.
+        max_workers (int, optional): the number of concurrent requests. Defaults to 8.
+        cache_ttl (float, optional): seconds to keep a result in cache, 0 to disable. Defaults to 3600.
+        timeout (float, optional): timeout in seconds for each request. Defaults to 30.
+        url (str, optional): the url template with a ``{pkg_name}`` placeholder.
+            Defaults to "https://www.pepy.tech/projects/{pkg_name}".
+        verbose (bool, optional): print the processing message. Defaults to True.
+
+    Raises:
+        TypeError: if pkg_names is a string or not an Iterable.
+        ValueError: if max_workers is not greater than 0.
+
+    Returns:
+        dict: {pkg_name: {'Total downloads': float}}, 0 for packages not found.
+
+    Examples:
+        >>> from pyufunc import pypi_downloads_bulk
+        >>> pypi_downloads_bulk(["pandas", "numpy", "pandas123"])
+        {'pandas': {'Total downloads': 4051345849.0},
+         'numpy': {'Total downloads': 5436781234.0},
+         'pandas123': 0}
+    """
+
+    import requests
+
+    # TDD, test-driven development: check inputs
+    if isinstance(pkg_names, str) or not isinstance(pkg_names, Iterable):
+        raise TypeError("The input pkg_names should be an Iterable of package names.")
+    if not isinstance(max_workers, int) or max_workers <= 0:
+        raise ValueError("The input max_workers should be an integer greater than 0.")
+
+    # keep the input order and remove duplicates
+    pkg_names = list(dict.fromkeys(pkg_names))
+
+    # Step 1: get results from cache
+    results = {}
+    now_ts = time.time()
+    with _PYPI_DOWNLOADS_CACHE_LOCK:
+        for pkg_name in pkg_names:
+            cached = _PYPI_DOWNLOADS_CACHE.get((url, pkg_name))
+            if cached and now_ts - cached[0] < cache_ttl:
+                results[pkg_name] = cached[1]
+
+    pkg_to_fetch = [pkg_name for pkg_name in pkg_names if pkg_name not in results]
+    if verbose:
+        print(f"  :Info: {len(results)} package(s) from cache, "
+              f"{len(pkg_to_fetch)} package(s) from {url.format(pkg_name='')}")
+
+    # Step 2: fetch the rest concurrently over a pooled session
+    if pkg_to_fetch:
+        with requests.Session() as session:
+            adapter = requests.adapters.HTTPAdapter(pool_connections=max_workers, pool_maxsize=max_workers)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(pkg_to_fetch))) as executor:
+                fetched = executor.map(lambda pkg: _fetch_pypi_downloads(pkg, session, url, timeout),
+                                       pkg_to_fetch)
+                fetched = dict(item for res in fetched for item in res.items())
+
+        # only successful results are cached
+        now_ts = time.time()
+        with _PYPI_DOWNLOADS_CACHE_LOCK:
+            # remove the expired results, the cache does not grow over many package names
+            for key in [key for key, (ts, _) in _PYPI_DOWNLOADS_CACHE.items() if now_ts - ts >= cache_ttl]:
+                del _PYPI_DOWNLOADS_CACHE[key]
+            for pkg_name, res in fetched.items():
+                if res and cache_ttl > 0:
+                    _PYPI_DOWNLOADS_CACHE[(url, pkg_name)] = (now_ts, res)
+        results.update(fetched)
+
+    return {pkg_name: results[pkg_name] for pkg_name in pkg_names}
@@ -5,25 +5,30 @@
 # Author/Copyright: Mr. Xiangyong Luo
 ##############################################################
 
-from ._img_cvt import (
-    img_to_bytes,
-    img_PIL_to_bytes,
-    img_CV_to_bytes,
-    img_bytes_to_PIL,
-    img_bytes_to_CV
-)
+from typing import TYPE_CHECKING
+from pyufunc.pkg_func_index import lazy_module
 
-from ._img_operate import (
-    is_PIL_img,
-    is_CV_img,
-    img_PIL_to_CV,
-    img_CV_to_PIL,
-    img_translate,
-    img_rotate,
-    img_rotate_bound,
-    img_resize,
-    img_show
-)
+# the public names are imported on first access, see pyufunc.pkg_func_index
+if TYPE_CHECKING:
+    from ._img_cvt import (
+        img_to_bytes,
+        img_PIL_to_bytes,
+        img_CV_to_bytes,
+        img_bytes_to_PIL,
+        img_bytes_to_CV
+    )
+
+    from ._img_operate import (
+        is_PIL_img,
+        is_CV_img,
+        img_PIL_to_CV,
+        img_CV_to_PIL,
+        img_translate,
+        img_rotate,
+        img_rotate_bound,
+        img_resize,
+        img_show
+    )
 
 __all__ = [
     # _img_cvt
@@ -45,3 +50,5 @@ __all__ = [
     "img_show",
 
 ]
+
+__getattr__, __dir__ = lazy_module(__name__)
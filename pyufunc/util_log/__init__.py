@@ -14,14 +14,19 @@
 # the source code for nb_log: https://github.com/ydf0509/nb_log
 
 
-from ._log_dir import (
-    add_date_in_filename,
-    generate_dir_with_date
-)
+from typing import TYPE_CHECKING
+from pyufunc.pkg_func_index import lazy_module
 
-# from ._lg_logger import get_logger as log_logger
-from ._log_writer import log_writer
-from ._log_loguru import log_logger
+# the public names are imported on first access, see pyufunc.pkg_func_index
+if TYPE_CHECKING:
+    from ._log_dir import (
+        add_date_in_filename,
+        generate_dir_with_date
+    )
+
+    # from ._lg_logger import get_logger as log_logger
+    from ._log_writer import log_writer
+    from ._log_loguru import log_logger
 
 __all__ = [
     # _log_dir
@@ -37,3 +42,5 @@ __all__ = [
     # _log_loguru
     "log_logger",
 ]
+
+__getattr__, __dir__ = lazy_module(__name__)
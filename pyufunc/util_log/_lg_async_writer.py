@@ -0,0 +1,142 @@
+import atexit
+import collections
+import random
+import threading
+import time
+import typing
+
+
+class AsyncLogWriter:
+    """Hand log records over to a background thread, which emits them in batches.
+
+    The caller thread only appends a record to a bounded ring buffer. The writer thread
+    wakes up every ``flush_interval`` seconds (or as soon as ``batch_size`` records are
+    waiting) and passes the batch to ``handler``.
+
+    When the buffer is full, the ``overflow`` policy decides what happens to a new record:
+        - "block": wait until the writer thread frees some space.
+        - "drop": discard the new record.
+        - "sample": keep the new record with probability ``sample_rate`` by evicting the oldest one.
+
+    Records still in the buffer are drained at interpreter exit.
+    """
+
+    overflow_policies = ("block", "drop", "sample")
+
+    def __init__(self,
+                 handler: typing.Callable[[list], None],
+                 max_size: int = 10000,
+                 flush_interval: float = 0.1,
+                 batch_size: int = 1000,
+                 overflow: str = "block",
+                 sample_rate: float = 0.1):
+        if overflow not in self.overflow_policies:
+            raise ValueError(f"overflow should be one of {self.overflow_policies}, not {overflow}")
+        if max_size <= 0 or batch_size <= 0:
+            raise ValueError("max_size and batch_size should be greater than 0.")
+
+        self._handler = handler
+        self._max_size = max_size
+        self._flush_interval = flush_interval
+        self._batch_size = batch_size
+        self._overflow = overflow
+        self._sample_rate = sample_rate
+
+        self._buffer = collections.deque()
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._not_full = threading.Condition(self._lock)
+        self._is_idle = threading.Condition(self._lock)
+        self._writing = False
+        self._closed = False
+        self.dropped = 0
+
+        self._thread = threading.Thread(target=self._run, name="AsyncLogWriter", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def put(self, record) -> bool:
+        """Append a record to the buffer, return False if the record is dropped."""
+        with self._lock:
+            if self._closed:
+                self._handler([record])
+                return True
+
+            if len(self._buffer) >= self._max_size:
+                if self._overflow == "block":
+                    while len(self._buffer) >= self._max_size and not self._closed:
+                        self._not_full.wait()
+                    if self._closed:
+                        self._handler([record])
+                        return True
+                elif self._overflow == "sample" and random.random() < self._sample_rate:
+                    self._buffer.popleft()
+                    self.dropped += 1
+                else:
+                    self.dropped += 1
+                    return False
+
+            self._buffer.append(record)
+            if len(self._buffer) >= self._batch_size:
+                self._not_empty.notify()
+        return True
+
+    def _pop_batch(self) -> list:
+        batch_len = min(len(self._buffer), self._batch_size)
+        batch = [self._buffer.popleft() for _ in range(batch_len)]
+        self._not_full.notify_all()
+        return batch
+
+    def _run(self):
+        while True:
+            with self._lock:
+                if len(self._buffer) < self._batch_size and not self._closed:
+                    self._not_empty.wait(self._flush_interval)
+                if self._closed and not self._buffer:
+                    self._is_idle.notify_all()
+                    return
+                batch = self._pop_batch()
+                self._writing = bool(batch)
+
+            if batch:
+                try:
+                    self._handler(batch)
+                except Exception as e:
+                    print(f"  :AsyncLogWriter failed to write {len(batch)} records: {e}")
+
+            with self._lock:
+                self._writing = False
+                if not self._buffer:
+                    self._is_idle.notify_all()
+
+    def flush(self, timeout: float = None) -> bool:
+        """Block until all buffered records are written, return False on timeout."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._lock:
+            self._not_empty.notify()
+            while self._buffer or self._writing:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._not_empty.notify()
+                self._is_idle.wait(self._flush_interval if remaining is None else min(remaining, self._flush_interval))
+        return True
+
+    def close(self, timeout: float = 10):
+        """Drain the buffer and stop the writer thread."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._not_empty.notify()
+            self._not_full.notify_all()
+        self._thread.join(timeout)
+
+        # the writer thread did not finish in time, drain in the current thread
+        with self._lock:
+            batch = list(self._buffer)
+            self._buffer.clear()
+        if batch:
+            self._handler(batch)
+
+        atexit.unregister(self.close)
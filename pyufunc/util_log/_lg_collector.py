@@ -0,0 +1,194 @@
+import atexit
+import collections
+import contextlib
+import multiprocessing
+import os
+import threading
+import time
+from multiprocessing.connection import Client, Listener
+from multiprocessing.util import Finalize
+
+from pyufunc.util_log._lg_rotate_file_writer import FileWriter
+
+_STOP_COLLECTOR = "__stop_log_collector__"
+
+
+def _serve_connection(conn, fw: FileWriter, stop_event: threading.Event, listener_address):
+    with conn:
+        while True:
+            try:
+                msg = conn.recv()
+            except (EOFError, OSError):
+                return
+            if msg == _STOP_COLLECTOR:
+                stop_event.set()
+                # wake up the accept() in the main thread
+                with contextlib.suppress(OSError, multiprocessing.AuthenticationError):
+                    Client(listener_address, authkey=multiprocessing.current_process().authkey).close()
+                return
+            fw.write_2_file(msg)
+
+
+def _run_collector(conn_address, file_name, log_path, max_bytes, back_count, compress, max_total_bytes):
+    fw = FileWriter(file_name, log_path, max_bytes=max_bytes, back_count=back_count,
+                    compress=compress, max_total_bytes=max_total_bytes)
+    stop_event = threading.Event()
+    with Listener(backlog=128, authkey=multiprocessing.current_process().authkey) as listener:
+        conn_address.send(listener.address)
+        conn_address.close()
+        threads = []
+        while not stop_event.is_set():
+            try:
+                conn = listener.accept()
+            except (OSError, EOFError, multiprocessing.AuthenticationError):
+                continue
+            thread = threading.Thread(target=_serve_connection,
+                                      args=(conn, fw, stop_event, listener.address), daemon=True)
+            thread.start()
+            threads.append(thread)
+
+        # batches already sent are read within milliseconds, idle connections are abandoned
+        deadline = time.monotonic() + 1
+        for thread in threads:
+            thread.join(max(deadline - time.monotonic(), 0))
+    with FileWriter._lock:
+        fw._close_file()
+    fw.flush_tasks(10)
+
+
+class LogCollector:
+    """A dedicated process which owns the log file and its rotation.
+
+    Worker processes ship log messages to the collector over a local Unix socket
+    (a named pipe on Windows) through ``CollectorFileWriter``, so processes sharing one
+    log file never interleave partial lines or contend on file locks.
+
+    Examples:
+        >>> from pyufunc.util_log._lg_collector import LogCollector
+        >>> from pyufunc.util_log._lg_logger import get_logger
+        >>> collector = LogCollector("app.log", log_path="logs")
+        >>> logger = get_logger("app", is_add_file_handler=True, log_collector_address=collector.address)
+        >>> run_parallel(func_using_logger, range(1000))
+        >>> collector.close()
+    """
+
+    def __init__(self, file_name: str, log_path=os.getcwd(), max_bytes=1000 * 1000 * 1000, back_count=10,
+                 compress=None, max_total_bytes=None):
+        parent_conn, child_conn = multiprocessing.Pipe(duplex=False)
+        self._process = multiprocessing.Process(target=_run_collector,
+                                                args=(child_conn, file_name, log_path, max_bytes, back_count,
+                                                      compress, max_total_bytes),
+                                                name="LogCollector",
+                                                daemon=True)
+        self._process.start()
+        child_conn.close()
+        self.address = parent_conn.recv()
+        parent_conn.close()
+        atexit.register(self.close)
+
+    def close(self, timeout: float = 10):
+        """Stop the collector after all connected writers have sent their messages."""
+        if self._process.is_alive():
+            with Client(self.address, authkey=multiprocessing.current_process().authkey) as conn:
+                conn.send(_STOP_COLLECTOR)
+            self._process.join(timeout)
+        atexit.unregister(self.close)
+
+
+class CollectorFileWriter:
+    """Send log messages to a ``LogCollector`` in batches.
+
+    Messages are buffered and sent every ``flush_interval`` seconds or as soon as
+    ``batch_size`` messages are waiting. The writer reconnects after a fork, so it can be
+    created in the parent and used in the child processes of ``multiprocessing.Pool``.
+
+    Logging never raises if the collector is not reachable: the error is reported once,
+    the messages are kept and sent again with a backoff, and the oldest messages are dropped
+    once ``max_buffered`` messages are waiting.
+    """
+
+    _init_lock = threading.Lock()
+    _max_backoff = 5
+
+    def __init__(self, address, batch_size: int = 500, flush_interval: float = 0.05, max_buffered: int = 100000):
+        self.need_write_2_file = bool(address)
+        self._address = address
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+        self._max_buffered = max_buffered
+        self._pid = None
+
+    def _init_process_state(self):
+        self._lock = threading.Lock()
+        # one batch in flight at a time, the batches are sent in order
+        self._send_lock = threading.Lock()
+        self._buffer = collections.deque(maxlen=self._max_buffered)
+        self._conn = None
+        self._num_dropped = 0
+        self._is_error_reported = False
+        self._pid = os.getpid()
+        self._flush_event = threading.Event()
+        threading.Thread(target=self._run, daemon=True).start()
+        # pool workers leave through multiprocessing finalizers rather than atexit
+        Finalize(self, self.flush, exitpriority=100)
+        atexit.register(self.flush)
+
+    def _run(self):
+        delay = self._flush_interval
+        while True:
+            self._flush_event.wait(delay)
+            self._flush_event.clear()
+            # back off while the collector is not reachable, without holding any lock
+            delay = self._flush_interval if self.flush() else min(delay * 2, self._max_backoff)
+
+    def write_2_file(self, msg):
+        if self.need_write_2_file:
+            if self._pid != os.getpid():
+                with self._init_lock:
+                    if self._pid != os.getpid():
+                        self._init_process_state()
+            with self._lock:
+                if len(self._buffer) == self._max_buffered:
+                    self._num_dropped += 1
+                self._buffer.append(msg)
+                if len(self._buffer) >= self._batch_size:
+                    self._flush_event.set()
+
+    def flush(self) -> bool:
+        """Send the buffered messages, return False if the collector is not reachable, the messages are kept."""
+        if self._pid != os.getpid():
+            return True
+        with self._send_lock:
+            with self._lock:
+                if not self._buffer:
+                    return True
+                batch = list(self._buffer)
+                self._buffer.clear()
+            try:
+                if self._conn is None:
+                    self._conn = Client(self._address, authkey=multiprocessing.current_process().authkey)
+                self._conn.send(''.join(batch))
+            except Exception as e:
+                if self._conn is not None:
+                    with contextlib.suppress(Exception):
+                        self._conn.close()
+                    self._conn = None
+                with self._lock:
+                    # put the batch back before the new messages, the oldest are dropped if it is full
+                    kept = collections.deque(batch, maxlen=self._max_buffered)
+                    num_total = len(batch) + len(self._buffer)
+                    kept.extend(self._buffer)
+                    self._num_dropped += num_total - len(kept)
+                    self._buffer = kept
+                if not self._is_error_reported:
+                    self._is_error_reported = True
+                    print(f"  :CollectorFileWriter failed to send logs to collector {self._address}: {e!r}, "
+                          f"the logs are kept and sent again later")
+                return False
+
+            if self._is_error_reported:
+                self._is_error_reported = False
+                print(f"  :CollectorFileWriter reconnected to collector {self._address}, "
+                      f"{self._num_dropped} logs were dropped")
+                self._num_dropped = 0
+            return True
@@ -1,9 +1,11 @@
+import atexit
 import json
 import copy
 import os
 import socket
 import sys
 import threading
+import time
 import traceback
 from enum import Enum
 import logging
@@ -11,6 +13,10 @@ from functools import partial
 from pyufunc.util_log._lg_datetime import aware_now
 from pyufunc.util_log._lg_stream import OsStream
 from pyufunc.util_log._lg_rotate_file_writer import OsFileWriter
+from pyufunc.util_log._lg_async_writer import AsyncLogWriter
+from pyufunc.util_log._lg_collector import CollectorFileWriter
+from pyufunc.util_log._lg_structured import _check_structured_format, encode_structured_records
+from pyufunc.util_log._lg_throttle import LogThrottle
 from pyufunc.pkg_configs import config_logging, config_datetime_fmt
 
 #  adopted from kuai_log
@@ -34,6 +40,44 @@ class FormatterFieldEnum(Enum):
     # click_line = 'click_line'
 
 
+_FRAME_FIELDS = {'pathname', 'filename', 'lineno', 'funcName'}
+
+# the expression of each field in the generated _build_format_kwargs
+_FIELD_EXPRESSIONS = {
+    'name': 'name',
+    'levelname': '_level_to_name[level]',
+    'message': 'msg',
+    'pathname': 'co.co_filename',
+    'filename': '_filename_of(co)',
+    'lineno': 'fra.f_lineno',
+    'funcName': 'co.co_name',
+    'process': '_getgid()',
+    'thread': '_get_ident()',
+    'asctime': 'asctime',
+    'host': 'host',
+}
+
+_LEVEL_COLOR_PREFIX = {
+    logging.DEBUG: '\033[0;32m',  # 绿色
+    logging.INFO: '\033[0;36m',  # 青蓝色 36    96
+    logging.WARNING: '\033[0;33m',
+    logging.ERROR: '\033[0;35m',  # 紫红色
+    logging.CRITICAL: '\033[0;31m',  # 血红色
+}
+
+_code_filename_map = {}
+
+
+def _filename_of(code):
+    # the filename is derived once per code object
+    try:
+        return _code_filename_map[code]
+    except KeyError:
+        filename = code.co_filename.split('/')[-1].split('\\')[-1]
+        _code_filename_map[code] = filename
+        return filename
+
+
 # noinspection PyPep8
 class KuaiLogger:
 
@@ -52,7 +96,20 @@ class KuaiLogger:
                  log_filename=None,
                  max_bytes=1000 * 1000 * 1000,
                  back_count=10,
-                 formatter_template=config_logging["log_fmt"][4]):
+                 formatter_template=config_logging["log_fmt"][4],
+                 is_async=False,
+                 async_max_size=10000,
+                 async_flush_interval=0.1,
+                 async_overflow="block",
+                 log_collector_address=None,
+                 compress=None,
+                 max_total_bytes=None,
+                 structured_format=None,
+                 rate_limit=None,
+                 call_site_rate_limit=None,
+                 rate_burst=None,
+                 sample_rates=None,
+                 dedup_window=None):
 
         self.name = name
         self.level = level
@@ -64,16 +121,57 @@ class KuaiLogger:
         self._log_path = log_path
         self._log_filename = log_filename
 
-        if self._is_add_file_handler:
+        if self._is_add_file_handler and log_collector_address:
+            # the collector process owns the log file and its rotation
+            self._fw = CollectorFileWriter(log_collector_address)
+        elif self._is_add_file_handler:
             self._fw = OsFileWriter(
-                log_filename, log_path, max_bytes=max_bytes, back_count=back_count)
+                log_filename, log_path, max_bytes=max_bytes, back_count=back_count,
+                compress=compress, max_total_bytes=max_total_bytes)
         if self._is_add_json_file_handler:
             self._fw_json = OsFileWriter(
-                log_filename, json_log_path, max_bytes=max_bytes, back_count=back_count)
+                log_filename, json_log_path, max_bytes=max_bytes, back_count=back_count,
+                compress=compress, max_total_bytes=max_total_bytes)
 
         self._formatter_template = formatter_template
         self._need_fields = self._parse_need_filed()
         # print(self._need_fields)
+        self._build_format_kwargs = self._compile_format_kwargs()
+        self._render = formatter_template.format_map
+
+        # in async mode, log() only enqueues the record, a writer thread formats and writes in batches
+        self._async_writer = None
+        if is_async:
+            self._async_writer = AsyncLogWriter(self._emit_batch,
+                                                max_size=async_max_size,
+                                                flush_interval=async_flush_interval,
+                                                overflow=async_overflow)
+
+        # sampling, rate limits and dedup drop records before any formatting work
+        self._throttle = None
+        if rate_limit or call_site_rate_limit or sample_rates or dedup_window:
+            self._throttle = LogThrottle(self._log_summary,
+                                         rate_limit=rate_limit,
+                                         call_site_rate_limit=call_site_rate_limit,
+                                         rate_burst=rate_burst,
+                                         sample_rates=sample_rates,
+                                         dedup_window=dedup_window)
+        if dedup_window:
+            # the repeat counts of open dedup windows are written at exit, before the async writer closes
+            atexit.register(self._throttle.flush)
+        # the frame fields in the template, kept for the summary record of a dedup window
+        self._dedup_frame_fields = None
+        if dedup_window and self._need_fields & _FRAME_FIELDS:
+            self._dedup_frame_fields = tuple(self._need_fields & _FRAME_FIELDS)
+
+        # structured JSON records are always encoded off the caller thread
+        self._structured_format = _check_structured_format(structured_format)
+        self._structured_writer = None
+        if self._is_add_json_file_handler and self._structured_format and not is_async:
+            self._structured_writer = AsyncLogWriter(self._emit_structured,
+                                                     max_size=async_max_size,
+                                                     flush_interval=async_flush_interval,
+                                                     overflow=async_overflow)
 
     def setLevel(self, level):
         """
@@ -88,45 +186,34 @@ class KuaiLogger:
             if '{' + field.value + '}' in self._formatter_template
         }
 
-    def _build_format_kwargs(self, level, msg, stacklevel):
-        format_kwargs = {}
-        if FormatterFieldEnum.name.value in self._need_fields:
-            format_kwargs[FormatterFieldEnum.name.value] = self.name
-        if FormatterFieldEnum.levelname.value in self._need_fields:
-            format_kwargs[FormatterFieldEnum.levelname.value] = logging._levelToName[level]  # noqa
-        if FormatterFieldEnum.message.value in self._need_fields:
-            format_kwargs[FormatterFieldEnum.message.value] = msg
-
-        if (
-                FormatterFieldEnum.pathname.value in self._need_fields or
-                FormatterFieldEnum.filename.value in self._need_fields or
-                FormatterFieldEnum.funcName.value in self._need_fields):
-            fra = sys._getframe(stacklevel)
-            lineno = fra.f_lineno
-            pathname = fra.f_code.co_filename  # type :str
-            filename = pathname.split('/')[-1].split('\\')[-1]
-            # noinspection PyPep8Naming
-            funcName = fra.f_code.co_name
-            if FormatterFieldEnum.pathname.value in self._need_fields:
-                format_kwargs[FormatterFieldEnum.pathname.value] = pathname
-            if FormatterFieldEnum.filename.value in self._need_fields:
-                format_kwargs[FormatterFieldEnum.filename.value] = filename
-            if FormatterFieldEnum.lineno.value in self._need_fields:
-                format_kwargs[FormatterFieldEnum.lineno.value] = lineno
-            if FormatterFieldEnum.funcName.value in self._need_fields:
-                format_kwargs[FormatterFieldEnum.funcName.value] = funcName
-
-        if f'{FormatterFieldEnum.process.value}' in self._need_fields:
-            format_kwargs[FormatterFieldEnum.process.value] = os.getgid()
-        if f'{FormatterFieldEnum.thread.value}' in self._need_fields:
-            format_kwargs[FormatterFieldEnum.thread.value] = threading.get_ident()
-        if FormatterFieldEnum.asctime.value in self._need_fields:
+    def _compile_format_kwargs(self):
+        """Generate the function which builds the format kwargs for the fields in the template.
+
+        The membership checks are done once here, the generated function only captures
+        the caller frame if the template needs it.
+        """
+        need_frame = bool(self._need_fields & _FRAME_FIELDS)
+        items = [f"{field!r}: {expr}" for field, expr in _FIELD_EXPRESSIONS.items() if field in self._need_fields]
+
+        src = "def _build_format_kwargs(level, msg, stacklevel):\n"
+        if need_frame:
+            src += "    fra = _getframe(stacklevel)\n    co = fra.f_code\n"
+        src += "    return {" + ", ".join(items) + "}\n"
+
+        namespace = {
+            "_getframe": sys._getframe,
+            "_level_to_name": logging._levelToName,  # noqa
+            "_filename_of": _filename_of,
+            "_getgid": getattr(os, "getgid", os.getpid),
+            "_get_ident": threading.get_ident,
+            "name": self.name,
+            "host": self.host,
             # format_kwargs[FormatterFieldEnum.asctime.value] = datetime.datetime.now().strftime(
             #     f"%Y-%m-%d %H:%M:%S.%f {self.current_timezone}")
-            format_kwargs[FormatterFieldEnum.asctime.value] = config_datetime_fmt[34]
-        if FormatterFieldEnum.host.value in self._need_fields:
-            format_kwargs[FormatterFieldEnum.host.value] = self.host
-        return format_kwargs
+            "asctime": config_datetime_fmt[34],
+        }
+        exec(src, namespace)
+        return namespace["_build_format_kwargs"]
 
     def log(self, level, msg, args="", exc_info=None, extra=None, stack_info=False, stacklevel=1):
         # def _log(self, level, msg, args, exc_info=None, extra=None, stack_info=False):
@@ -136,58 +223,117 @@ class KuaiLogger:
         # print("msg:", msg)
         # print("args:", args)
         msg = str(msg) + str(args)
+        if self._throttle is not None and not self._throttle.allow(
+                level, msg, self._call_site() if self._throttle.need_call_site else None):
+            return
         format_kwargs = self._build_format_kwargs(level, msg, stacklevel)
-        # print(self._formatter_template)
-        # print(format_kwargs)
-        format_kwargs_json = {}
-        if self._is_add_json_file_handler:
-            format_kwargs_json = copy.copy(format_kwargs)
-            format_kwargs_json['asctime'] = str(format_kwargs_json['asctime'])
-            format_kwargs_json['msg'] = {}
-            if isinstance(msg, dict):
-                format_kwargs_json['msg'].update(msg)
-                format_kwargs_json['message'] = ''
-            if extra:
-                format_kwargs_json['msg'].update(extra)
-            if exc_info:
-                format_kwargs_json['msg'].update(
-                    {'traceback': traceback.format_exc()})
+        if self._dedup_frame_fields is not None:
+            self._throttle.set_call_site(level, msg, {field: format_kwargs[field]
+                                                      for field in self._dedup_frame_fields})
+
+        # the traceback is only available in the caller thread
+        exc_text = traceback.format_exc() if exc_info else None
+        self._dispatch((level, msg, format_kwargs, extra, exc_text, time.time()))
+
+    def _dispatch(self, record):
+        if self._async_writer is not None:
+            self._async_writer.put(record)
+            return
+        if self._structured_writer is not None:
+            self._structured_writer.put(record)
+        self._emit_batch([record])
+
+    @staticmethod
+    def _call_site():
+        # the first frame outside of this module
+        fra = sys._getframe(2)
+        while fra.f_back is not None and fra.f_code.co_filename == __file__:
+            fra = fra.f_back
+        return fra.f_code, fra.f_lineno
+
+    def _log_summary(self, level, msg, call_site):
+        # the repeat count of deduplicated records bypasses the throttle, it is written by a later
+        # log() or flush(), so the frame fields are those of the record written first, or empty
+        format_kwargs = self._build_format_kwargs(level, msg, 1)
+        for field in self._need_fields & _FRAME_FIELDS:
+            format_kwargs[field] = call_site.get(field, '') if call_site else ''
+        self._dispatch((level, msg, format_kwargs, None, None, time.time()))
+
+    @property
+    def throttle_stats(self) -> dict:
+        """Number of records dropped by dedup, sampling and rate limits."""
+        if self._throttle is None:
+            return {}
+        return dict(self._throttle.stats)
+
+    def flush(self, timeout=None):
+        """
+        Block until all records enqueued in async mode are written,
+        and send the buffered messages to the log collector.
+        The repeat counts of open dedup windows are written first.
+        """
+        if self._throttle is not None:
+            self._throttle.flush()
+        if self._async_writer is not None:
+            self._async_writer.flush(timeout)
+        if self._structured_writer is not None:
+            self._structured_writer.flush(timeout)
+        if self._is_add_file_handler and isinstance(self._fw, CollectorFileWriter):
+            self._fw.flush()
+
+    def _format_json(self, level, msg, format_kwargs, extra, exc_text):
+        format_kwargs_json = copy.copy(format_kwargs)
+        format_kwargs_json['asctime'] = str(format_kwargs_json['asctime'])
+        format_kwargs_json['msg'] = {}
+        if isinstance(msg, dict):
+            format_kwargs_json['msg'].update(msg)
+            format_kwargs_json['message'] = ''
         if extra:
-            format_kwargs.update(extra)
-        msg_format = self._formatter_template.format(**format_kwargs)
-        if exc_info:
-            msg_format += f'\n {traceback.format_exc()}'
-        msg_color = self._add_color(msg_format, level)
-        # print(msg_format)
-        # print(msg)
-        if self._is_add_stream_handler:
-            OsStream.stdout(msg_color + '\n')
-        if self._is_add_file_handler:
-            self._fw.write_2_file(msg_format + '\n')
-        if self._is_add_json_file_handler:
-            self._fw_json.write_2_file(json.dumps(
-                format_kwargs_json, ensure_ascii=False) + '\n')
+            format_kwargs_json['msg'].update(extra)
+        if exc_text:
+            format_kwargs_json['msg'].update({'traceback': exc_text})
+        return json.dumps(format_kwargs_json, ensure_ascii=False)
+
+    def _emit_structured(self, records):
+        self._fw_json.write_2_file(encode_structured_records(self.name, records, self._structured_format))
+
+    def _emit_batch(self, records):
+        # format all records first, then write each handler once per batch
+        stream_msgs = []
+        file_msgs = []
+        json_msgs = []
+        is_legacy_json = self._is_add_json_file_handler and not self._structured_format
+        for level, msg, format_kwargs, extra, exc_text, _ts in records:
+            # print(self._formatter_template)
+            # print(format_kwargs)
+            if is_legacy_json:
+                json_msgs.append(self._format_json(level, msg, format_kwargs, extra, exc_text) + '\n')
+            if extra:
+                format_kwargs = {**format_kwargs, **extra}
+            msg_format = self._render(format_kwargs)
+            if exc_text:
+                msg_format += f'\n {exc_text}'
+            if self._is_add_stream_handler:
+                stream_msgs.append(self._add_color(msg_format, level) + '\n')
+            if self._is_add_file_handler:
+                file_msgs.append(msg_format + '\n')
+
+        if stream_msgs:
+            OsStream.stdout(''.join(stream_msgs))
+        if file_msgs:
+            self._fw.write_2_file(''.join(file_msgs))
+        if json_msgs:
+            self._fw_json.write_2_file(''.join(json_msgs))
+        # in async mode the structured records are encoded in this writer thread as well
+        if self._structured_format and self._is_add_json_file_handler and self._structured_writer is None:
+            self._emit_structured(records)
 
     @staticmethod
     def _add_color(complete_msg, record_level):
-        if record_level == logging.DEBUG:
-            # msg_color = ('\033[0;32m%s\033[0m' % msg)  # 绿色
-            # print(msg1)
-            return f'\033[0;32m{complete_msg}\033[0m'
-        elif record_level == logging.INFO:
-            # msg_color = ('\033[%s;%sm%s\033[0m' % (self._display_method, self.bule, msg))  # 青蓝色 36    96
-            return f'\033[0;36m{complete_msg}\033[0m'
-        elif record_level == logging.WARNING:
-            # msg_color = ('\033[%s;%sm%s\033[0m' % (self._display_method, self.yellow, msg))
-            return f'\033[0;33m{complete_msg}\033[0m'
-        elif record_level == logging.ERROR:
-            # msg_color = ('\033[%s;35m%s\033[0m' % (self._display_method, msg))  # 紫红色
-            return f'\033[0;35m{complete_msg}\033[0m'
-        elif record_level == logging.CRITICAL:
-            # msg_color = ('\033[%s;31m%s\033[0m' % (self._display_method, msg))  # 血红色
-            return f'\033[0;31m{complete_msg}\033[0m'
-        else:
+        color_prefix = _LEVEL_COLOR_PREFIX.get(record_level)
+        if color_prefix is None:
             return f'{complete_msg}'
+        return f'{color_prefix}{complete_msg}\033[0m'
 
     def debug(self, msg, *args, **kwargs):
         self.log(logging.DEBUG, msg, *args, **kwargs)
@@ -219,7 +365,20 @@ def get_logger(name: str,
                log_filename: str = "",
                max_bytes: int = 1000 * 1000 * 1000,
                back_count: int = 10,
-               formatter_template: str = config_logging["log_fmt"][4]):
+               formatter_template: str = config_logging["log_fmt"][4],
+               is_async: bool = False,
+               async_max_size: int = 10000,
+               async_flush_interval: float = 0.1,
+               async_overflow: str = "block",
+               log_collector_address=None,
+               compress: str = None,
+               max_total_bytes: int = None,
+               structured_format: str = None,
+               rate_limit: float = None,
+               call_site_rate_limit: float = None,
+               rate_burst: float = None,
+               sample_rates: dict = None,
+               dedup_window: float = None):
     """log logger function to write log.
 
     Args:
@@ -234,6 +393,31 @@ def get_logger(name: str,
         max_bytes (int, optional): max bytes of log file. Defaults to 1000 * 1000 * 1000.
         back_count (int, optional): back count of log file. Defaults to 10.
         formatter_template (str, optional): formatter template. Defaults to '{asctime} - {host} - "{pathname}:{lineno}" - {funcName} - {name} - {levelname} - {message}'.
+        is_async (bool, optional): whether log() only enqueues the record and a background thread
+            formats and writes records in batches. Defaults to False.
+        async_max_size (int, optional): max number of records waiting in async mode. Defaults to 10000.
+        async_flush_interval (float, optional): seconds between two batch writes in async mode. Defaults to 0.1.
+        async_overflow (str, optional): policy when the async buffer is full, "block", "drop" or "sample".
+            Defaults to "block".
+        log_collector_address (optional): address of a running LogCollector. If given, the file handler
+            ships messages to the collector process instead of writing the log file. Defaults to None.
+        compress (str, optional): compress rotated log files in a background thread, "gzip" or "zstd".
+            Defaults to None.
+        max_total_bytes (int, optional): disk budget of all log files, the oldest ones are deleted first.
+            Defaults to None.
+        structured_format (str, optional): layout of the json file handler. None keeps the json dump of
+            the format fields, "jsonl" writes compact JSON lines and "binary" writes length-prefixed frames,
+            both are encoded in batches by a background thread and read back by read_structured_logs.
+            Defaults to None.
+        rate_limit (float, optional): max records per second of the logger, token bucket. Defaults to None.
+        call_site_rate_limit (float, optional): max records per second of each line calling the logger.
+            Defaults to None.
+        rate_burst (float, optional): bucket capacity of both rate limits. Defaults to one second of records.
+        sample_rates (dict, optional): {level: probability} to keep a record of the level,
+            e.g. {logging.DEBUG: 0.01}. Defaults to None.
+        dedup_window (float, optional): seconds in which repeats of the same level and message are
+            counted instead of written, the count is written as one record when the window ends.
+            Defaults to None.
 
     Returns:
         _type_: logger object
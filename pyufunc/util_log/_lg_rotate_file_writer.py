@@ -1,6 +1,10 @@
 import atexit
 import contextlib
+import gzip
+import importlib.util
+import io
 import queue
+import shutil
 import threading
 import typing
 from pathlib import Path
@@ -12,12 +16,67 @@ def build_current_date_str():
     return time.strftime('%Y-%m-%d')
 
 
+# file suffix of compressed log segments
+COMPRESS_SUFFIX = {'gzip': '.gz', 'zstd': '.zst'}
+
+
+def _check_compress(compress):
+    if compress is None:
+        return None
+    if compress not in COMPRESS_SUFFIX:
+        raise ValueError(f"compress should be one of {list(COMPRESS_SUFFIX)} or None, not {compress}")
+    if compress == 'zstd' and importlib.util.find_spec('zstandard') is None:
+        print("  :Info: zstandard is not installed, compress log files with gzip instead.")
+        return 'gzip'
+    return compress
+
+
+def _open_segment(path, mode='rb', compress=None):
+    """Open a log segment, compressed segments are (de)compressed on the fly.
+
+    The compression is derived from the file suffix if compress is not given.
+    """
+    path = str(path)
+    if compress is None:
+        compress = next((key for key, sfx in COMPRESS_SUFFIX.items() if path.endswith(sfx)), None)
+    if compress == 'gzip':
+        return gzip.open(path, mode, compresslevel=6) if 'w' in mode else gzip.open(path, mode)
+    if compress == 'zstd':
+        import zstandard
+        if 'w' in mode:
+            return zstandard.ZstdCompressor().stream_writer(open(path, mode))
+        return zstandard.ZstdDecompressor().stream_reader(open(path, mode))
+    return open(path, mode)
+
+
+def _find_segments(log_path, file_name) -> list:
+    """The rotated segments of file_name in log_path, compressed or not, from oldest to newest."""
+    segment_suffixes = (file_name, *(file_name + sfx for sfx in COMPRESS_SUFFIX.values()))
+    return sorted(
+        (f for f in Path(log_path).glob(f'????-??-??.????.{file_name}*') if f.name.endswith(segment_suffixes)),
+        key=lambda f: f.name)
+
+
+def read_log_lines(log_path, file_name, encoding='utf8'):
+    """Stream the lines of all log segments of file_name in log_path, from oldest to newest.
+
+    Compressed segments are decompressed on the fly and never loaded into memory as a whole.
+    """
+    for f in _find_segments(log_path, file_name):
+        with contextlib.suppress(FileNotFoundError):
+            with io.TextIOWrapper(_open_segment(f, 'rb'), encoding=encoding) as f_text:
+                yield from f_text
+
+
 class FileWriter:
     _lock = threading.RLock()
 
-    def __init__(self, file_name: str, log_path=os.getcwd(), max_bytes=1000 * 1000 * 1000, back_count=10):
+    def __init__(self, file_name: str, log_path=os.getcwd(), max_bytes=1000 * 1000 * 1000, back_count=10,
+                 compress=None, max_total_bytes=None):
         self._max_bytes = max_bytes
         self._back_count = back_count
+        self._compress = _check_compress(compress)
+        self._max_total_bytes = max_total_bytes
         self.need_write_2_file = bool(file_name)
         if self.need_write_2_file:
             self._file_name = file_name
@@ -25,54 +84,164 @@ class FileWriter:
             if not Path(self.log_path).exists():
                 print(f'Create log folder {log_path}')
                 Path(self.log_path).mkdir(exist_ok=True)
+
+            # compression and retention run in one background thread, never in the writing thread
+            self._tasks = queue.SimpleQueue()
+            self._worker = None
+            # size of the rotated segments kept by the last retention, and whether one is queued
+            self._old_bytes = 0
+            self._retention_pending = False
+
+            # the rotation state is kept in memory, the log folder is only scanned once here
+            self._segments = _find_segments(self.log_path, self._file_name)
+            self._date_str = build_current_date_str()
+            self._next_date_ts = self._next_midnight_ts()
+            self._sn = self._find_latest_sn()
             self._open_file()
-            self._last_write_ts = 0
-            self._last_del_old_files_ts = 0
+
+            # segments left uncompressed by a previous run
+            if self._compress:
+                for f in self._segments[:-1]:
+                    if f.name.endswith(file_name):
+                        self._submit(self._compress_file, f)
+            self._submit_retention()
 
     @property
     def file_path(self):
-        f_list = list(Path(self.log_path).glob(f'????-??-??.????.{self._file_name}'))
-        sn_list = []
-        for f in f_list:
-            if f'{build_current_date_str()}.' in f.name:
-                sn = f.name.split('.')[1]
-                sn_list.append(sn)
-        if not sn_list:
-            return Path(self.log_path) / Path(f'{build_current_date_str()}.0001.{self._file_name}')
-        sn_max = max(sn_list)
-        if (
-            Path(self.log_path) / Path(f'{build_current_date_str()}.{sn_max}.{self._file_name}')
-        ).stat().st_size <= self._max_bytes:
-            return Path(self.log_path) / Path(f'{build_current_date_str()}.{sn_max}.{self._file_name}')
-        new_sn_int = int(sn_max) + 1
-        new_sn_str = str(new_sn_int).zfill(4)
-        return Path(self.log_path) / Path(f'{build_current_date_str()}.{new_sn_str}.{self._file_name}')
+        return Path(self.log_path) / Path(f'{self._date_str}.{str(self._sn).zfill(4)}.{self._file_name}')
+
+    @staticmethod
+    def _next_midnight_ts():
+        now = time.localtime()
+        return time.mktime((now.tm_year, now.tm_mon, now.tm_mday + 1, 0, 0, 0, 0, 0, -1))
+
+    def _find_latest_sn(self):
+        sn_list = [
+            int(f.name.split('.')[1])
+            for f in self._segments
+            if f.name.startswith(f'{self._date_str}.') and f.name.split('.')[1].isdigit()
+        ]
+        sn = max(sn_list, default=1)
+        # a compressed segment is closed, continue with the next serial number
+        if Path(self.log_path, f'{self._date_str}.{str(sn).zfill(4)}.{self._file_name}') not in self._segments:
+            sn += bool(sn_list)
+        return sn
 
     def _open_file(self):
-        self._f = open(self.file_path, encoding='utf8', mode='a')
+        self._f = open(self.file_path, mode='ab')
+        self._bytes_written = self._f.tell()
+        if not self._segments or self._segments[-1] != self.file_path:
+            self._segments.append(self.file_path)
 
     def _close_file(self):
         self._f.close()
 
+    def _rollover(self):
+        self._close_file()
+        closed_file = self.file_path
+        if time.time() >= self._next_date_ts:
+            self._date_str = build_current_date_str()
+            self._next_date_ts = self._next_midnight_ts()
+            self._sn = 1
+        else:
+            self._sn += 1
+        self._open_file()
+
+        if self._compress:
+            self._submit(self._compress_file, closed_file)
+        self._submit_retention()
+
     def write_2_file(self, msg):
         if self.need_write_2_file:
+            msg_bytes = msg if isinstance(msg, bytes) else msg.encode('utf8')
             with self._lock:
-                now_ts = time.time()
-                if now_ts - self._last_write_ts > 10:
-                    self._last_write_ts = time.time()
-                    self._close_file()
-                    self._open_file()
-                self._f.write(msg)
+                if (self._bytes_written and self._bytes_written + len(msg_bytes) > self._max_bytes) or (
+                        time.time() >= self._next_date_ts):
+                    self._rollover()
+                self._f.write(msg_bytes)
                 self._f.flush()
-                if now_ts - self._last_del_old_files_ts > 30:
-                    self._last_del_old_files_ts = time.time()
-                    self._delete_old_files()
-
-    def _delete_old_files(self):
-        f_list = list(Path(self.log_path).glob(f'????-??-??.????.{self._file_name}'))
-        # f_list.sort(key=lambda f:f.stat().st_mtime,reverse=True)
-        f_list.sort(key=lambda f: f.name, reverse=True)
-        for f in f_list[self._back_count:]:
+                self._bytes_written += len(msg_bytes)
+                # the active segment outgrew the disk budget left by the rotated ones
+                if (self._max_total_bytes and self._old_bytes and not self._retention_pending
+                        and self._old_bytes + self._bytes_written > self._max_total_bytes):
+                    self._submit_retention()
+
+    def _submit(self, func, *args):
+        self._tasks.put((func, args))
+        if self._worker is None:
+            self._worker = threading.Thread(target=self._run_tasks, daemon=True)
+            self._worker.start()
+
+    def _submit_retention(self):
+        self._retention_pending = True
+        self._submit(self._apply_retention)
+
+    def _run_tasks(self):
+        while True:
+            func, args = self._tasks.get()
+            with contextlib.suppress(Exception):
+                func(*args)
+
+    def _compress_file(self, path):
+        compressed_path = path.with_name(path.name + COMPRESS_SUFFIX[self._compress])
+        tmp_path = compressed_path.with_name(compressed_path.name + '.tmp')
+        try:
+            with open(path, 'rb') as f_in, _open_segment(tmp_path, 'wb', self._compress) as f_out:
+                shutil.copyfileobj(f_in, f_out, 1024 * 1024)
+        except FileNotFoundError:
+            # the segment was removed by retention in the meantime
+            with contextlib.suppress(FileNotFoundError):
+                tmp_path.unlink()
+            return
+        os.replace(tmp_path, compressed_path)
+        with self._lock:
+            if path in self._segments:
+                self._segments[self._segments.index(path)] = compressed_path
+        with contextlib.suppress(FileNotFoundError):
+            path.unlink()
+
+    def _apply_retention(self):
+        with self._lock:
+            self._retention_pending = False
+            old_segments = self._segments[:-1]
+            # the active segment at its real size, a later write over the budget runs the retention again
+            active_bytes = self._bytes_written
+
+        # keep back_count segments including the active one
+        num_delete = max(len(old_segments) + 1 - self._back_count, 0)
+        f_delete, f_keep = old_segments[:num_delete], old_segments[num_delete:]
+
+        # enforce the total disk budget, the oldest segments go first
+        if self._max_total_bytes:
+            sizes = []
+            for f in f_keep:
+                try:
+                    sizes.append(f.stat().st_size)
+                except FileNotFoundError:
+                    sizes.append(0)
+            total_bytes = active_bytes + sum(sizes)
+            while f_keep and total_bytes > self._max_total_bytes:
+                f_delete.append(f_keep.pop(0))
+                total_bytes -= sizes.pop(0)
+            with self._lock:
+                self._old_bytes = sum(sizes)
+
+        if f_delete:
+            with self._lock:
+                self._segments = [f for f in self._segments if f not in f_delete]
+            self._delete_old_files(f_delete)
+
+    def flush_tasks(self, timeout=None):
+        """Block until the pending compression and retention tasks are done."""
+        if self.need_write_2_file:
+            done = threading.Event()
+            self._submit(done.set)
+            return done.wait(timeout)
+        return True
+
+    @staticmethod
+    def _delete_old_files(f_list):
+        for f in f_list:
             with contextlib.suppress(FileNotFoundError, PermissionError):
                 # print(f'删除 {f} ') # 这里不能print， stdout写入文件，写入文件时候print，死循环
                 f.unlink()
@@ -105,7 +274,9 @@ class BulkFileWriter:
     def __init__(self, file_name: typing.Optional[str],
                  log_path=os.getcwd(),
                  max_bytes=1000 * 1000 * 1000,
-                 back_count=10):
+                 back_count=10,
+                 compress=None,
+                 max_total_bytes=None):
         self.need_write_2_file = bool(file_name)
         self._file_name_key = (log_path, file_name)
         if file_name:
@@ -114,6 +285,8 @@ class BulkFileWriter:
                 'log_path': log_path,
                 'max_bytes': max_bytes,
                 'back_count': back_count,
+                'compress': compress,
+                'max_total_bytes': max_total_bytes,
             }
             self.start_bulk_write()
 
@@ -126,10 +299,15 @@ class BulkFileWriter:
     def _bulk_real_write(cls):
         with cls._lock:
             for _file_name, queue in cls.filename__queue_map.items():
-                msg_str_all = ''
+                msg_list = []
                 while not queue.empty():
-                    msg_str_all += str(queue.get())
-                if msg_str_all:
+                    msg_list.append(queue.get())
+                if msg_list:
+                    # the structured JSON handler writes bytes
+                    if isinstance(msg_list[0], bytes):
+                        msg_str_all = b''.join(msg_list)
+                    else:
+                        msg_str_all = ''.join(str(msg) for msg in msg_list)
                     cls._get_file_writer(_file_name).write_2_file(msg_str_all)
 
     @classmethod
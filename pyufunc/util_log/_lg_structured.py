@@ -0,0 +1,184 @@
+import datetime
+import importlib.util
+import io
+import json
+import logging
+import re
+import struct
+import typing
+
+from pyufunc.util_log._lg_rotate_file_writer import _find_segments, _open_segment
+
+# orjson is optional, the standard json encoder is prepared once as fallback
+if importlib.util.find_spec("orjson") is not None:
+    import orjson
+
+    _ORJSON_OPTION = orjson.OPT_NON_STR_KEYS
+
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj, default=str, option=_ORJSON_OPTION)
+
+    _loads = orjson.loads
+else:
+    _json_encode = json.JSONEncoder(ensure_ascii=False, separators=(',', ':'),
+                                    check_circular=False, default=str).encode
+
+    def _dumps(obj) -> bytes:
+        return _json_encode(obj).encode('utf8')
+
+    _loads = json.loads
+
+STRUCTURED_FORMATS = ("jsonl", "binary")
+
+# body length, timestamp, level number and logger name length, followed by the name and the JSON body
+_FRAME_HEADER = struct.Struct('<IdHH')
+
+# ts, levelno and name always lead a JSON line, so the reader filters on the line prefix
+_RE_JSONL_PREFIX = re.compile(rb'\{"ts":([-+.eE0-9]+),"levelno":(\d+),"name":"((?:[^"\\]|\\.)*)"')
+
+# format fields which are already part of the structured record
+_SKIP_FIELDS = {'name', 'message', 'asctime'}
+
+
+def _check_structured_format(structured_format):
+    if structured_format is not None and structured_format not in STRUCTURED_FORMATS:
+        raise ValueError(f"structured_format should be one of {STRUCTURED_FORMATS} or None, not {structured_format}")
+    return structured_format
+
+
+def build_structured_record(name: str, record: tuple) -> dict:
+    """Convert a KuaiLogger record to the dict written by the structured JSON handler."""
+    level, msg, format_kwargs, extra, exc_text, ts = record
+    rec = {'ts': ts, 'levelno': level, 'name': name, 'message': msg}
+    for field, value in format_kwargs.items():
+        if field not in _SKIP_FIELDS:
+            rec[field] = value
+    if extra:
+        rec['extra'] = extra
+    if exc_text:
+        rec['traceback'] = exc_text
+    return rec
+
+
+def encode_structured_records(name: str, records: list, structured_format: str = "jsonl") -> bytes:
+    """Encode a batch of KuaiLogger records as JSON lines or length-prefixed binary frames."""
+    if structured_format == "jsonl":
+        return b''.join(_dumps(build_structured_record(name, record)) + b'\n' for record in records)
+
+    name_bytes = name.encode('utf8')
+    frames = []
+    for record in records:
+        body = _dumps(build_structured_record(name, record))
+        frames.append(_FRAME_HEADER.pack(len(name_bytes) + len(body), record[5], record[0], len(name_bytes)))
+        frames.append(name_bytes)
+        frames.append(body)
+    return b''.join(frames)
+
+
+def _to_timestamp(value) -> typing.Optional[float]:
+    if value is None:
+        return None
+    if isinstance(value, datetime.datetime):
+        return value.timestamp()
+    return float(value)
+
+
+def _to_levelno(value) -> int:
+    if value is None:
+        return 0
+    if isinstance(value, str):
+        levelno = logging.getLevelName(value.upper())
+        if not isinstance(levelno, int):
+            raise ValueError(f"Unknown logging level: {value}")
+        return levelno
+    return int(value)
+
+
+def _iter_jsonl_records(f, levelno, start, end, names):
+    # the zstd stream reader does not iterate over lines itself
+    for line in io.BufferedReader(f, 1024 * 1024):
+        match = _RE_JSONL_PREFIX.match(line)
+        # lines of other layouts and a partly written last line are skipped
+        if not match:
+            continue
+        ts = float(match.group(1))
+        if int(match.group(2)) < levelno or (start is not None and ts < start) or (end is not None and ts >= end):
+            continue
+        if names is not None:
+            name = match.group(3)
+            name = _loads(b'"' + name + b'"') if b'\\' in name else name.decode('utf8')
+            if name not in names:
+                continue
+        try:
+            yield _loads(line)
+        except ValueError:
+            continue
+
+
+def _iter_binary_records(f, levelno, start, end, names):
+    header_size = _FRAME_HEADER.size
+    while True:
+        header = f.read(header_size)
+        if len(header) < header_size:
+            return
+        body_len, ts, record_levelno, name_len = _FRAME_HEADER.unpack(header)
+        if record_levelno < levelno or (start is not None and ts < start) or (end is not None and ts >= end):
+            f.seek(body_len, 1)
+            continue
+        if names is not None:
+            name = f.read(name_len).decode('utf8')
+            if name not in names:
+                f.seek(body_len - name_len, 1)
+                continue
+            body = f.read(body_len - name_len)
+        else:
+            body = f.read(body_len)[name_len:]
+        # a partly written last frame
+        if len(body) < body_len - name_len:
+            return
+        yield _loads(body)
+
+
+def read_structured_logs(log_path,
+                         file_name: str,
+                         structured_format: str = "jsonl",
+                         level=None,
+                         start=None,
+                         end=None,
+                         names=None) -> typing.Iterator[dict]:
+    """Stream the records written by the structured JSON handler, from oldest to newest.
+
+    Records are filtered by level, time range and logger name before the JSON body is parsed:
+    JSON lines are matched on their leading "ts", "levelno" and "name" keys, binary frames
+    carry these fields in a fixed-size header and filtered-out bodies are skipped unread.
+
+    Args:
+        log_path: folder of the log files.
+        file_name (str): log file name, all rotated segments are read, compressed or not.
+        structured_format (str): "jsonl" or "binary". Defaults to "jsonl".
+        level (int | str, optional): minimum logging level. Defaults to None.
+        start (float | datetime, optional): include records at or after this time. Defaults to None.
+        end (float | datetime, optional): include records before this time. Defaults to None.
+        names (str | Iterable[str], optional): logger names to include. Defaults to None.
+
+    Examples:
+        >>> from pyufunc.util_log._lg_structured import read_structured_logs
+        >>> for rec in read_structured_logs("logs", "app.jsonl", level="ERROR", names="app"):
+        ...     print(rec["ts"], rec["message"])
+    """
+    structured_format = _check_structured_format(structured_format) or "jsonl"
+    levelno = _to_levelno(level)
+    start, end = _to_timestamp(start), _to_timestamp(end)
+    if isinstance(names, str):
+        names = {names}
+    elif names is not None:
+        names = set(names)
+
+    iter_records = _iter_jsonl_records if structured_format == "jsonl" else _iter_binary_records
+    for segment in _find_segments(log_path, file_name):
+        try:
+            f = _open_segment(segment, 'rb')
+        except FileNotFoundError:
+            continue
+        with f:
+            yield from iter_records(f, levelno, start, end, names)
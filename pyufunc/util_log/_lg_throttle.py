@@ -0,0 +1,147 @@
+import random
+import threading
+import time
+import typing
+
+
+class TokenBucket:
+    """Allow ``rate`` events per second on average, with bursts of up to ``capacity`` events."""
+
+    __slots__ = ('rate', 'capacity', 'tokens', 'last')
+
+    def __init__(self, rate: float, capacity: float = None):
+        if rate <= 0:
+            raise ValueError(f"rate should be greater than 0, not {rate}")
+        self.rate = rate
+        self.capacity = max(capacity or rate, 1)
+        self.tokens = self.capacity
+        self.last = time.monotonic()
+
+    def consume(self, now: float) -> bool:
+        self.tokens = min(self.capacity, self.tokens + (now - self.last) * self.rate)
+        self.last = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return True
+        return False
+
+
+class LogThrottle:
+    """Decide whether a log record is written before any formatting work is done.
+
+    The checks run in this order, a record dropped by one check never reaches the next one:
+        - dedup_window: repeats of the same level and message within the window are counted
+          instead of written, the count is written as one record when the window ends,
+          with the call site of the record written first.
+        - sample_rates: a {level: probability} dict, records of these levels are kept with
+          the given probability.
+        - call_site_rate_limit: token bucket of records per second for each call site.
+        - rate_limit: token bucket of records per second for the whole logger.
+
+    ``rate_burst`` is the bucket capacity of both rate limits and defaults to one second of records.
+    The number of dropped records of each check is counted in ``stats``.
+    """
+
+    def __init__(self,
+                 emit: typing.Callable[[int, str, dict], None],
+                 rate_limit: float = None,
+                 call_site_rate_limit: float = None,
+                 rate_burst: float = None,
+                 sample_rates: dict = None,
+                 dedup_window: float = None):
+        if sample_rates and any(not 0 <= rate <= 1 for rate in sample_rates.values()):
+            raise ValueError(f"sample rates should be between 0 and 1, not {sample_rates}")
+        self._emit = emit
+        self._bucket = TokenBucket(rate_limit, rate_burst) if rate_limit else None
+        self._call_site_rate_limit = call_site_rate_limit
+        self._rate_burst = rate_burst
+        self._call_site_buckets = {}
+        self._sample_rates = dict(sample_rates or {})
+        self._dedup_window = dedup_window
+        # (level, msg) -> [window end, number of repeats, frame fields of the written record]
+        self._dedup_entries = {}
+        self._next_sweep = 0
+        self._lock = threading.Lock()
+        self.stats = {'deduplicated': 0, 'sampled_out': 0, 'rate_limited': 0}
+
+    @property
+    def need_call_site(self) -> bool:
+        return bool(self._call_site_rate_limit)
+
+    def allow(self, level: int, msg: str, call_site=None) -> bool:
+        now = time.monotonic()
+        summaries = []
+        with self._lock:
+            if self._dedup_window and now >= self._next_sweep:
+                summaries = self._sweep(now)
+            allowed = self._decide(level, msg, now, call_site, summaries)
+        if summaries:
+            self._emit_summaries(summaries)
+        return allowed
+
+    def _decide(self, level, msg, now, call_site, summaries) -> bool:
+        if self._dedup_window:
+            key = (level, msg)
+            entry = self._dedup_entries.get(key)
+            if entry is not None and now < entry[0]:
+                entry[1] += 1
+                self.stats['deduplicated'] += 1
+                return False
+            # the window ended but was not swept yet
+            if entry is not None:
+                del self._dedup_entries[key]
+                if entry[1]:
+                    summaries.append((key, entry[1], entry[2]))
+
+        sample_rate = self._sample_rates.get(level)
+        if sample_rate is not None and random.random() >= sample_rate:
+            self.stats['sampled_out'] += 1
+            return False
+
+        if self._call_site_rate_limit:
+            bucket = self._call_site_buckets.get(call_site)
+            if bucket is None:
+                bucket = self._call_site_buckets[call_site] = TokenBucket(self._call_site_rate_limit,
+                                                                          self._rate_burst)
+            if not bucket.consume(now):
+                self.stats['rate_limited'] += 1
+                return False
+
+        if self._bucket is not None and not self._bucket.consume(now):
+            self.stats['rate_limited'] += 1
+            return False
+
+        # only a written record opens a dedup window
+        if self._dedup_window:
+            self._dedup_entries[(level, msg)] = [now + self._dedup_window, 0, None]
+        return True
+
+    def set_call_site(self, level: int, msg: str, call_site: dict):
+        """Keep the frame fields of a written record for the summary of its dedup window."""
+        with self._lock:
+            entry = self._dedup_entries.get((level, msg))
+            if entry is not None:
+                entry[2] = call_site
+
+    def _sweep(self, now, force=False) -> list:
+        # close the expired dedup windows, a window with repeats becomes a summary record
+        summaries = []
+        for key, (window_end, count, call_site) in list(self._dedup_entries.items()):
+            if force or now >= window_end:
+                del self._dedup_entries[key]
+                if count:
+                    summaries.append((key, count, call_site))
+        self._next_sweep = now + self._dedup_window / 2
+        return summaries
+
+    def _emit_summaries(self, summaries):
+        for (level, msg), count, call_site in summaries:
+            self._emit(level, f'{msg} [repeated {count} times in {self._dedup_window}s]', call_site)
+
+    def flush(self):
+        """Write the repeat counts of all open dedup windows."""
+        if not self._dedup_window:
+            return
+        with self._lock:
+            summaries = self._sweep(time.monotonic(), force=True)
+        self._emit_summaries(summaries)
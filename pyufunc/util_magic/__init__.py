@@ -6,27 +6,47 @@
 ##############################################################
 
 
-from ._google_numpy_docstring import (show_docstring_headers,
-                                      show_docstring_google,
-                                      show_docstring_numpy
-                                      )
+from typing import TYPE_CHECKING
+from pyufunc.pkg_func_index import lazy_module
 
-from ._password_generator import generate_password
+# the public names are imported on first access, see pyufunc.pkg_func_index
+if TYPE_CHECKING:
+    from ._google_numpy_docstring import (show_docstring_headers,
+                                          show_docstring_google,
+                                          show_docstring_numpy
+                                          )
 
-from ._import_package import (
-    import_package,
-    is_module_importable,
-    get_user_defined_func,
-    get_user_defined_module,
-    get_user_imported_module,
-    is_user_defined_func)
+    from ._password_generator import generate_password
 
-from ._dependency_requires_decorator import requires
-from ._func_time_decorator import func_running_time, func_time
-from ._run_parallel_decorator import run_parallel
-from ._end_of_life_decorator import end_of_life
-from ._count_code_size import count_lines_of_code
-from ._time_out import timeout, timeout_linux
+    from ._import_package import (
+        import_package,
+        is_module_importable,
+        get_user_defined_func,
+        get_user_defined_module,
+        get_user_imported_module,
+        is_user_defined_func)
+
+    from ._dependency_requires_decorator import requires
+    from ._func_time_decorator import (func_running_time,
+                                       func_time,
+                                       get_func_time_stats,
+                                       export_func_time_stats,
+                                       reset_func_time_stats)
+    from ._profiling import (profile_func,
+                             profile_block,
+                             get_profile_stacks,
+                             get_profile_pstats,
+                             export_collapsed_stacks,
+                             reset_profile_stats)
+    from ._memoize import memoize, memoize_key
+    from ._retry import retry, RetryBudget, CircuitBreaker, CircuitOpenError
+    from ._run_parallel_decorator import run_parallel
+    from ._worker_pool import WorkerPool, get_shared
+    from ._parallel_array_map import parallel_array_map
+    from ._end_of_life_decorator import end_of_life
+    from ._count_code_size import count_lines_of_code
+    from ._time_out import timeout, timeout_linux
+    from ._timeout_executor import TimeoutExecutor, timeout_process
 
 
 __all__ = [
@@ -52,10 +72,38 @@ __all__ = [
     # _decorator_func_time
     "func_running_time",
     "func_time",
+    "get_func_time_stats",
+    "export_func_time_stats",
+    "reset_func_time_stats",
+
+    # _profiling
+    "profile_func",
+    "profile_block",
+    "get_profile_stacks",
+    "get_profile_pstats",
+    "export_collapsed_stacks",
+    "reset_profile_stats",
+
+    # _memoize
+    "memoize",
+    "memoize_key",
+
+    # _retry
+    "retry",
+    "RetryBudget",
+    "CircuitBreaker",
+    "CircuitOpenError",
 
     # _decorator_run_parallel
     "run_parallel",
 
+    # _worker_pool
+    "WorkerPool",
+    "get_shared",
+
+    # _parallel_array_map
+    "parallel_array_map",
+
     # _decorator_end_of_life
     "end_of_life",
 
@@ -65,4 +113,10 @@ __all__ = [
     # _time_out
     "timeout",
     "timeout_linux",
+
+    # _timeout_executor
+    "TimeoutExecutor",
+    "timeout_process",
 ]
+
+__getattr__, __dir__ = lazy_module(__name__)
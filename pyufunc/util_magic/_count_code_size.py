@@ -1,11 +1,34 @@
 
 import os
 from pathlib import Path
-import contextlib
 from pyufunc.util_pathio._path import path2linux
+from pyufunc.util_pathio._walk import walk_dir
 import warnings
 from typing import Union
 
+_READ_BUFFER_SIZE = 1024 * 1024
+
+
+def _count_lines_in_file(file_path: str) -> int:
+    """Count the newline bytes in chunks, plus the last line without a newline.
+
+    Binary files, detected by a NUL byte in the first chunk as git does, and unreadable files count 0.
+    """
+    count = 0
+    last_byte = b"\n"
+    try:
+        with open(file_path, "rb") as f:
+            chunk = f.read(_READ_BUFFER_SIZE)
+            if b"\0" in chunk:
+                return 0
+            while chunk:
+                count += chunk.count(b"\n")
+                last_byte = chunk[-1:]
+                chunk = f.read(_READ_BUFFER_SIZE)
+    except OSError:
+        return 0
+    return count + (last_byte != b"\n")
+
 
 def count_lines_of_code(package_path: Union[str, Path], *, ext: str = "*", verbose: bool = False) -> int:
 
@@ -65,21 +88,15 @@ def count_lines_of_code(package_path: Union[str, Path], *, ext: str = "*", verbo
 
     if is_file:
         if ext == "*" or package_path.endswith(ext):
-            with open(package_path, "r") as f:
-                with contextlib.suppress(Exception):
-                    count += len(f.readlines())
+            count += _count_lines_in_file(package_path)
         else:
             print(f"Package path '{package_path}' does not have the extension '{ext}'.")
 
         return count
 
     if is_dir:
-        for root, directories, filenames in os.walk(package_path):
-            for filename in filenames:
-                if ext == "*" or (ext != "*" and filename.endswith(ext)):
-                    with open(os.path.join(root, filename), "r") as f:
-                        with contextlib.suppress(Exception):
-                            count += len(f.readlines())
+        for entry in walk_dir(package_path, None if ext == "*" else ext):
+            count += _count_lines_in_file(entry.path)
         return count
 
     return count
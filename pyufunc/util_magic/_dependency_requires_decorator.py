@@ -9,6 +9,8 @@
 
 from __future__ import absolute_import
 import copy
+import functools
+import inspect
 from pyufunc.util_magic._import_package import (is_module_importable,
                                                 import_package)
 
@@ -38,6 +40,9 @@ def requires(*args, **kwargs) -> object:
     Note:
         user can parse the verbose and auto_install options to control the behavior of the decorator.
 
+        The dependencies of a function are checked at its first call, not when it is decorated,
+        and the checks are cached for the whole process, see is_module_importable.
+
         verbose: print the error message if the dependencies are not available. Default is True.
 
         auto_install: install the missing dependencies automatically. Default is True.
@@ -102,7 +107,7 @@ def requires(*args, **kwargs) -> object:
         else:
             raise ValueError("The input arguments should be strings or tuple with two elements.")
 
-    def inner(function):
+    def resolve(function):
         # check if the dependencies are available
         available = [is_module_importable(arg) for arg in arg_import_name]
         if all(available):
@@ -138,4 +143,20 @@ def requires(*args, **kwargs) -> object:
 
         return passer
 
+    def inner(function):
+        # a class is checked right away, to stay a class
+        if inspect.isclass(function):
+            return resolve(function)
+
+        resolved = []
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            # check the dependencies at the first call
+            if not resolved:
+                resolved.append(resolve(function))
+            return resolved[0](*args, **kwargs)
+
+        return wrapper
+
     return inner
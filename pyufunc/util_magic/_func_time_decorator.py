@@ -6,8 +6,118 @@
 ##############################################################
 
 from __future__ import absolute_import
-import datetime
+import atexit
+import json
+import math
+import threading
+import time
 from functools import wraps
+from pyufunc.pkg_configs import config_func_time, config_profile
+from pyufunc.util_magic._profiling import _ProfileRegion, is_profile_selected
+
+_PRINT_MODES = ("off", "call", "summary")
+
+
+class _QuantileSketch:
+    """A log-bucketed histogram of positive values with 1% relative error on quantiles.
+
+    Values within a factor of gamma share a bucket, so the memory only grows with the
+    range of the values (about 1,400 buckets between 1 ns and 1 hour), not their count.
+    """
+
+    __slots__ = ("_buckets", "_count")
+
+    _RELATIVE_ACCURACY = 0.01
+    _GAMMA = (1 + _RELATIVE_ACCURACY) / (1 - _RELATIVE_ACCURACY)
+    _LOG_GAMMA = math.log(_GAMMA)
+
+    def __init__(self):
+        self._buckets = {}
+        self._count = 0
+
+    def add(self, value: float):
+        index = math.ceil(math.log(value) / self._LOG_GAMMA) if value > 0 else None
+        self._buckets[index] = self._buckets.get(index, 0) + 1
+        self._count += 1
+
+    def quantile(self, q: float) -> float:
+        if not self._count:
+            return 0.0
+        # nearest-rank quantile
+        rank = max(math.ceil(q * self._count), 1)
+        num_seen = 0
+        # the zero bucket comes first
+        for index in sorted(self._buckets, key=lambda i: -math.inf if i is None else i):
+            num_seen += self._buckets[index]
+            if num_seen >= rank:
+                return 0.0 if index is None else 2 * self._GAMMA ** index / (self._GAMMA + 1)
+        return 0.0
+
+
+class _FuncTimeStats:
+    __slots__ = ("count", "total_ns", "min_ns", "max_ns", "sketch")
+
+    def __init__(self):
+        self.count = 0
+        self.total_ns = 0
+        self.min_ns = math.inf
+        self.max_ns = 0
+        self.sketch = _QuantileSketch()
+
+    def add(self, elapsed_ns: int):
+        self.count += 1
+        self.total_ns += elapsed_ns
+        self.min_ns = min(self.min_ns, elapsed_ns)
+        self.max_ns = max(self.max_ns, elapsed_ns)
+        self.sketch.add(elapsed_ns)
+
+    def to_dict(self) -> dict:
+        return {
+            "count": self.count,
+            "total_s": self.total_ns / 1e9,
+            "mean_s": self.total_ns / self.count / 1e9 if self.count else 0.0,
+            "min_s": self.min_ns / 1e9 if self.count else 0.0,
+            "max_s": self.max_ns / 1e9,
+            "p50_s": self.sketch.quantile(0.5) / 1e9,
+            "p95_s": self.sketch.quantile(0.95) / 1e9,
+            "p99_s": self.sketch.quantile(0.99) / 1e9,
+        }
+
+
+# the timing stats of all decorated functions in the current process, by qualified function name
+_FUNC_TIME_REGISTRY = {}
+_FUNC_TIME_LOCK = threading.Lock()
+
+
+def _record_func_time(name: str, elapsed_ns: int):
+    with _FUNC_TIME_LOCK:
+        stats = _FUNC_TIME_REGISTRY.get(name)
+        if stats is None:
+            stats = _FUNC_TIME_REGISTRY[name] = _FuncTimeStats()
+        stats.add(elapsed_ns)
+
+
+def _timed(func: object) -> object:
+    name = f"{func.__module__}.{func.__qualname__}"
+
+    @wraps(func)
+    def inner(*args, **kwargs):
+        # print(f'  :INFO: begin to run function: {func.__name__} …')
+        time_start = time.perf_counter_ns()
+        try:
+            if config_profile["funcs"] and is_profile_selected(func.__name__, name):
+                with _ProfileRegion():
+                    res = func(*args, **kwargs)
+            else:
+                res = func(*args, **kwargs)
+        finally:
+            time_diff = time.perf_counter_ns() - time_start
+            _record_func_time(name, time_diff)
+        if config_func_time["print_mode"] == "call":
+            print(f'  :INFO: finished function: {func.__name__}, total: {time_diff / 1e9:.6f}s \n')
+        return res
+
+    return inner
 
 
 # decorator without arguments
@@ -19,6 +129,11 @@ def func_running_time(func: object) -> object:
         It's equivalent to the func_time as func_running_time have been used in many packages,
         and we keep both of them for compatibility.
 
+        Every call is recorded in a registry of the current process, see get_func_time_stats.
+        Printing is set by config_func_time["print_mode"] or the environment variable
+        PYUFUNC_FUNC_TIME_PRINT: "off", "call" (default) or "summary" at exit.
+        The function is profiled if its name matches PYUFUNC_PROFILE, see profile_func.
+
     Location:
         The function defined in pyufunc.util_common._func_time_decorator.py.
 
@@ -36,22 +151,10 @@ def func_running_time(func: object) -> object:
                 return
 
         >>> func()
-            INFO Begin to run function: func …
             main function...
-            INFO Finished running function: func, total: 3s
+            :INFO: finished function: func, total: 3.000512s
     """
-
-    @wraps(func)
-    def inner(*args, **kwargs):
-        # print(f'  :INFO: begin to run function: {func.__name__} …')
-        time_start = datetime.datetime.now()
-        res = func(*args, **kwargs)
-        time_diff = datetime.datetime.now() - time_start
-        print(
-            f'  :INFO: finished function: {func.__name__}, total: {time_diff.seconds}s \n')
-        return res
-
-    return inner
+    return _timed(func)
 
 
 def func_time(func: object) -> object:
@@ -62,6 +165,11 @@ def func_time(func: object) -> object:
         It's equivalent to the func_running_time as func_running_time have been used in many packages.
         We keep both of them for compatibility.
 
+        Every call is recorded in a registry of the current process, see get_func_time_stats.
+        Printing is set by config_func_time["print_mode"] or the environment variable
+        PYUFUNC_FUNC_TIME_PRINT: "off", "call" (default) or "summary" at exit.
+        The function is profiled if its name matches PYUFUNC_PROFILE, see profile_func.
+
     Location:
         The function defined in pyufunc.util_common._func_time_decorator.py.
 
@@ -79,19 +187,71 @@ def func_time(func: object) -> object:
                 return
 
         >>> func()
-            INFO Begin to run function: func …
             main function...
-            INFO Finished running function: func, total: 3s
+            :INFO: finished function: func, total: 3.000512s
     """
+    return _timed(func)
 
-    @wraps(func)
-    def inner(*args, **kwargs):
-        # print(f'  :INFO: begin to run function: {func.__name__} …')
-        time_start = datetime.datetime.now()
-        res = func(*args, **kwargs)
-        time_diff = datetime.datetime.now() - time_start
-        print(
-            f'  :INFO: finished function: {func.__name__}, total: {time_diff.seconds}s \n')
-        return res
 
-    return inner
+def get_func_time_stats(func_name: str = None) -> dict:
+    """Get the timing stats recorded by func_time and func_running_time in the current process.
+
+    Args:
+        func_name (str, optional): the qualified name of a function, e.g. "my_module.my_func".
+            Defaults to None, return the stats of all functions.
+
+    Returns:
+        dict: {func_name: {count, total_s, mean_s, min_s, max_s, p50_s, p95_s, p99_s}},
+            or the stats of func_name only. The quantiles have a relative error of 1%.
+
+    Examples:
+        >>> from pyufunc import func_time, get_func_time_stats
+        >>> get_func_time_stats()["__main__.my_func"]["p99_s"]
+        0.0123
+    """
+    with _FUNC_TIME_LOCK:
+        if func_name is not None:
+            if func_name not in _FUNC_TIME_REGISTRY:
+                raise KeyError(f"No timing stats for {func_name}, available: {list(_FUNC_TIME_REGISTRY)}")
+            return _FUNC_TIME_REGISTRY[func_name].to_dict()
+        return {name: stats.to_dict() for name, stats in _FUNC_TIME_REGISTRY.items()}
+
+
+def export_func_time_stats(path: str = None, indent: int = 2) -> str:
+    """Export the timing stats of all functions as JSON.
+
+    Args:
+        path (str, optional): write the JSON to this file as well. Defaults to None.
+        indent (int, optional): JSON indent. Defaults to 2.
+
+    Returns:
+        str: the JSON string.
+    """
+    json_str = json.dumps(get_func_time_stats(), indent=indent)
+    if path:
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(json_str)
+    return json_str
+
+
+def reset_func_time_stats():
+    """Clear the timing stats of all functions."""
+    with _FUNC_TIME_LOCK:
+        _FUNC_TIME_REGISTRY.clear()
+
+
+def _print_func_time_summary():
+    if config_func_time["print_mode"] != "summary" or not _FUNC_TIME_REGISTRY:
+        return
+    print("  :INFO: func_time summary (seconds):")
+    print(f"  {'function':<48} {'count':>9} {'total':>10} {'mean':>10} {'p50':>10} {'p95':>10} {'p99':>10}")
+    for name, stats in sorted(get_func_time_stats().items(), key=lambda item: -item[1]["total_s"]):
+        print(f"  {name:<48} {stats['count']:>9} {stats['total_s']:>10.4f} {stats['mean_s']:>10.6f} "
+              f"{stats['p50_s']:>10.6f} {stats['p95_s']:>10.6f} {stats['p99_s']:>10.6f}")
+
+
+if config_func_time["print_mode"] not in _PRINT_MODES:
+    print(f"  :Info: unknown func_time print mode {config_func_time['print_mode']}, "
+          f"should be one of {_PRINT_MODES}.")
+
+atexit.register(_print_func_time_summary)
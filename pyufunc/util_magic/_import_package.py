@@ -7,6 +7,7 @@
 
 from __future__ import absolute_import
 import importlib
+import importlib.util
 import subprocess
 import sys
 import inspect
@@ -16,6 +17,11 @@ import pathlib
 from collections import defaultdict
 from pyufunc.util_data_processing._str import str_strip
 
+# process-wide dependency caches: {import name: module} of imported packages,
+# {import name: bool} of find_spec results
+_IMPORTED_MODULES = {}
+_FIND_SPEC_CACHE = {}
+
 
 def import_package(pkg_name: Union[str, tuple, list],
                    options: list = ["--user"],
@@ -79,6 +85,16 @@ def import_package(pkg_name: Union[str, tuple, list],
         >>> cv2 = import_package(["opencv-python==4.9.0.80", "cv2"])
     """
 
+    # fast path: a package imported before is a dict lookup
+    if isinstance(pkg_name, str):
+        module = _IMPORTED_MODULES.get(pkg_name)
+    elif isinstance(pkg_name, (tuple, list)) and len(pkg_name) == 2:
+        module = _IMPORTED_MODULES.get(pkg_name[1])
+    else:
+        module = None
+    if module is not None:
+        return module
+
     # TDD, test-driven development: check inputs
     assert isinstance(pkg_name, (str, tuple, list)), "The input pkg_name should be a string or tuple or list."
 
@@ -115,6 +131,9 @@ def import_package(pkg_name: Union[str, tuple, list],
             outputs.extend((stdout, stderr))
 
             result.check_returncode()
+            # the new package is not found with the stale finder caches
+            importlib.invalidate_caches()
+            _FIND_SPEC_CACHE.pop(import_name, None)
 
         # if install failed, print the error message
         except Exception as e:
@@ -139,6 +158,7 @@ def import_package(pkg_name: Union[str, tuple, list],
             print(f"  :Info: failed to import {module_name}.")
             return None
 
+    _IMPORTED_MODULES[import_name] = module
     return module
 
 
@@ -221,6 +241,9 @@ def is_module_importable(module_name: str) -> bool:
     Note:
         This function is useful to check if a module is installed in the current environment.
 
+        The module is looked up by importlib.util.find_spec without importing it,
+        and the result is cached for the whole process.
+
     Examples:
         >>> from pyufunc import is_module_importable
         >>> is_module_importable("numpy")
@@ -232,11 +255,17 @@ def is_module_importable(module_name: str) -> bool:
     # TDD, test-driven development: check inputs
     assert isinstance(module_name, str), "The input module name should be a string."
 
-    try:
-        exec(f"import {module_name}")
-        is_importable = True
-    except ImportError:
-        is_importable = False
+    is_importable = _FIND_SPEC_CACHE.get(module_name)
+    if is_importable is None:
+        if module_name in sys.modules:
+            is_importable = sys.modules[module_name] is not None
+        else:
+            try:
+                is_importable = importlib.util.find_spec(module_name) is not None
+            except (ImportError, ValueError):
+                # the parent package of a dotted name is missing, or its __spec__ is not set
+                is_importable = False
+        _FIND_SPEC_CACHE[module_name] = is_importable
 
     return is_importable
 
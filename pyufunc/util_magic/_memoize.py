@@ -0,0 +1,240 @@
+# -*- coding:utf-8 -*-
+##############################################################
+# Created Date: Monday, October 19th 2026
+# Contact Info: luoxiangyong01@gmail.com
+# Author/Copyright: Mr. Xiangyong Luo
+##############################################################
+
+
+from __future__ import absolute_import
+import contextlib
+import functools
+import hashlib
+import os
+import pickle
+import re
+import sys
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable, Union
+
+_KWARGS_MARK = ("__kwargs__",)
+
+
+def _digest(data: bytes) -> str:
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def _content_key(value):
+    """Convert a value into a hashable key, NumPy arrays, pandas objects and shapely geometries by content."""
+    if isinstance(value, (str, bytes, int, float, bool, type(None))):
+        return value
+    if isinstance(value, (tuple, list)):
+        return (type(value).__name__, *map(_content_key, value))
+    if isinstance(value, dict):
+        return ("dict", *sorted(((repr(k), _content_key(v)) for k, v in value.items())))
+    if isinstance(value, (set, frozenset)):
+        # the order of a set changes with the hash seed of each process
+        return ("set", *sorted(map(repr, map(_content_key, value))))
+
+    # the optional packages are only checked if they were already imported by the caller
+    np = sys.modules.get("numpy")
+    if np is not None and isinstance(value, np.ndarray):
+        if value.dtype.hasobject:
+            return ("ndarray", value.shape, *map(_content_key, value.ravel().tolist()))
+        return ("ndarray", value.dtype.str, value.shape, _digest(np.ascontiguousarray(value).data))
+    pd = sys.modules.get("pandas")
+    if pd is not None and isinstance(value, (pd.DataFrame, pd.Series, pd.Index)):
+        if isinstance(value, pd.DataFrame):
+            meta = (repr(value.dtypes), repr(value.columns))
+        else:
+            meta = (repr(value.dtype), repr(value.name))
+        return (type(value).__name__, value.shape, *meta,
+                _digest(pd.util.hash_pandas_object(value, index=True).values.tobytes()))
+    shapely = sys.modules.get("shapely")
+    if shapely is not None and isinstance(value, shapely.Geometry):
+        return ("geometry", _digest(value.wkb))
+
+    try:
+        hash(value)
+    except TypeError:
+        raise TypeError(f"The argument of type {type(value).__name__} is not hashable, "
+                        f"use key_func to build the cache key.") from None
+    return value
+
+
+def memoize_key(*args, **kwargs) -> tuple:
+    """The default key of memoize: the arguments, with NumPy arrays, pandas objects,
+    shapely geometries and containers of them converted to keys by content."""
+    key = tuple(map(_content_key, args))
+    if kwargs:
+        key += _KWARGS_MARK + tuple((k, _content_key(v)) for k, v in sorted(kwargs.items()))
+    return key
+
+
+def _disk_namespace(func: Callable) -> str:
+    """The folder name of a function, e.g. "<locals>" of nested functions is not allowed on Windows."""
+    name = f"{func.__module__}.{func.__qualname__}"
+    safe_name = re.sub(r"[^\w.-]", "_", name)
+    # the digest keeps the replaced names apart, e.g. "f.<locals>.g" and "f._locals_.g"
+    return safe_name if safe_name == name else f"{safe_name}-{_digest(name.encode('utf-8'))[:8]}"
+
+
+class _DiskTier:
+    """One pickle file per key, written to a temporary file and renamed, so concurrent processes
+    never read a partial entry, and a damaged entry is a miss."""
+
+    def __init__(self, cache_dir: Union[str, Path], namespace: str):
+        self.path = Path(cache_dir) / namespace
+        self.path.mkdir(parents=True, exist_ok=True)
+
+    def _file(self, key) -> Path:
+        return self.path / f"{_digest(pickle.dumps(key, protocol=4))}.pkl"
+
+    def get(self, key) -> tuple:
+        """Return (found, value, expires_at), expires_at is the time.time() of the expiry or None."""
+        path = self._file(key)
+        try:
+            with open(path, "rb") as f:
+                expires_at, value = pickle.load(f)
+        except FileNotFoundError:
+            return False, None, None
+        except Exception:
+            # written by another version, or damaged
+            with contextlib.suppress(OSError):
+                path.unlink()
+            return False, None, None
+        if expires_at is not None and expires_at <= time.time():
+            with contextlib.suppress(OSError):
+                path.unlink()
+            return False, None, None
+        return True, value, expires_at
+
+    def set(self, key, value, ttl: float):
+        expires_at = None if ttl is None else time.time() + ttl
+        fd, tmp_path = tempfile.mkstemp(dir=self.path, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump((expires_at, value), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self._file(key))
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.remove(tmp_path)
+            raise
+
+    def clear(self):
+        for path in self.path.glob("*.pkl"):
+            with contextlib.suppress(OSError):
+                path.unlink()
+
+
+def memoize(func: Callable = None,
+            *,
+            maxsize: int = 128,
+            ttl: float = None,
+            key_func: Callable = None,
+            cache_dir: Union[str, Path] = None) -> Callable:
+    """A decorator to cache the results of a pure function, with LRU and TTL eviction
+    and an optional cache on disk shared by processes.
+
+    Args:
+        func (Callable): the function to be cached.
+        maxsize (int, optional): the number of results kept in memory, the least recently used go first.
+            Defaults to 128, None for no limit.
+        ttl (float, optional): seconds a result stays valid, in memory and on disk. Defaults to None, no expiry.
+        key_func (Callable, optional): build the cache key from the arguments of a call.
+            Defaults to None, memoize_key, which hashes NumPy arrays, pandas objects and shapely geometries by content.
+        cache_dir (str | Path, optional): also keep the results as pickle files in
+            cache_dir/<module>.<function>, reused by other processes and later runs. The characters not allowed
+            in file names, e.g. "<locals>" of nested functions, are replaced. Defaults to None.
+
+    Raises:
+        ValueError: if maxsize or ttl is not greater than 0.
+        TypeError: if key_func is not callable, or at a call with an unhashable argument.
+
+    Returns:
+        Callable: the decorated function, with cache_info() returning the hit/miss statistics
+            and cache_clear(disk=False) emptying the cache.
+
+    Note:
+        Exceptions are not cached. Concurrent calls with the same key may both run the function.
+        With cache_dir, the key and the result should be picklable.
+
+    Examples:
+        >>> from pyufunc import memoize
+        >>> @memoize(maxsize=1024, ttl=3600, cache_dir=".pyufunc_cache")
+            def geocode(address: str) -> tuple:
+                ...
+        >>> geocode("1 Main St"); geocode("1 Main St")
+        >>> geocode.cache_info()
+        {'hits': 1, 'misses': 1, 'disk_hits': 0, 'maxsize': 1024, 'currsize': 1}
+    """
+    if maxsize is not None and maxsize <= 0:
+        raise ValueError("The input maxsize should be greater than 0.")
+    if ttl is not None and ttl <= 0:
+        raise ValueError("The input ttl should be greater than 0.")
+    if key_func is not None and not callable(key_func):
+        raise TypeError("The input key_func should be a callable.")
+
+    def decorator(func):
+        make_key = key_func or memoize_key
+        cache = OrderedDict()
+        lock = threading.Lock()
+        stats = {"hits": 0, "misses": 0, "disk_hits": 0}
+        disk_tier = None if cache_dir is None else _DiskTier(cache_dir, _disk_namespace(func))
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = make_key(*args, **kwargs)
+            with lock:
+                entry = cache.get(key)
+                if entry is not None:
+                    value, expires_at = entry
+                    if expires_at is None or expires_at > time.monotonic():
+                        cache.move_to_end(key)
+                        stats["hits"] += 1
+                        return value
+                    del cache[key]
+
+            found, expires_at = False, None
+            if disk_tier is not None:
+                found, value, disk_expires_at = disk_tier.get(key)
+                if found and disk_expires_at is not None:
+                    # the remaining lifetime of the entry on disk, not a new ttl
+                    expires_at = time.monotonic() + disk_expires_at - time.time()
+            if not found:
+                value = func(*args, **kwargs)
+                if disk_tier is not None:
+                    disk_tier.set(key, value, ttl)
+                if ttl is not None:
+                    expires_at = time.monotonic() + ttl
+
+            with lock:
+                stats["disk_hits" if found else "misses"] += 1
+                cache[key] = (value, expires_at)
+                cache.move_to_end(key)
+                if maxsize is not None and len(cache) > maxsize:
+                    cache.popitem(last=False)
+            return value
+
+        def cache_info() -> dict:
+            with lock:
+                return {**stats, "maxsize": maxsize, "currsize": len(cache)}
+
+        def cache_clear(disk: bool = False):
+            with lock:
+                cache.clear()
+                stats.update(hits=0, misses=0, disk_hits=0)
+            if disk and disk_tier is not None:
+                disk_tier.clear()
+
+        wrapper.cache_info = cache_info
+        wrapper.cache_clear = cache_clear
+        return wrapper
+
+    if func is not None:
+        return decorator(func)
+    return decorator
@@ -0,0 +1,154 @@
+# -*- coding:utf-8 -*-
+##############################################################
+# Created Date: Monday, October 19th 2026
+# Contact Info: luoxiangyong01@gmail.com
+# Author/Copyright: Mr. Xiangyong Luo
+##############################################################
+
+
+from __future__ import absolute_import
+import multiprocessing
+import os
+from concurrent.futures import FIRST_EXCEPTION, ProcessPoolExecutor, wait
+from multiprocessing import shared_memory
+from typing import Callable, TYPE_CHECKING
+from pyufunc.util_magic._dependency_requires_decorator import requires
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+def _alloc_shared(np, shape: tuple, dtype, arr=None) -> tuple:
+    """Allocate an array in shared memory, filled with arr if given."""
+    dtype = np.dtype(dtype)
+    # a zero-size block is not allowed, the array is rebuilt from its shape and dtype
+    shm = shared_memory.SharedMemory(create=True, size=max(int(np.prod(shape)) * dtype.itemsize, 1))
+    if arr is not None:
+        np.ndarray(shape, dtype=dtype, buffer=shm.buf)[...] = arr
+    return shm, (shm.name, shape, dtype.str)
+
+
+def _map_range(func: Callable, in_specs: list, out_spec: tuple, start: int, stop: int) -> int:
+    """Run func on rows [start, stop) of the shared inputs and write the result in place."""
+    import numpy as np
+
+    shm_list = [shared_memory.SharedMemory(name=spec[0]) for spec in (*in_specs, out_spec)]
+    try:
+        inputs = [np.ndarray(spec[1], dtype=spec[2], buffer=shm.buf)[start:stop]
+                  for spec, shm in zip(in_specs, shm_list)]
+        for arr in inputs:
+            arr.flags.writeable = False
+        out = np.ndarray(out_spec[1], dtype=out_spec[2], buffer=shm_list[-1].buf)
+        out[start:stop] = func(*inputs)
+        # the views have to be released before the shared memory is closed
+        del inputs, out
+    finally:
+        for shm in shm_list:
+            shm.close()
+    return stop - start
+
+
+@requires("numpy", verbose=False)
+def parallel_array_map(func: Callable,
+                       arrays,
+                       num_processes: int = None,
+                       num_chunks: int = None,
+                       pool=None,
+                       start_method: str = None) -> "np.ndarray":
+    """Apply a vectorized kernel to large NumPy arrays in parallel without pickling the data.
+
+    The input arrays are copied once into shared memory and the output is allocated in shared memory.
+    Each worker only receives an index range along the first axis, reads its rows of the inputs
+    without copying and writes the rows of the result in place.
+
+    Args:
+        func (callable): a vectorized kernel taking the rows of each input array and returning the rows
+            of the output, e.g. calc_distance_on_unit_haversine. It is called once in the caller on the
+            first row to infer the shape and dtype of the output, and should be picklable.
+        arrays (np.ndarray | tuple | list): one input array, or several arrays with the same length.
+        num_processes (int, optional): the number of processes. Defaults to os.cpu_count().
+        num_chunks (int, optional): the number of index ranges. Defaults to 4 * num_processes.
+        pool (WorkerPool, optional): run in the workers of a long-lived WorkerPool. Defaults to None.
+        start_method (str, optional): start method of a new process pool. Defaults to the multiprocessing default.
+
+    Raises:
+        TypeError: if func is not callable or the inputs are not NumPy arrays.
+        ValueError: if the input arrays do not have the same length, or num_processes or num_chunks
+            are not greater than 0.
+
+    Returns:
+        np.ndarray: the output array, with the same length as the inputs.
+
+    Examples:
+        >>> import numpy as np
+        >>> from pyufunc import parallel_array_map, calc_distance_on_unit_haversine
+        >>> lon1, lat1, lon2, lat2 = np.random.uniform(-90, 90, (4, 10 ** 8))
+        >>> dist_km = parallel_array_map(calc_distance_on_unit_haversine, (lon1, lat1, lon2, lat2))
+    """
+    import numpy as np
+
+    # TDD: check the inputs
+    if not callable(func):
+        raise TypeError("The input func should be a callable.")
+    if isinstance(arrays, np.ndarray):
+        arrays = (arrays,)
+    if not isinstance(arrays, (tuple, list)) or not arrays or \
+            not all(isinstance(arr, np.ndarray) and arr.ndim >= 1 for arr in arrays):
+        raise TypeError("The input arrays should be a NumPy array or a tuple of NumPy arrays.")
+    num_rows = len(arrays[0])
+    if any(len(arr) != num_rows for arr in arrays):
+        raise ValueError("The input arrays should have the same length.")
+    if pool is not None:
+        num_processes = pool.num_processes
+    if num_processes is None:
+        num_processes = os.cpu_count() or 1
+    if num_processes <= 0:
+        raise ValueError("The input number of processors should be greater than 0.")
+    if num_chunks is None:
+        num_chunks = 4 * num_processes
+    if num_chunks <= 0:
+        raise ValueError("The input num_chunks should be greater than 0.")
+
+    # infer the output from the first row, the rows of an empty input give an empty output
+    sample = np.asarray(func(*[arr[:1] for arr in arrays]))
+    out_shape = (num_rows, *sample.shape[1:])
+    if num_rows == 0:
+        return np.empty(out_shape, dtype=sample.dtype)
+
+    num_chunks = min(num_chunks, num_rows)
+    bounds = np.linspace(0, num_rows, num_chunks + 1).astype(int)
+
+    shm_list = []
+    executor = None
+    try:
+        in_specs = []
+        for arr in arrays:
+            shm, spec = _alloc_shared(np, arr.shape, arr.dtype, arr)
+            shm_list.append(shm)
+            in_specs.append(spec)
+        out_shm, out_spec = _alloc_shared(np, out_shape, sample.dtype)
+        shm_list.append(out_shm)
+
+        if pool is not None:
+            submit = pool.submit
+        else:
+            executor = ProcessPoolExecutor(min(num_processes, num_chunks),
+                                           mp_context=multiprocessing.get_context(start_method))
+            submit = executor.submit
+        futures = [submit(_map_range, func, in_specs, out_spec, int(start), int(stop))
+                   for start, stop in zip(bounds[:-1], bounds[1:])]
+        done, not_done = wait(futures, return_when=FIRST_EXCEPTION)
+        for fut in not_done:
+            fut.cancel()
+        for fut in done:
+            # the exception raised by func is re-raised here
+            fut.result()
+
+        # one copy out of the shared memory, which is freed below
+        return np.ndarray(out_shape, dtype=sample.dtype, buffer=out_shm.buf).copy()
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+        for shm in shm_list:
+            shm.close()
+            shm.unlink()
@@ -0,0 +1,360 @@
+# -*- coding:utf-8 -*-
+##############################################################
+# Created Date: Monday, October 19th 2026
+# Contact Info: luoxiangyong01@gmail.com
+# Author/Copyright: Mr. Xiangyong Luo
+##############################################################
+
+
+from __future__ import absolute_import
+import cProfile
+import fnmatch
+import glob
+import os
+import pstats
+import sys
+import threading
+import time
+from collections import Counter
+from contextlib import ContextDecorator
+from multiprocessing import util as mp_util
+from typing import Callable
+from pyufunc.pkg_configs import config_profile
+
+_PROFILE_MODES = ("sample", "cprofile")
+
+# all processes started by the same program (e.g. the workers of run_parallel) share the run id,
+# which is the pid of the root process, so their profiles can be merged. The forked workers inherit it,
+# it is passed to the other workers by the environment once the profiles are saved at exit
+_RUN_ID = os.environ.get("PYUFUNC_PROFILE_RUN") or str(os.getpid())
+
+# the profiles of the current process
+_STACKS = Counter()
+_PSTATS = [None]
+
+# {thread ident: [depth, root frame, label]} of the threads inside a sampled region
+_ACTIVE = {}
+_COND = threading.Condition()
+_SAMPLER = [None]
+_TLS = threading.local()
+_FINALIZER_PID = [None]
+
+# {(function name, patterns): bool}
+_SELECTED = {}
+
+
+def _reset_after_fork():
+    # the child starts with empty profiles, the lock might be held by the sampler thread of the parent
+    global _COND, _TLS
+    _STACKS.clear()
+    _PSTATS[0] = None
+    _ACTIVE.clear()
+    _COND = threading.Condition()
+    _TLS = threading.local()
+    _SAMPLER[0] = None
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+def _frame_label(frame) -> str:
+    code = frame.f_code
+    return f"{frame.f_globals.get('__name__', '?')}:{getattr(code, 'co_qualname', code.co_name)}"
+
+
+def _collapse(frame, root, label: str) -> str:
+    """Collapse the frames from root (excluded) to frame into "a;b;c", outermost first."""
+    labels = []
+    while frame is not None and frame is not root:
+        labels.append(_frame_label(frame))
+        frame = frame.f_back
+    if label:
+        labels.append(label)
+    return ";".join(reversed(labels))
+
+
+def _sample_loop():
+    while True:
+        with _COND:
+            while not _ACTIVE:
+                _COND.wait()
+            active = list(_ACTIVE.items())
+        frames = sys._current_frames()
+        for ident, (_, root, label) in active:
+            frame = frames.get(ident)
+            if frame is not None:
+                stack = _collapse(frame, root, label)
+                if stack:
+                    _STACKS[stack] += 1
+        del frames, frame
+        time.sleep(config_profile["interval"])
+
+
+def _start_sampler():
+    if _SAMPLER[0] is None:
+        _SAMPLER[0] = threading.Thread(target=_sample_loop, name="pyufunc-profile-sampler", daemon=True)
+        _SAMPLER[0].start()
+
+
+def _is_dump_enabled() -> bool:
+    return bool(config_profile["funcs"] or config_profile["dump_at_exit"])
+
+
+def _register_dump():
+    # multiprocessing runs the finalizer at the exit of the main process and of its child processes,
+    # a low priority runs it after the child processes were joined
+    if _FINALIZER_PID[0] != os.getpid():
+        _FINALIZER_PID[0] = os.getpid()
+        os.environ.setdefault("PYUFUNC_PROFILE_RUN", _RUN_ID)
+        mp_util.Finalize(None, _dump_process_profile, exitpriority=-10)
+
+
+class _ProfileRegion(ContextDecorator):
+    """Profile the code inside the region, nested regions in the same thread are merged into the outermost."""
+
+    def __init__(self, label: str = None, mode: str = None):
+        mode = mode or config_profile["mode"]
+        if mode not in _PROFILE_MODES:
+            raise ValueError(f"The input mode should be one of {_PROFILE_MODES}, got {mode}.")
+        self.label = label
+        self.mode = mode
+
+    def __enter__(self):
+        if _is_dump_enabled():
+            _register_dump()
+        if self.mode == "sample":
+            _start_sampler()
+            ident = threading.get_ident()
+            with _COND:
+                entry = _ACTIVE.get(ident)
+                if entry is None:
+                    _ACTIVE[ident] = [1, sys._getframe(1), self.label]
+                    _COND.notify()
+                else:
+                    entry[0] += 1
+        else:
+            depth = getattr(_TLS, "depth", 0)
+            if depth == 0:
+                _TLS.profiler = cProfile.Profile()
+                try:
+                    _TLS.profiler.enable()
+                except ValueError:
+                    # another profiler is active in this thread
+                    _TLS.profiler = None
+            _TLS.depth = depth + 1
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if self.mode == "sample":
+            ident = threading.get_ident()
+            with _COND:
+                entry = _ACTIVE[ident]
+                entry[0] -= 1
+                if entry[0] == 0:
+                    del _ACTIVE[ident]
+        else:
+            _TLS.depth -= 1
+            if _TLS.depth == 0 and _TLS.profiler is not None:
+                _TLS.profiler.disable()
+                with _COND:
+                    if _PSTATS[0] is None:
+                        _PSTATS[0] = pstats.Stats(_TLS.profiler)
+                    else:
+                        _PSTATS[0].add(_TLS.profiler)
+                _TLS.profiler = None
+        return False
+
+
+def is_profile_selected(func_name: str, qual_name: str = "") -> bool:
+    """Check whether a function decorated by func_time or func_running_time is selected
+    by config_profile["funcs"] or the environment variable PYUFUNC_PROFILE."""
+    patterns = config_profile["funcs"]
+    key = (qual_name or func_name, patterns)
+    selected = _SELECTED.get(key)
+    if selected is None:
+        selected = _SELECTED[key] = any(
+            fnmatch.fnmatchcase(func_name, pat) or fnmatch.fnmatchcase(qual_name, pat)
+            for pat in (pat.strip() for pat in patterns.split(",")) if pat)
+    return selected
+
+
+def profile_block(name: str = "block", mode: str = None) -> ContextDecorator:
+    """Profile a block of code, or a function if used as a decorator.
+
+    Note:
+        The profiles are kept in memory, see get_profile_stacks and export_collapsed_stacks. They are
+        saved to config_profile["profile_dir"] at exit, and merged across processes, only if
+        config_profile["dump_at_exit"] (PYUFUNC_PROFILE_DUMP=1) or config_profile["funcs"] is set.
+
+    Args:
+        name (str, optional): the root of the collapsed stacks of the block. Defaults to "block".
+        mode (str, optional): "sample" for a statistical sampler with a low overhead, which samples
+            the stack of the thread every config_profile["interval"] seconds, or "cprofile" for the
+            deterministic cProfile. Defaults to config_profile["mode"].
+
+    Raises:
+        ValueError: if mode is not "sample" or "cprofile".
+
+    Returns:
+        ContextDecorator: a context manager.
+
+    Examples:
+        >>> from pyufunc import profile_block, export_collapsed_stacks
+        >>> with profile_block("load network"):
+                links = read_link("link.csv")
+        >>> export_collapsed_stacks("read_link.collapsed")  # flamegraph.pl read_link.collapsed > read_link.svg
+    """
+    return _ProfileRegion(name, mode)
+
+
+def profile_func(func: Callable = None, *, mode: str = None) -> Callable:
+    """A decorator to profile every call of a function, see profile_block.
+
+    Note:
+        Functions decorated by func_time or func_running_time, e.g. read_link, find_k_nearest_points
+        and group_dt_*, can be profiled without code changes by the environment variable PYUFUNC_PROFILE,
+        a comma separated list of function name patterns. The mode, sampling interval and output folder
+        are set by PYUFUNC_PROFILE_MODE, PYUFUNC_PROFILE_INTERVAL and PYUFUNC_PROFILE_DIR, and the profiles
+        of all processes are merged into the output folder at exit, e.g.
+
+        $ PYUFUNC_PROFILE="read_link,group_dt_*" python my_script.py
+
+    Args:
+        func (Callable): the function to be profiled.
+        mode (str, optional): "sample" or "cprofile". Defaults to config_profile["mode"].
+
+    Returns:
+        Callable: the decorated function.
+
+    Examples:
+        >>> from pyufunc import profile_func
+        >>> @profile_func(mode="cprofile")
+            def build_graph(links):
+                ...
+    """
+    if func is None:
+        return lambda f: _ProfileRegion(None, mode)(f)
+    return _ProfileRegion(None, mode)(func)
+
+
+def _worker_files(ext: str) -> list:
+    own_file = os.path.join(config_profile["profile_dir"], f"{_RUN_ID}-{os.getpid()}{ext}")
+    return [path for path in glob.glob(os.path.join(glob.escape(config_profile["profile_dir"]), f"{_RUN_ID}-*{ext}"))
+            if os.path.abspath(path) != os.path.abspath(own_file)]
+
+
+def _read_collapsed(path: str, stacks: Counter):
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            stack, _, count = line.rstrip("\n").rpartition(" ")
+            if stack:
+                stacks[stack] += int(count)
+
+
+def _write_collapsed(path: str, stacks: Counter) -> str:
+    collapsed = "".join(f"{stack} {count}\n" for stack, count in sorted(stacks.items()))
+    if path:
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(collapsed)
+    return collapsed
+
+
+def get_profile_stacks(include_workers: bool = True) -> dict:
+    """Get the stacks sampled by the profiler.
+
+    Args:
+        include_workers (bool, optional): also merge the stacks saved by the processes
+            which already exited, e.g. the workers of run_parallel. Defaults to True.
+
+    Returns:
+        dict: {"a;b;c": number of samples}, the frames are "module:function" and outermost first.
+    """
+    with _COND:
+        stacks = Counter(_STACKS)
+    if include_workers:
+        for path in _worker_files(".collapsed"):
+            _read_collapsed(path, stacks)
+    return dict(stacks)
+
+
+def get_profile_pstats(include_workers: bool = True) -> pstats.Stats:
+    """Get the cProfile stats, merged across processes as get_profile_stacks.
+
+    Returns:
+        pstats.Stats: the stats, or None if nothing was profiled in the cprofile mode.
+    """
+    with _COND:
+        stats = pstats.Stats().add(_PSTATS[0]) if _PSTATS[0] is not None else None
+    if include_workers:
+        for path in _worker_files(".pstats"):
+            if stats is None:
+                stats = pstats.Stats(path)
+            else:
+                stats.add(path)
+    return stats
+
+
+def export_collapsed_stacks(path: str = None, include_workers: bool = True) -> str:
+    """Export the sampled stacks in the collapsed format of flamegraph.pl and speedscope.
+
+    Args:
+        path (str, optional): write the stacks to this file as well. Defaults to None.
+        include_workers (bool, optional): merge the stacks of the exited processes. Defaults to True.
+
+    Returns:
+        str: one "a;b;c count" line per stack.
+    """
+    return _write_collapsed(path, Counter(get_profile_stacks(include_workers)))
+
+
+def reset_profile_stats():
+    """Clear the profiles of the current process."""
+    with _COND:
+        _STACKS.clear()
+        _PSTATS[0] = None
+
+
+def _dump_process_profile():
+    """Save the profiles of the current process, and merge the profiles of all processes in the root process."""
+    with _COND:
+        stacks = Counter(_STACKS)
+        stats = _PSTATS[0]
+    is_root = str(os.getpid()) == _RUN_ID
+    if not (stacks or stats or is_root):
+        return
+
+    profile_dir = config_profile["profile_dir"]
+    if not is_root:
+        os.makedirs(profile_dir, exist_ok=True)
+        if stacks:
+            _write_collapsed(os.path.join(profile_dir, f"{_RUN_ID}-{os.getpid()}.collapsed"), stacks)
+        if stats:
+            stats.dump_stats(os.path.join(profile_dir, f"{_RUN_ID}-{os.getpid()}.pstats"))
+        return
+
+    worker_files = _worker_files(".collapsed") + _worker_files(".pstats")
+    if not (stacks or stats or worker_files):
+        return
+    os.makedirs(profile_dir, exist_ok=True)
+    for ext in (".collapsed", ".pstats"):
+        out_path = os.path.join(profile_dir, f"profile-{_RUN_ID}{ext}")
+        if ext == ".collapsed":
+            merged = get_profile_stacks()
+            if merged:
+                _write_collapsed(out_path, Counter(merged))
+                print(f"  :Info: sampled stacks saved to {out_path}")
+        else:
+            merged = get_profile_pstats()
+            if merged is not None:
+                merged.dump_stats(out_path)
+                print(f"  :Info: cProfile stats saved to {out_path}")
+    for path in worker_files:
+        os.remove(path)
+
+
+if config_profile["mode"] not in _PROFILE_MODES:
+    print(f"  :Info: unknown profile mode {config_profile['mode']}, should be one of {_PROFILE_MODES}.")
+elif _is_dump_enabled():
+    # the root process merges the profiles of its workers at exit, even if it profiles nothing itself
+    _register_dump()
@@ -0,0 +1,327 @@
+# -*- coding:utf-8 -*-
+##############################################################
+# Created Date: Monday, October 19th 2026
+# Contact Info: luoxiangyong01@gmail.com
+# Author/Copyright: Mr. Xiangyong Luo
+##############################################################
+
+
+from __future__ import absolute_import
+import asyncio
+import functools
+import inspect
+import random
+import threading
+import time
+from typing import Callable, Union
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised without calling the function while its circuit breaker is open."""
+
+
+class CircuitBreaker:
+    """Fail fast while an endpoint is down, instead of waiting for every call to time out.
+
+    The breaker is closed at the start. After failure_threshold consecutive failures it opens,
+    and the calls raise CircuitOpenError at once. After recovery_timeout seconds it is half open,
+    one trial call is let through: a success closes the breaker, a failure opens it again.
+
+    Args:
+        failure_threshold (int, optional): the consecutive failures opening the breaker. Defaults to 5.
+        recovery_timeout (float, optional): seconds the breaker stays open. Defaults to 30.
+        name (str, optional): the name in the error message. Defaults to "circuit".
+
+    Examples:
+        >>> from pyufunc import CircuitBreaker, retry
+        >>> nominatim_breaker = CircuitBreaker(failure_threshold=5, recovery_timeout=60, name="nominatim")
+        >>> @retry(max_attempts=3, exceptions=(ConnectionError,), circuit_breaker=nominatim_breaker)
+            def geocode(address: str) -> dict:
+                ...
+    """
+
+    def __init__(self, failure_threshold: int = 5, recovery_timeout: float = 30, name: str = "circuit"):
+        if not isinstance(failure_threshold, int) or failure_threshold <= 0:
+            raise ValueError("The input failure_threshold should be an integer greater than 0.")
+        if recovery_timeout < 0:
+            raise ValueError("The input recovery_timeout should be greater than or equal to 0.")
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.name = name
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._opened_at = None
+        self._trial_running = False
+
+    @property
+    def state(self) -> str:
+        """The state of the breaker: "closed", "open" or "half_open"."""
+        with self._lock:
+            if self._opened_at is None:
+                return "closed"
+            if time.monotonic() - self._opened_at < self.recovery_timeout:
+                return "open"
+            return "half_open"
+
+    def before_call(self):
+        """Raise CircuitOpenError if the call is not allowed."""
+        with self._lock:
+            if self._opened_at is None:
+                return
+            remaining = self._opened_at + self.recovery_timeout - time.monotonic()
+            if remaining > 0 or self._trial_running:
+                raise CircuitOpenError(f"{self.name} is open after {self._failures} consecutive failures, "
+                                       f"retry in {max(remaining, 0):.1f} seconds")
+            self._trial_running = True
+
+    def record_success(self):
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._trial_running = False
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            if self._trial_running or self._failures >= self.failure_threshold:
+                self._opened_at = time.monotonic()
+            self._trial_running = False
+
+    def release(self):
+        """Let the next call be the trial if the trial call was interrupted."""
+        with self._lock:
+            self._trial_running = False
+
+    def reset(self):
+        """Close the breaker."""
+        self.record_success()
+
+    def __call__(self, func: Callable) -> Callable:
+        """Use the breaker as a decorator, every exception counts as a failure."""
+        return retry(func, max_attempts=1, circuit_breaker=self)
+
+
+class RetryBudget:
+    """Limit the retries to a ratio of the calls, shared by all functions using the budget.
+
+    Each call deposits ratio tokens and each retry withdraws one, so when an endpoint is down,
+    the retries are limited to about ratio times the calls instead of multiplying the load by max_attempts.
+
+    Args:
+        ratio (float, optional): the retries allowed per call. Defaults to 0.2.
+        capacity (float, optional): the maximum tokens, i.e. the burst of retries allowed
+            after a quiet period, also the tokens at the start. Defaults to 10.
+    """
+
+    def __init__(self, ratio: float = 0.2, capacity: float = 10):
+        if ratio < 0:
+            raise ValueError("The input ratio should be greater than or equal to 0.")
+        if capacity < 1:
+            raise ValueError("The input capacity should be greater than or equal to 1.")
+        self.ratio = ratio
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._lock = threading.Lock()
+
+    @property
+    def tokens(self) -> float:
+        return self._tokens
+
+    def deposit(self):
+        with self._lock:
+            self._tokens = min(self._tokens + self.ratio, self.capacity)
+
+    def withdraw(self) -> bool:
+        """Take the token of one retry, return False if the budget is exhausted."""
+        with self._lock:
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
+
+
+class _RetryPolicy:
+    __slots__ = ("name", "max_attempts", "exceptions", "retry_on_exception", "retry_on_result",
+                 "base_delay", "max_delay", "multiplier", "jitter", "max_total_time", "budget",
+                 "breaker", "verbose")
+
+    def __init__(self, name: str, **kwargs):
+        self.name = name
+        for key, value in kwargs.items():
+            setattr(self, key, value)
+
+    def is_retryable(self, error: BaseException) -> bool:
+        return isinstance(error, self.exceptions) and (
+            self.retry_on_exception is None or self.retry_on_exception(error))
+
+    def on_success(self):
+        if self.breaker is not None:
+            self.breaker.record_success()
+
+    def on_other_error(self, error: BaseException):
+        if self.breaker is not None:
+            if isinstance(error, Exception):
+                # the endpoint answered, e.g. a bad request
+                self.breaker.record_success()
+            else:
+                # interrupted, e.g. KeyboardInterrupt or a cancelled task
+                self.breaker.release()
+
+    def on_failure(self, attempt: int, started: float, reason) -> Union[float, None]:
+        """Record the failure, return the seconds to wait before the next attempt, or None to give up."""
+        if self.breaker is not None:
+            self.breaker.record_failure()
+        if attempt >= self.max_attempts:
+            return None
+
+        delay = min(self.max_delay, self.base_delay * self.multiplier ** (attempt - 1))
+        if self.jitter:
+            # full jitter, the callers failing together do not retry together
+            delay = random.uniform(0, delay)
+        if self.max_total_time is not None and time.monotonic() - started + delay > self.max_total_time:
+            return None
+        if self.budget is not None and not self.budget.withdraw():
+            return None
+
+        if self.verbose:
+            print(f"  :Info: {self.name} failed ({reason}), "
+                  f"retry {attempt}/{self.max_attempts - 1} in {delay:.2f} seconds")
+        return delay
+
+
+def retry(func: Callable = None,
+          *,
+          max_attempts: int = 3,
+          exceptions: Union[type, tuple] = (Exception,),
+          retry_on_exception: Callable = None,
+          retry_on_result: Callable = None,
+          base_delay: float = 0.5,
+          max_delay: float = 30,
+          multiplier: float = 2,
+          jitter: bool = True,
+          max_total_time: float = None,
+          budget: RetryBudget = None,
+          circuit_breaker: CircuitBreaker = None,
+          verbose: bool = False) -> Callable:
+    """A decorator to retry a function with exponential backoff and jitter, for sync and async functions.
+
+    The wait before the n-th retry is a random number between 0 and
+    min(max_delay, base_delay * multiplier ** (n - 1)) seconds.
+
+    Args:
+        func (Callable): the function to be retried.
+        max_attempts (int, optional): the attempts including the first call. Defaults to 3.
+        exceptions (type | tuple, optional): the exceptions to retry, the others are raised at once.
+            Defaults to (Exception,).
+        retry_on_exception (Callable, optional): retry an exception in exceptions only if
+            retry_on_exception(exception) is True, e.g. only the 5xx HTTP errors. Defaults to None.
+        retry_on_result (Callable, optional): also retry if retry_on_result(result) is True,
+            e.g. a response with the status code 429. The last result is returned when the retries
+            are exhausted. Defaults to None.
+        base_delay (float, optional): the maximum wait before the first retry in seconds. Defaults to 0.5.
+        max_delay (float, optional): the maximum wait before any retry in seconds. Defaults to 30.
+        multiplier (float, optional): the growth of the wait per retry. Defaults to 2.
+        jitter (bool, optional): randomize the wait, so the callers failing together do not retry
+            together. Defaults to True.
+        max_total_time (float, optional): do not retry if the next attempt would start later than
+            max_total_time seconds after the first one. Defaults to None.
+        budget (RetryBudget, optional): a retry budget shared with other functions. Defaults to None.
+        circuit_breaker (CircuitBreaker, optional): a circuit breaker shared with other functions,
+            the retryable failures count against it. Defaults to None.
+        verbose (bool, optional): print the failures before each retry. Defaults to False.
+
+    Raises:
+        ValueError: if max_attempts is less than 1, or a delay is negative.
+        CircuitOpenError: at a call while the circuit breaker is open.
+
+    Returns:
+        Callable: the decorated function, which raises the last exception when the retries are exhausted.
+
+    Examples:
+        >>> from pyufunc import retry
+        >>> @retry(max_attempts=5, exceptions=(ConnectionError, TimeoutError), max_total_time=60)
+            def fetch(url: str) -> bytes:
+                ...
+        >>> @retry(retry_on_result=lambda response: response.status_code in {429, 503})
+            async def fetch_async(client, url: str):
+                return await client.get(url)
+    """
+    if not isinstance(max_attempts, int) or max_attempts < 1:
+        raise ValueError("The input max_attempts should be an integer greater than 0.")
+    if base_delay < 0 or max_delay < 0:
+        raise ValueError("The input base_delay and max_delay should be greater than or equal to 0.")
+    if isinstance(exceptions, type):
+        exceptions = (exceptions,)
+
+    def decorator(func):
+        policy = _RetryPolicy(getattr(func, "__qualname__", repr(func)),
+                              max_attempts=max_attempts, exceptions=tuple(exceptions),
+                              retry_on_exception=retry_on_exception, retry_on_result=retry_on_result,
+                              base_delay=base_delay, max_delay=max_delay, multiplier=multiplier,
+                              jitter=jitter, max_total_time=max_total_time, budget=budget,
+                              breaker=circuit_breaker, verbose=verbose)
+
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                started = time.monotonic()
+                if budget is not None:
+                    budget.deposit()
+                attempt = 0
+                while True:
+                    attempt += 1
+                    if circuit_breaker is not None:
+                        circuit_breaker.before_call()
+                    try:
+                        result = await func(*args, **kwargs)
+                    except BaseException as e:
+                        if not policy.is_retryable(e):
+                            policy.on_other_error(e)
+                            raise
+                        delay = policy.on_failure(attempt, started, repr(e))
+                        if delay is None:
+                            raise
+                    else:
+                        if retry_on_result is None or not retry_on_result(result):
+                            policy.on_success()
+                            return result
+                        delay = policy.on_failure(attempt, started, f"result {result!r}")
+                        if delay is None:
+                            return result
+                    await asyncio.sleep(delay)
+
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            started = time.monotonic()
+            if budget is not None:
+                budget.deposit()
+            attempt = 0
+            while True:
+                attempt += 1
+                if circuit_breaker is not None:
+                    circuit_breaker.before_call()
+                try:
+                    result = func(*args, **kwargs)
+                except BaseException as e:
+                    if not policy.is_retryable(e):
+                        policy.on_other_error(e)
+                        raise
+                    delay = policy.on_failure(attempt, started, repr(e))
+                    if delay is None:
+                        raise
+                else:
+                    if retry_on_result is None or not retry_on_result(result):
+                        policy.on_success()
+                        return result
+                    delay = policy.on_failure(attempt, started, f"result {result!r}")
+                    if delay is None:
+                        return result
+                time.sleep(delay)
+
+        return wrapper
+
+    if func is not None:
+        return decorator(func)
+    return decorator
@@ -7,26 +7,254 @@
 
 
 from __future__ import absolute_import
-from multiprocessing import Pool
-from typing import Iterable, Callable, Iterator
+import asyncio
+import collections
+import functools
+import itertools
+import multiprocessing
+import pickle
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from typing import Iterable, Callable, Iterator, Union
 import os
-from pyufunc.util_magic._func_time_decorator import func_running_time
+
+# the automatic chunk size aims at chunks of this duration in seconds,
+# long enough to amortize pickling and inter-process communication
+_TARGET_CHUNK_SECONDS = 0.05
+_MAX_CHUNKSIZE = 100000
+
+_BACKENDS = ("process", "thread", "asyncio", "serial", "auto")
+
+# the auto backend runs a sample of tasks in the caller to choose the backend
+_AUTO_SAMPLE_SIZE = 8
+_AUTO_SAMPLE_SECONDS = 0.05
+# tasks faster than this are cheaper to run serially than to hand over to a worker
+_SERIAL_TASK_SECONDS = 1e-4
+
+
+def _run_chunk(func: Callable, chunk: list) -> tuple:
+    time_start = time.perf_counter()
+    results = [func(item) for item in chunk]
+    return results, time.perf_counter() - time_start
+
+
+async def _run_chunk_async(func: Callable, chunk: list, semaphore: asyncio.Semaphore) -> tuple:
+    async def _run_one(item):
+        async with semaphore:
+            return await func(item)
+
+    time_start = time.perf_counter()
+    results = await asyncio.gather(*[_run_one(item) for item in chunk])
+    return list(results), time.perf_counter() - time_start
+
+
+class _SerialExecutor(Executor):
+    """Run each submitted chunk in the caller thread."""
+
+    def submit(self, fn, /, *args, **kwargs):
+        fut = Future()
+        try:
+            fut.set_result(fn(*args, **kwargs))
+        except Exception as e:
+            fut.set_exception(e)
+        return fut
+
+
+class _AsyncioExecutor(Executor):
+    """Run the submitted coroutine functions in an event loop of a background thread."""
+
+    def __init__(self):
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name="run_parallel_asyncio", daemon=True)
+        self._thread.start()
+
+    def submit(self, fn, /, *args, **kwargs):
+        return asyncio.run_coroutine_threadsafe(fn(*args, **kwargs), self._loop)
+
+    def _cancel_tasks(self):
+        for task in asyncio.all_tasks(self._loop):
+            task.cancel()
+
+    def shutdown(self, wait=True, *, cancel_futures=False):
+        if cancel_futures:
+            self._loop.call_soon_threadsafe(self._cancel_tasks)
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        if wait:
+            self._thread.join()
+            self._loop.close()
+
+
+def _default_num_workers(backend: str) -> int:
+    if backend == "thread":
+        return min(32, (os.cpu_count() or 1) + 4)
+    if backend == "asyncio":
+        return 64
+    if backend == "serial":
+        return 1
+    return os.cpu_count() or 1
+
+
+def _create_executor(backend: str, num_workers: int, start_method: str) -> Executor:
+    if backend == "process":
+        return ProcessPoolExecutor(num_workers, mp_context=multiprocessing.get_context(start_method))
+    if backend == "thread":
+        return ThreadPoolExecutor(num_workers, thread_name_prefix="run_parallel")
+    if backend == "asyncio":
+        return _AsyncioExecutor()
+    return _SerialExecutor()
+
+
+def _shutdown_now(executor: Executor):
+    """Stop without waiting for the chunks in flight, worker processes are terminated."""
+    processes = list((getattr(executor, "_processes", None) or {}).values())
+    executor.shutdown(wait=False, cancel_futures=True)
+    for proc in processes:
+        proc.terminate()
+
+
+def _profile_backend(func: Callable, iterator: Iterator) -> tuple:
+    """Run a sample of tasks in the caller and choose the backend from their duration.
+
+    Returns:
+        tuple: the backend, the results of the sample tasks.
+    """
+    results = []
+    wall_start, cpu_start = time.perf_counter(), time.thread_time()
+    for item in itertools.islice(iterator, _AUTO_SAMPLE_SIZE):
+        results.append(func(item))
+        if time.perf_counter() - wall_start >= _AUTO_SAMPLE_SECONDS:
+            break
+    wall_time, cpu_time = time.perf_counter() - wall_start, time.thread_time() - cpu_start
+
+    if not results or wall_time / len(results) < _SERIAL_TASK_SECONDS:
+        return "serial", results
+    # tasks mostly waiting on I/O
+    if cpu_time < wall_time / 2:
+        return "thread", results
+    if (os.cpu_count() or 1) == 1:
+        return "serial", results
+    try:
+        pickle.dumps(func)
+    except Exception:
+        return "thread", results
+    return "process", results
+
+
+def _next_chunksize(chunksize: int, chunk_len: int, elapsed: float, max_chunksize: int) -> int:
+    """Scale the chunk size towards _TARGET_CHUNK_SECONDS, growing at most 4 times per step."""
+    if elapsed <= 0:
+        return min(chunksize * 4, max_chunksize)
+    target = int(_TARGET_CHUNK_SECONDS * chunk_len / elapsed)
+    return max(1, min(target, chunksize * 4, max_chunksize))
+
+
+def _iter_results(executor, run_chunk: Callable, func: Callable, iterable: Iterable, chunksize: int,
+                  ordered: bool, max_in_flight: int, max_chunksize: int, deadline: float,
+                  verbose: bool) -> Iterator:
+    """Feed the iterable lazily in chunks and yield the results as the chunks complete.
+
+    At most max_in_flight chunks are submitted and not yet yielded, which caps the memory
+    used by pending inputs and results.
+    """
+    is_auto = chunksize == 0
+    chunksize = chunksize or 1
+    iterator = iter(iterable)
+    is_exhausted = False
+    in_flight = collections.deque()
+    num_done = 0
+    time_start = time_progress = time.monotonic()
+
+    try:
+        while True:
+            while not is_exhausted and len(in_flight) < max_in_flight:
+                chunk = list(itertools.islice(iterator, chunksize))
+                if not chunk:
+                    is_exhausted = True
+                    break
+                in_flight.append(executor.submit(run_chunk, func, chunk))
+            if not in_flight:
+                break
+
+            remaining = None if deadline is None else max(deadline - time.monotonic(), 0)
+            if ordered:
+                done_set, _ = wait([in_flight[0]], timeout=remaining)
+            else:
+                done_set, _ = wait(in_flight, timeout=remaining, return_when=FIRST_COMPLETED)
+            if not done_set:
+                raise TimeoutError(f"run_parallel did not finish {func.__name__} in time.")
+            done = [fut for fut in in_flight if fut in done_set]
+            for fut in done:
+                in_flight.remove(fut)
+
+            for fut in done:
+                # the exception raised by func is re-raised here
+                results, elapsed = fut.result()
+                if is_auto:
+                    chunksize = _next_chunksize(chunksize, len(results), elapsed, max_chunksize)
+                num_done += len(results)
+                yield from results
+
+            if verbose and time.monotonic() - time_progress >= 1:
+                time_progress = time.monotonic()
+                print(f"  :Info: {num_done} tasks done in {time_progress - time_start:.1f}s, chunksize {chunksize}")
+    except BaseException:
+        for fut in in_flight:
+            fut.cancel()
+        raise
 
 
-@func_running_time
 def run_parallel(func: Callable, iterable: Iterable,
-                 num_processes: int = os.cpu_count() - 1,
-                 chunksize: int = 0) -> Iterator:
-    """Run a function in parallel with multiple processors.
+                 num_processes: int = None,
+                 chunksize: int = 0,
+                 stream: bool = False,
+                 ordered: bool = True,
+                 max_in_flight: int = None,
+                 verbose: bool = False,
+                 backend: str = "process",
+                 start_method: str = None,
+                 timeout: float = None,
+                 pool=None) -> Union[list, Iterator]:
+    """Run a function in parallel with multiple processors, threads or coroutines.
+
+    The iterable is fed lazily in chunks, so generators and other iterables without len() work,
+    and only a bounded window of chunks is in flight at any time.
+
+    All backends return the results in the same way, re-raise the first exception of func
+    in the caller and raise TimeoutError if the run is not finished within timeout:
+        - "process": a process pool, for CPU-bound functions.
+        - "thread": a thread pool, for I/O-bound functions.
+        - "asyncio": an event loop running an async function with at most num_processes
+          coroutines at once.
+        - "serial": run in the caller, for tasks too small to be worth handing over.
+        - "auto": run a sample of tasks in the caller and choose by their duration and CPU usage,
+          async functions always run on "asyncio".
 
     Args:
         func (callable): The function to run in parallel.
         iterable (Iterable): The input iterable to the function.
-        num_processes (int, optional): The number of processors to use. Defaults to os.cpu_count() - 1.
-        chunksize (int, optional): The chunksize for the parallel processing. Defaults to "".
+        num_processes (int, optional): The number of workers to use, processes, threads or concurrent
+            coroutines. Defaults to os.cpu_count() for processes, min(32, os.cpu_count() + 4) for threads
+            and 64 for coroutines.
+        chunksize (int, optional): The number of items sent to a processor at once.
+            0 chooses it automatically from the measured task duration. Defaults to 0.
+        stream (bool, optional): Return an iterator which yields the results as they complete,
+            instead of a list of all results. Defaults to False.
+        ordered (bool, optional): Yield the results in the order of the inputs,
+            otherwise in the order the chunks complete. Defaults to True.
+        max_in_flight (int, optional): The max number of chunks submitted and not yet yielded.
+            Defaults to 4 * num_processes.
+        verbose (bool, optional): Print the progress info. Defaults to False.
+        backend (str, optional): "process", "thread", "asyncio", "serial" or "auto". Defaults to "process".
+        start_method (str, optional): start method of the process backend, "fork", "forkserver" or "spawn".
+            Defaults to the multiprocessing default.
+        timeout (float, optional): Max seconds of the whole run. Tasks already running in threads or
+            in the caller cannot be interrupted and finish in the background. Defaults to None.
+        pool (WorkerPool, optional): run in the workers of a long-lived WorkerPool instead of starting
+            new ones, backend, start_method and num_processes are taken from the pool. Defaults to None.
 
     Returns:
-        Iterator: The results of the function.
+        list | Iterator: The results of the function, an iterator if stream is True.
 
     Raises:
         TypeError: If the input function is not callable,
@@ -38,7 +266,11 @@ def run_parallel(func: Callable, iterable: Iterable,
         TypeError: if the input number of processors is not an integer
         TypeError: if the input chunksize should be an integer
         ValueError: if the input number of processors is not greater than 0
-        ValueError: if the input chunksize is not greater than 0
+        ValueError: if the input chunksize is less than 0
+        ValueError: if the input max_in_flight is not greater than 0
+        ValueError: if the input backend or start_method is unknown
+        TypeError: if an async function does not run on the asyncio backend, or the other way around
+        TimeoutError: if the run is not finished within timeout
 
     Examples:
         >>> import numpy as np
@@ -50,6 +282,15 @@ def run_parallel(func: Callable, iterable: Iterable,
         >>> for res in results:
                 print(res)
         0, 1, 4, 9, 16, 25, 36, 49, 64, 81
+
+        >>> # stream the results of a generator, in the order they complete
+        >>> for res in run_parallel(my_func, (i for i in range(10 ** 8)), stream=True, ordered=False):
+                pass
+
+        >>> # download with at most 100 requests at once
+        >>> async def fetch(url):
+                ...
+        >>> pages = run_parallel(fetch, urls, num_processes=100, backend="asyncio")
     """
 
     # TDD, test-driven development: check inputs
@@ -58,30 +299,75 @@ def run_parallel(func: Callable, iterable: Iterable,
         raise TypeError("The input function should be a callable.")
     if not isinstance(iterable, Iterable):
         raise TypeError("The input iterable should be an Iterable.")
-    if not isinstance(num_processes, int):
+    if backend not in _BACKENDS:
+        raise ValueError(f"The input backend should be one of {_BACKENDS}, not {backend}.")
+    if start_method is not None and start_method not in multiprocessing.get_all_start_methods():
+        raise ValueError(f"The input start_method should be one of {multiprocessing.get_all_start_methods()}.")
+    is_async_func = asyncio.iscoroutinefunction(func)
+    if pool is not None:
+        backend, num_processes = "process", pool.num_processes
+    if backend == "auto" and is_async_func:
+        backend = "asyncio"
+    if backend != "auto" and is_async_func != (backend == "asyncio"):
+        raise TypeError("Async functions should run on the asyncio backend, and only them.")
+    if num_processes is not None and not isinstance(num_processes, int):
         raise TypeError("The input number of processors should be an integer.")
     if not isinstance(chunksize, int):
         raise TypeError("The input chunksize should be an integer.")
 
     # check the number of processors and chunksize are greater than 0
-    if num_processes <= 0:
+    if num_processes is not None and num_processes <= 0:
         raise ValueError("The input number of processors should be greater than 0.")
     if chunksize < 0:
-        raise ValueError("The input chunksize should be greater than 0.")
+        raise ValueError("The input chunksize should be greater than or equal to 0.")
+    if max_in_flight is not None and max_in_flight <= 0:
+        raise ValueError("The input max_in_flight should be greater than 0.")
+
+    num_items = len(iterable) if hasattr(iterable, "__len__") else None
+
+    def _run() -> Iterator:
+        time_start = time.monotonic()
+        deadline = None if timeout is None else time_start + timeout
+        iterator = iter(iterable)
 
-    # Step 1: get the number of processors to use
-    num_processors = min(num_processes, os.cpu_count() - 1)
-    print(f"  :Info: using {num_processors} processors to run {func.__name__}...")
+        # Step 1: choose the backend from a sample of tasks
+        run_backend = backend
+        num_remaining = num_items
+        if run_backend == "auto":
+            run_backend, sample_results = _profile_backend(func, iterator)
+            if num_remaining is not None:
+                num_remaining -= len(sample_results)
+            yield from sample_results
 
-    # Step 2: check the chunksize
-    if chunksize >= len(iterable):
-        chunksize = len(iterable) // num_processors
+        # Step 2: keep every worker busy with at least 4 chunks if the input length is known
+        num_workers = num_processes or _default_num_workers(run_backend)
+        max_chunksize = _MAX_CHUNKSIZE
+        if num_remaining is not None:
+            num_workers = max(min(num_workers, num_remaining), 1)
+            max_chunksize = max(min(num_remaining // (4 * num_workers), _MAX_CHUNKSIZE), 1)
+        window = max_in_flight or 4 * num_workers
+        if verbose:
+            print(f"  :Info: using {num_workers} {run_backend} workers to run {func.__name__}...")
 
-    # Step 3: run the function in parallel
-    with Pool(num_processors) as pool:
-        if chunksize == 0:
-            results = pool.map(func, iterable)
+        # Step 3: run the function in parallel
+        run_chunk = _run_chunk
+        if run_backend == "asyncio":
+            run_chunk = functools.partial(_run_chunk_async, semaphore=asyncio.Semaphore(num_workers))
+        if pool is not None:
+            # the chunks in flight are cancelled on errors, the pool stays alive
+            yield from _iter_results(pool._executor, run_chunk, func, iterator, chunksize, ordered,
+                                     window, max_chunksize, deadline, verbose)
         else:
-            results = pool.map(func, iterable, chunksize=chunksize)
+            executor = _create_executor(run_backend, num_workers, start_method)
+            try:
+                yield from _iter_results(executor, run_chunk, func, iterator, chunksize, ordered,
+                                         window, max_chunksize, deadline, verbose)
+            except BaseException:
+                # do not wait for the chunks still in flight
+                _shutdown_now(executor)
+                raise
+            executor.shutdown(wait=True)
+        if verbose:
+            print(f"  :Info: finished function: {func.__name__}, total: {time.monotonic() - time_start:.1f}s")
 
-    return results
+    return _run() if stream else list(_run())
@@ -54,6 +54,10 @@ class TIMEOUT_EXCEPTION(Exception):
 def timeout(seconds: int) -> object:
     """A decorator to set the timeout for the function.
 
+    Note:
+        The function runs in a traced thread, which is slower and can not stop C extensions or
+        blocking I/O, use timeout_process or TimeoutExecutor to stop them by killing a worker process.
+
     Args:
         seconds (int): timeout seconds for the function.
 
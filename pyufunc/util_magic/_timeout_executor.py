@@ -0,0 +1,324 @@
+# -*- coding:utf-8 -*-
+##############################################################
+# Created Date: Monday, October 19th 2026
+# Contact Info: luoxiangyong01@gmail.com
+# Author/Copyright: Mr. Xiangyong Luo
+##############################################################
+
+
+from __future__ import absolute_import
+import atexit
+import functools
+import importlib
+import multiprocessing
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing.connection import wait
+from typing import Callable
+
+_DEFAULT_EXECUTOR = [None]
+_DEFAULT_LOCK = threading.Lock()
+
+
+def _worker_loop(conn, initializer: Callable, initargs: tuple):
+    if initializer is not None:
+        initializer(*initargs)
+    while True:
+        try:
+            task = conn.recv()
+        except EOFError:
+            return
+        if task is None:
+            return
+        func, args, kwargs = task
+        try:
+            result = (True, func(*args, **kwargs))
+        except BaseException as e:
+            result = (False, e)
+        try:
+            conn.send(result)
+        except Exception as e:
+            conn.send((False, TypeError(f"The result of {getattr(func, '__name__', func)} "
+                                        f"can not be sent back to the caller: {e}")))
+
+
+def _call_wrapped(module_name: str, qual_name: str, args: tuple, kwargs: dict):
+    """Call the original function of a timeout_process wrapper, which can not be pickled by reference."""
+    obj = importlib.import_module(module_name)
+    for attr in qual_name.split("."):
+        obj = getattr(obj, attr)
+    return obj.__wrapped__(*args, **kwargs)
+
+
+def _task_name(task: tuple) -> str:
+    func, args, _ = task
+    if func is _call_wrapped:
+        return args[1].rsplit(".", 1)[-1]
+    return getattr(func, "__name__", repr(func))
+
+
+class _Worker:
+    __slots__ = ("process", "conn")
+
+    def __init__(self, process, conn):
+        self.process = process
+        self.conn = conn
+
+
+class TimeoutExecutor:
+    """Run functions in a reusable pool of worker processes, each call with its own deadline.
+
+    A call exceeding its deadline is stopped by killing its worker process, which is replaced by
+    a new one, so the timeout also stops C extensions and blocking I/O, and the code runs untraced
+    at full speed. Calls can be submitted from any thread, and all deadlines are watched by one
+    manager thread.
+
+    Args:
+        num_processes (int, optional): the number of worker processes. Defaults to os.cpu_count().
+        start_method (str, optional): "fork", "forkserver" or "spawn". Defaults to the multiprocessing default.
+        initializer (callable, optional): called once in each worker, also in the replacements. Defaults to None.
+        initargs (tuple, optional): the arguments of the initializer. Defaults to ().
+
+    Note:
+        The functions, arguments and results are pickled. The deadline of a call starts when a worker
+        picks it up, not when it is submitted.
+
+    Examples:
+        >>> from pyufunc import TimeoutExecutor
+        >>> with TimeoutExecutor(4) as executor:
+                futures = [executor.submit(read_link, f, timeout=60) for f in link_files]
+                links = [fut.result() for fut in futures]  # raise TimeoutError if a file took over 60 s
+    """
+
+    def __init__(self,
+                 num_processes: int = None,
+                 start_method: str = None,
+                 initializer: Callable = None,
+                 initargs: tuple = ()):
+        if num_processes is None:
+            num_processes = os.cpu_count() or 1
+        if not isinstance(num_processes, int):
+            raise TypeError("The input number of processors should be an integer.")
+        if num_processes <= 0:
+            raise ValueError("The input number of processors should be greater than 0.")
+        if initializer is not None and not callable(initializer):
+            raise TypeError("The input initializer should be a callable.")
+
+        self.num_processes = num_processes
+        self._ctx = multiprocessing.get_context(start_method)
+        self._initializer = initializer
+        self._initargs = initargs
+
+        # shared with the callers, guarded by the lock
+        self._lock = threading.Lock()
+        self._pending = deque()
+        self._closing = False
+        self._cancel_pending = False
+        self._wake_reader, self._wake_writer = multiprocessing.Pipe(duplex=False)
+
+        # only used by the manager thread
+        self._idle = [self._start_worker() for _ in range(num_processes)]
+        self._running = {}
+        self.num_replaced = 0
+
+        self._manager = threading.Thread(target=self._manage, name="pyufunc-timeout-executor", daemon=True)
+        self._manager.start()
+        atexit.register(self.close)
+
+    def _start_worker(self) -> _Worker:
+        parent_conn, child_conn = self._ctx.Pipe()
+        process = self._ctx.Process(target=_worker_loop, args=(child_conn, self._initializer, self._initargs),
+                                    daemon=True)
+        process.start()
+        # the worker end is only kept by the worker, so a dead worker closes the pipe
+        child_conn.close()
+        return _Worker(process, parent_conn)
+
+    def _stop_worker(self, worker: _Worker, kill: bool = False):
+        if kill:
+            worker.process.kill()
+        else:
+            try:
+                worker.conn.send(None)
+            except OSError:
+                pass
+        worker.process.join()
+        worker.conn.close()
+
+    def _wake(self):
+        try:
+            self._wake_writer.send_bytes(b"")
+        except OSError:
+            pass
+
+    def submit(self, func: Callable, /, *args, timeout: float = None, **kwargs) -> Future:
+        """Submit func(*args, **kwargs) with a deadline of timeout seconds.
+
+        Args:
+            func (Callable): a picklable function.
+            timeout (float, optional): the deadline in seconds after the call started. Defaults to None, no deadline.
+
+        Raises:
+            ValueError: if timeout is not greater than 0.
+            RuntimeError: if the executor is closed.
+
+        Returns:
+            Future: its result() raises TimeoutError if the deadline was exceeded.
+        """
+        if timeout is not None and timeout <= 0:
+            raise ValueError("The input timeout should be greater than 0.")
+        fut = Future()
+        with self._lock:
+            if self._closing:
+                raise RuntimeError("Can not submit to a closed TimeoutExecutor.")
+            self._pending.append((fut, (func, args, kwargs), timeout))
+        self._wake()
+        return fut
+
+    def run(self, func: Callable, /, *args, timeout: float = None, **kwargs):
+        """Run func(*args, **kwargs) and return its result, raise TimeoutError if it exceeded timeout seconds."""
+        return self.submit(func, *args, timeout=timeout, **kwargs).result()
+
+    def _dispatch(self):
+        while self._idle:
+            with self._lock:
+                if not self._pending:
+                    return
+                fut, task, timeout = self._pending.popleft()
+            if not fut.set_running_or_notify_cancel():
+                continue
+            worker = self._idle.pop()
+            try:
+                worker.conn.send(task)
+            except Exception as e:
+                # the task can not be pickled, the worker did not receive anything
+                self._idle.append(worker)
+                fut.set_exception(e)
+                continue
+            deadline = None if timeout is None else time.monotonic() + timeout
+            self._running[worker.conn] = (worker, fut, deadline, timeout, _task_name(task))
+
+    def _replace(self, worker: _Worker, kill: bool):
+        self._stop_worker(worker, kill=kill)
+        self.num_replaced += 1
+        self._idle.append(self._start_worker())
+
+    def _manage(self):
+        while True:
+            self._dispatch()
+            with self._lock:
+                if self._closing and (self._cancel_pending or not self._pending) and not self._running:
+                    break
+
+            deadlines = [item[2] for item in self._running.values() if item[2] is not None]
+            wait_timeout = max(min(deadlines) - time.monotonic(), 0) if deadlines else None
+            for conn in wait([self._wake_reader, *self._running], wait_timeout):
+                if conn is self._wake_reader:
+                    while self._wake_reader.poll():
+                        self._wake_reader.recv_bytes()
+                    continue
+                worker, fut, *_ = self._running.pop(conn)
+                try:
+                    is_ok, value = conn.recv()
+                except (EOFError, OSError):
+                    fut.set_exception(BrokenProcessPool("A worker process died while running the task."))
+                    self._replace(worker, kill=True)
+                    continue
+                except Exception as e:
+                    # the result can not be unpickled in the caller
+                    is_ok, value = False, e
+                self._idle.append(worker)
+                if is_ok:
+                    fut.set_result(value)
+                else:
+                    fut.set_exception(value)
+
+            now = time.monotonic()
+            for conn, (worker, fut, deadline, timeout, name) in list(self._running.items()):
+                if deadline is not None and deadline <= now:
+                    del self._running[conn]
+                    self._replace(worker, kill=True)
+                    fut.set_exception(TimeoutError(f"{name} exceed {timeout} seconds timeout"))
+
+        if self._cancel_pending:
+            with self._lock:
+                while self._pending:
+                    self._pending.popleft()[0].cancel()
+        for worker in self._idle:
+            self._stop_worker(worker)
+        self._idle = []
+
+    def close(self, wait: bool = True, cancel_futures: bool = False):
+        """Stop the workers after the submitted calls finished.
+
+        Args:
+            wait (bool, optional): block until the workers stopped. Defaults to True.
+            cancel_futures (bool, optional): cancel the calls not started yet. Defaults to False.
+        """
+        with self._lock:
+            self._closing = True
+            self._cancel_pending = self._cancel_pending or cancel_futures
+        self._wake()
+        if wait and self._manager is not threading.current_thread():
+            self._manager.join()
+        atexit.unregister(self.close)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+def _default_executor() -> TimeoutExecutor:
+    with _DEFAULT_LOCK:
+        if _DEFAULT_EXECUTOR[0] is None or _DEFAULT_EXECUTOR[0]._closing:
+            _DEFAULT_EXECUTOR[0] = TimeoutExecutor()
+        return _DEFAULT_EXECUTOR[0]
+
+
+def timeout_process(seconds: float, executor: TimeoutExecutor = None) -> Callable:
+    """A decorator to run the function in a worker process, which is killed if the call exceeds the timeout.
+
+    Unlike timeout, which stops a thread by a trace function, the worker is killed, so C extensions
+    and blocking I/O are stopped as well and the function runs untraced. Unlike timeout_linux,
+    it works in any thread and with any number of concurrent calls.
+
+    Args:
+        seconds (float): timeout seconds for the function.
+        executor (TimeoutExecutor, optional): the executor running the calls.
+            Defaults to None, a shared executor with os.cpu_count() workers.
+
+    Note:
+        The function should be defined at the top level of a module, and its arguments and result picklable.
+
+    Returns:
+        object: the decorated function.
+
+    Examples:
+        >>> from pyufunc import timeout_process
+        >>> @timeout_process(5)
+            def my_function():
+                import time
+                time.sleep(10)
+                return "I'm running!"
+        >>> my_function()
+        TimeoutError: my_function exceed 5 seconds timeout
+    """
+    if seconds <= 0:
+        raise ValueError("The input seconds should be greater than 0.")
+
+    def decorator(func):
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            return (executor or _default_executor()).run(
+                _call_wrapped, func.__module__, func.__qualname__, args, kwargs, timeout=seconds)
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,188 @@
+# -*- coding:utf-8 -*-
+##############################################################
+# Created Date: Monday, October 19th 2026
+# Contact Info: luoxiangyong01@gmail.com
+# Author/Copyright: Mr. Xiangyong Luo
+##############################################################
+
+
+from __future__ import absolute_import
+import atexit
+import multiprocessing
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, wait
+from multiprocessing import resource_tracker, shared_memory
+from typing import Callable, Iterable, Iterator, Union
+from pyufunc.util_magic._run_parallel_decorator import run_parallel
+
+# the shared state of the current worker process, set by the pool initializer
+_WORKER_SHARED = {}
+# keep the attached shared memory blocks alive as long as the array views
+_WORKER_SHM = []
+
+
+def _is_ndarray(value) -> bool:
+    # numpy is only checked if it was already imported by the caller
+    np = sys.modules.get("numpy")
+    return np is not None and isinstance(value, np.ndarray)
+
+
+def _attach_array(shm_name: str, shape: tuple, dtype: str, writeable: bool = False):
+    import numpy as np
+
+    shm = shared_memory.SharedMemory(name=shm_name)
+    _WORKER_SHM.append(shm)
+    arr = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+    arr.flags.writeable = writeable
+    return arr
+
+
+def _init_worker(array_specs: dict, objects: dict, initializer: Callable, initargs: tuple):
+    _WORKER_SHARED.clear()
+    _WORKER_SHARED.update(objects)
+    for name, spec in array_specs.items():
+        _WORKER_SHARED[name] = _attach_array(*spec)
+    if initializer is not None:
+        initializer(*initargs)
+
+
+def _ping(_):
+    return os.getpid()
+
+
+def get_shared(name: str = None):
+    """Get the shared state of the WorkerPool running the current task.
+
+    Args:
+        name (str, optional): the name of the shared object. Defaults to None, return all of them.
+
+    Returns:
+        the shared object, NumPy arrays are read-only views of shared memory.
+
+    Examples:
+        >>> from pyufunc import WorkerPool, get_shared
+        >>> def lookup(node_id):
+                return get_shared("node_coords")[node_id]
+        >>> with WorkerPool(shared={"node_coords": coords}) as pool:
+                results = pool.map(lookup, range(1000))
+    """
+    if name is None:
+        return _WORKER_SHARED
+    try:
+        return _WORKER_SHARED[name]
+    except KeyError:
+        raise KeyError(f"{name} is not a shared object of the WorkerPool, "
+                       f"available: {list(_WORKER_SHARED)}") from None
+
+
+class WorkerPool:
+    """A long-lived process pool with read-only state shared by all its workers.
+
+    The workers are started once and reused by every map() or run_parallel(pool=...) call.
+    Shared objects are sent to each worker once at start-up instead of with every task,
+    and NumPy arrays are copied once into shared memory, which the workers attach to without copying.
+    Inside a task, the shared objects are returned by ``get_shared(name)``.
+
+    Args:
+        num_processes (int, optional): the number of worker processes. Defaults to os.cpu_count().
+        shared (dict, optional): {name: object} shared with all workers. Defaults to None.
+        initializer (callable, optional): called in each worker after the shared state is attached,
+            e.g. to load a large file once per worker. Defaults to None.
+        initargs (tuple, optional): the arguments of the initializer. Defaults to ().
+        start_method (str, optional): "fork", "forkserver" or "spawn". Defaults to the multiprocessing default.
+
+    Examples:
+        >>> import numpy as np
+        >>> from pyufunc import WorkerPool, get_shared, run_parallel
+        >>> def row_sum(i):
+                return get_shared("matrix")[i].sum()
+        >>> with WorkerPool(4, shared={"matrix": np.random.rand(10000, 1000)}) as pool:
+                sums = pool.map(row_sum, range(10000))
+                sums = run_parallel(row_sum, range(10000), pool=pool)
+    """
+
+    def __init__(self,
+                 num_processes: int = None,
+                 shared: dict = None,
+                 initializer: Callable = None,
+                 initargs: tuple = (),
+                 start_method: str = None):
+        if num_processes is None:
+            num_processes = os.cpu_count() or 1
+        if not isinstance(num_processes, int):
+            raise TypeError("The input number of processors should be an integer.")
+        if num_processes <= 0:
+            raise ValueError("The input number of processors should be greater than 0.")
+        if shared is not None and not isinstance(shared, dict):
+            raise TypeError("The input shared should be a dict of {name: object}.")
+        if initializer is not None and not callable(initializer):
+            raise TypeError("The input initializer should be a callable.")
+
+        self.num_processes = num_processes
+        self._shm_list = []
+        array_specs = {}
+        objects = {}
+        for name, value in (shared or {}).items():
+            if _is_ndarray(value) and value.nbytes > 0 and not value.dtype.hasobject:
+                array_specs[name] = self._share_array(value)
+            else:
+                objects[name] = value
+
+        # forked workers attaching shared memory would otherwise start their own resource tracker,
+        # which unlinks the blocks still in use by the parent when the worker exits
+        if os.name == "posix":
+            resource_tracker.ensure_running()
+
+        self._executor = None
+        try:
+            self._executor = ProcessPoolExecutor(num_processes,
+                                                 mp_context=multiprocessing.get_context(start_method),
+                                                 initializer=_init_worker,
+                                                 initargs=(array_specs, objects, initializer, initargs))
+            # start all workers now, so the first call does not pay for it
+            wait([self._executor.submit(_ping, i) for i in range(num_processes)])
+        except BaseException:
+            self.close()
+            raise
+        atexit.register(self.close)
+
+    def _share_array(self, arr) -> tuple:
+        import numpy as np
+
+        shm = shared_memory.SharedMemory(create=True, size=arr.nbytes)
+        self._shm_list.append(shm)
+        np.ndarray(arr.shape, dtype=arr.dtype, buffer=shm.buf)[...] = arr
+        return shm.name, arr.shape, arr.dtype.str
+
+    def _release_shared_memory(self):
+        for shm in self._shm_list:
+            shm.close()
+            shm.unlink()
+        self._shm_list = []
+
+    def submit(self, func: Callable, *args, **kwargs):
+        """Submit one task to the pool, return a concurrent.futures.Future."""
+        return self._executor.submit(func, *args, **kwargs)
+
+    def map(self, func: Callable, iterable: Iterable, **kwargs) -> Union[list, Iterator]:
+        """Run func on each item of the iterable in the pool.
+
+        The keyword arguments chunksize, stream, ordered, max_in_flight, timeout and verbose
+        are the same as run_parallel.
+        """
+        return run_parallel(func, iterable, pool=self, **kwargs)
+
+    def close(self):
+        """Stop the workers and free the shared memory."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        self._release_shared_memory()
+        atexit.unregister(self.close)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
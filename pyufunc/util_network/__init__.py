@@ -5,6 +5,13 @@
 # Author/Copyright: Mr. Xiangyong Luo
 ##############################################################
 
-from ._network import get_host_ip, validate_url, get_host_name
+from typing import TYPE_CHECKING
+from pyufunc.pkg_func_index import lazy_module
 
-__all__ = ["get_host_ip", "validate_url", "get_host_name"]
\ No newline at end of file
+# the public names are imported on first access, see pyufunc.pkg_func_index
+if TYPE_CHECKING:
+    from ._network import get_host_ip, validate_url, get_host_name
+
+__all__ = ["get_host_ip", "validate_url", "get_host_name"]
+
+__getattr__, __dir__ = lazy_module(__name__)
@@ -5,8 +5,13 @@
 # Author/Copyright: Mr. Xiangyong Luo
 ##############################################################
 
-from ._email import is_valid_email, send_email
-from ._printer import printer_file
+from typing import TYPE_CHECKING
+from pyufunc.pkg_func_index import lazy_module
+
+# the public names are imported on first access, see pyufunc.pkg_func_index
+if TYPE_CHECKING:
+    from ._email import is_valid_email, send_email
+    from ._printer import printer_file
 
 __all__ = [
 
@@ -16,4 +21,6 @@ __all__ = [
 
     # .printer
     "printer_file",
-]
\ No newline at end of file
+]
+
+__getattr__, __dir__ = lazy_module(__name__)
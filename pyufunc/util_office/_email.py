@@ -21,6 +21,25 @@ import mimetypes
 
 from pyufunc.pkg_configs import config_email
 from pyufunc.util_pathio._path import path2linux
+from pyufunc.util_magic._retry import retry
+
+
+def _is_transient_smtp_error(error: Exception) -> bool:
+    """The connection errors and the 4xx replies, temporary failures by RFC 5321, are retried."""
+    if isinstance(error, (smtplib.SMTPRecipientsRefused, smtplib.SMTPNotSupportedError)):
+        return False
+    code = getattr(error, "smtp_code", None)
+    return not isinstance(code, int) or code < 0 or 400 <= code < 500
+
+
+def _send_message(smtp_server: str, smtp_port: int, smtp_user: str, smtp_password: str,
+                  send_from: str, send_to: list, text: str, timeout: float):
+    with smtplib.SMTP(smtp_server, smtp_port, timeout=timeout) as server:
+        server.ehlo()
+        server.starttls()
+        server.ehlo()
+        server.login(smtp_user, smtp_password)
+        server.sendmail(send_from, send_to, text)
 
 
 def is_valid_email(email: str) -> bool:
@@ -78,6 +97,8 @@ def send_email(send_from: str,
     Note:
         - User can add message_type = "html" in the kwargs. If message_type is "html", the message will be sent as html format. eg. message_type = "html", message = "<h1>hello world</h1>"
         - User can add verbose = True in the kwargs. If verbose is True, the function will print the email sending status.
+        - User can add max_attempts (default 3) and timeout (default 60 seconds) in the kwargs. Connection errors
+          and temporary 4xx replies of the smtp server are retried with exponential backoff.
         - If you are using gmail, you need to generate an app password for the smtp_password: https://support.google.com/accounts/answer/185833?hl=en
 
     Returns:
@@ -203,15 +224,16 @@ def send_email(send_from: str,
             msg.attach(part)
 
     try:
-        # Connect to the SMTP server and send the email
-        server = smtplib.SMTP(smtp_server, smtp_port)
-        server.ehlo()
-        server.starttls()
-        server.ehlo()
-        server.login(smtp_user, smtp_password)
-        text = msg.as_string()
-        server.sendmail(send_from, send_to, text)
-        server.quit()
+        # Connect to the SMTP server and send the email, retry the temporary failures
+        retry(_send_message,
+              max_attempts=kwargs.get("max_attempts", 3),
+              exceptions=(OSError,),
+              retry_on_exception=_is_transient_smtp_error,
+              base_delay=2,
+              max_delay=30,
+              verbose=kwargs.get("verbose", False))(
+            smtp_server, smtp_port, smtp_user, smtp_password,
+            send_from, send_to, msg.as_string(), kwargs.get("timeout", 60))
 
         # print the email description if verbose is True
         verbose = kwargs.get("verbose")
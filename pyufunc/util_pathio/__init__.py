@@ -5,38 +5,47 @@
 # Author/Copyright: Mr. Xiangyong Luo
 ##############################################################
 
-from ._argparse import with_argparse
-from ._io import (get_file_size,
-                  get_dir_size,
-                  create_tempfile,
-                  remove_file,
-                  add_dir_to_env,
-                  pickle_save,
-                  pickle_load,
-                  find_duplicate_files,
-                  remove_duplicate_files,
-                  )
-from ._path import (path2linux,
-                    path2uniform,
-                    get_filenames_by_ext,
-                    get_files_by_ext,
-                    check_files_in_dir,
-                    check_filename,
-                    check_file_existence,
-                    generate_unique_filename,
-                    create_unique_filename,
-                    show_dir_in_tree,
-                    add_pkg_to_sys_path,
-                    find_executable_from_PATH_on_win,
-                    find_fn_from_PATH_on_win,
-                    )
-from ._platform import (check_platform,
-                        is_windows,
-                        is_linux,
-                        is_mac,
-                        get_terminal_width,
-                        get_terminal_height,
+from typing import TYPE_CHECKING
+from pyufunc.pkg_func_index import lazy_module
+
+# the public names are imported on first access, see pyufunc.pkg_func_index
+if TYPE_CHECKING:
+    from ._argparse import with_argparse
+    from ._io import (get_file_size,
+                      get_dir_size,
+                      create_tempfile,
+                      remove_file,
+                      add_dir_to_env,
+                      pickle_save,
+                      pickle_load,
+                      find_duplicate_files,
+                      remove_duplicate_files,
+                      )
+    from ._path import (path2linux,
+                        path2uniform,
+                        get_filenames_by_ext,
+                        get_files_by_ext,
+                        check_files_in_dir,
+                        check_filename,
+                        check_file_existence,
+                        generate_unique_filename,
+                        create_unique_filename,
+                        show_dir_in_tree,
+                        add_pkg_to_sys_path,
+                        find_executable_from_PATH_on_win,
+                        find_fn_from_PATH_on_win,
                         )
+    from ._walk import walk_dir
+    from ._dir_index import DirIndex
+    from ._array_store import save_arrays, load_arrays
+    from ._bulk_io import read_many, write_many
+    from ._platform import (check_platform,
+                            is_windows,
+                            is_linux,
+                            is_mac,
+                            get_terminal_width,
+                            get_terminal_height,
+                            )
 
 
 __all__ = [
@@ -69,6 +78,20 @@ __all__ = [
     "find_executable_from_PATH_on_win",
     "find_fn_from_PATH_on_win",
 
+    # walk
+    "walk_dir",
+
+    # dir_index
+    "DirIndex",
+
+    # array_store
+    "save_arrays",
+    "load_arrays",
+
+    # bulk_io
+    "read_many",
+    "write_many",
+
     # platform
     "check_platform",
     "is_windows",
@@ -78,3 +101,5 @@ __all__ = [
     "get_terminal_height",
 
 ]
+
+__getattr__, __dir__ = lazy_module(__name__)
@@ -0,0 +1,187 @@
+# -*- coding:utf-8 -*-
+##############################################################
+# Created Date: Monday, October 19th 2026
+# Contact Info: luoxiangyong01@gmail.com
+# Author/Copyright: Mr. Xiangyong Luo
+##############################################################
+
+
+from __future__ import absolute_import
+import contextlib
+import json
+import os
+import tempfile
+import uuid
+from pathlib import Path
+from typing import Union
+from pyufunc.util_magic._dependency_requires_decorator import requires
+from pyufunc.util_pathio._path import path2linux
+
+_STORE_VERSION = 1
+_MANIFEST_NAME = "manifest.json"
+_MMAP_MODES = (None, "r", "c")
+
+
+def _check_array_name(name: str) -> str:
+    if not isinstance(name, str):
+        raise TypeError(f"The input array names should be strings, got {type(name)}.")
+    if not name or name.startswith(".") or any(char in name for char in '/\\:*?"<>|\0'):
+        raise ValueError(f"The input array name should be a valid file name without a leading dot, got {name!r}.")
+    return name
+
+
+def _write_atomic(dir_path: str, file_name: str, write_func) -> None:
+    """Write a file by a temporary file, fsync and a rename."""
+    fd, tmp_path = tempfile.mkstemp(dir=dir_path, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            write_func(f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, os.path.join(dir_path, file_name))
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.remove(tmp_path)
+        raise
+
+
+def _read_manifest(dir_path: str) -> dict:
+    manifest_path = os.path.join(dir_path, _MANIFEST_NAME)
+    if not os.path.isfile(manifest_path):
+        raise FileNotFoundError(f"{dir_path} is not an array store, {_MANIFEST_NAME} is not found.")
+    with open(manifest_path, "r", encoding="utf-8") as f:
+        manifest = json.load(f)
+    if manifest.get("version") != _STORE_VERSION:
+        raise ValueError(f"The array store {dir_path} has an unsupported version {manifest.get('version')}.")
+    return manifest
+
+
+@requires("numpy", verbose=False)
+def save_arrays(arrays: dict, dir_path: Union[str, Path], *, overwrite: bool = True) -> str:
+    """Save a dict of NumPy arrays to a directory of .npy files and a manifest, to be memory mapped by load_arrays.
+
+    Each array is written to its own .npy file straight from its memory. The manifest is written last
+    and replaces the previous one by a rename, so the readers see either the old or the new arrays,
+    never a mix of both. The files of the previous save are removed afterwards, the processes which
+    already mapped them keep reading the old data.
+
+    Location:
+        pyufunc/util_pathio/_array_store.py
+
+    Args:
+        arrays (dict): {name: array}, the values are converted by np.asarray.
+            The names are used in the file names, e.g. {"skim_time": skim, "distance": dist}.
+        dir_path (str | Path): the directory of the store, created if it does not exist.
+        overwrite (bool, optional): replace an existing store in dir_path. Defaults to True.
+
+    Raises:
+        TypeError: if arrays is not a dict or a name is not a string.
+        ValueError: if a name is not a valid file name, or an array has the object dtype.
+        FileExistsError: if dir_path is a store and overwrite is False.
+
+    Returns:
+        str: the path of the store.
+
+    Examples:
+        >>> import numpy as np
+        >>> from pyufunc import save_arrays, load_arrays
+        >>> save_arrays({"skim_time": np.random.rand(5000, 5000)}, "./skims")
+        './skims'
+        >>> skims = load_arrays("./skims")  # instant, the pages are read on first access
+        >>> skims["skim_time"][12, 34]
+        0.5488135039273248
+    """
+    import numpy as np
+
+    # TDD, Test Driven Development: validate the input
+    if not isinstance(arrays, dict):
+        raise TypeError(f"The input arrays should be a dict of NumPy arrays, got {type(arrays)}.")
+    arrays = {_check_array_name(name): np.asarray(arr) for name, arr in arrays.items()}
+    for name, arr in arrays.items():
+        if arr.dtype.hasobject:
+            raise ValueError(f"The input array {name} should not have the object dtype, it can not be memory mapped.")
+
+    dir_path = path2linux(dir_path)
+    old_files = set()
+    if os.path.isfile(os.path.join(dir_path, _MANIFEST_NAME)):
+        if not overwrite:
+            raise FileExistsError(f"The array store {dir_path} exists, set overwrite=True to replace it.")
+        with contextlib.suppress(Exception):
+            old_files = {entry["file"] for entry in _read_manifest(dir_path)["arrays"].values()}
+    os.makedirs(dir_path, exist_ok=True)
+
+    # the files of each save have their own names, the mapped files of the previous save are not touched
+    generation = uuid.uuid4().hex[:8]
+    entries = {}
+    for name, arr in arrays.items():
+        file_name = f"{name}.{generation}.npy"
+        _write_atomic(dir_path, file_name, lambda f, arr=arr: np.save(f, arr, allow_pickle=False))
+        entries[name] = {"file": file_name, "dtype": arr.dtype.str, "shape": list(arr.shape)}
+
+    manifest = json.dumps({"version": _STORE_VERSION, "arrays": entries}, indent=2).encode("utf-8")
+    _write_atomic(dir_path, _MANIFEST_NAME, lambda f: f.write(manifest))
+
+    for file_name in old_files:
+        # on Windows a mapped file can not be removed, it is left to the next save
+        with contextlib.suppress(OSError):
+            os.remove(os.path.join(dir_path, file_name))
+    return dir_path
+
+
+@requires("numpy", verbose=False)
+def load_arrays(dir_path: Union[str, Path], names: Union[list, tuple] = None, *, mmap_mode: str = "r") -> dict:
+    """Open the arrays saved by save_arrays as read-only memory maps.
+
+    Opening an array reads its .npy header only, the data are read by the operating system when the
+    array is accessed. The processes mapping the same store share one copy in the page cache.
+
+    Location:
+        pyufunc/util_pathio/_array_store.py
+
+    Args:
+        dir_path (str | Path): the directory of the store.
+        names (list | tuple, optional): the names of the arrays to open. Defaults to None, all arrays.
+        mmap_mode (str, optional): "r" for read-only maps, "c" for copy-on-write maps, whose changes
+            stay in memory, or None to read the arrays into memory. Defaults to "r".
+
+    Raises:
+        FileNotFoundError: if dir_path is not an array store.
+        KeyError: if a name is not in the store.
+        ValueError: if mmap_mode is not None, "r" or "c", or a file does not match the manifest.
+
+    Returns:
+        dict: {name: np.memmap}, or {name: np.ndarray} if mmap_mode is None.
+
+    Examples:
+        >>> from pyufunc import load_arrays
+        >>> skims = load_arrays("./skims", names=["skim_time"])
+        >>> skims["skim_time"].shape
+        (5000, 5000)
+    """
+    import numpy as np
+
+    # TDD, Test Driven Development: validate the input
+    if mmap_mode not in _MMAP_MODES:
+        raise ValueError(f"The input mmap_mode should be one of {_MMAP_MODES}, got {mmap_mode}.")
+
+    dir_path = path2linux(dir_path)
+    # a save may remove the files of the manifest read just before, read the new manifest then
+    for attempt in range(2):
+        entries = _read_manifest(dir_path)["arrays"]
+        selected = list(entries) if names is None else list(names)
+        missing = [name for name in selected if name not in entries]
+        if missing:
+            raise KeyError(f"The arrays {missing} are not in the array store {dir_path}.")
+        try:
+            arrays = {name: np.load(os.path.join(dir_path, entries[name]["file"]),
+                                    mmap_mode=mmap_mode, allow_pickle=False)
+                      for name in selected}
+            break
+        except FileNotFoundError:
+            if attempt:
+                raise
+
+    for name, arr in arrays.items():
+        if arr.dtype.str != entries[name]["dtype"] or list(arr.shape) != entries[name]["shape"]:
+            raise ValueError(f"The file of the array {name} does not match the manifest of {dir_path}.")
+    return arrays
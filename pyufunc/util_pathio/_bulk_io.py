@@ -0,0 +1,303 @@
+# -*- coding:utf-8 -*-
+##############################################################
+# Created Date: Monday, October 19th 2026
+# Contact Info: luoxiangyong01@gmail.com
+# Author/Copyright: Mr. Xiangyong Luo
+##############################################################
+
+
+from __future__ import absolute_import
+import contextlib
+import itertools
+import os
+import uuid
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, Union
+from pyufunc.util_pathio._path import path2linux, create_unique_filename
+
+_FSYNC_MODES = (None, "each", "batch")
+_ON_EXISTS = ("overwrite", "rename", "error")
+_BINARY_TYPES = (bytes, bytearray, memoryview)
+
+
+def _default_max_workers() -> int:
+    # the default of ThreadPoolExecutor, the threads mostly wait for the disk
+    return min(32, (os.cpu_count() or 1) + 4)
+
+
+def _imap_unordered(func: Callable, items: Iterable, max_workers: int) -> Iterator[tuple]:
+    """Run func(*item) in a thread pool and yield (item, future) as they complete,
+    at most 2 * max_workers items are submitted at a time."""
+    items = iter(items)
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    try:
+        pending = {executor.submit(func, *item): item for item in itertools.islice(items, 2 * max_workers)}
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for fut in done:
+                # refill before yielding, the workers keep going while the caller handles the result
+                for item in itertools.islice(items, 1):
+                    pending[executor.submit(func, *item)] = item
+                yield pending.pop(fut), fut
+    finally:
+        # also reached if the caller stopped early
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def _read_one(path: str, read_func: Callable, binary: bool, encoding: str, readahead: bool):
+    with open(path, "rb" if binary else "r", encoding=None if binary else encoding) as f:
+        if readahead and hasattr(os, "posix_fadvise"):
+            with contextlib.suppress(OSError):
+                # read the whole file ahead in one request, instead of growing the readahead window
+                os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_WILLNEED)
+        return f.read() if read_func is None else read_func(f)
+
+
+def read_many(paths: Iterable[Union[str, Path]],
+              read_func: Callable = None,
+              *,
+              binary: bool = False,
+              encoding: str = "utf-8",
+              max_workers: int = None,
+              readahead: bool = True,
+              return_exceptions: bool = False) -> Iterator[tuple]:
+    """Read many files in a bounded thread pool and yield the contents as the reads complete.
+
+    At most 2 * max_workers files are queued at a time, so the paths could be a lazy iterable,
+    e.g. walk_dir, and the contents not yet consumed stay bounded.
+
+    Location:
+        pyufunc/util_pathio/_bulk_io.py
+
+    Args:
+        paths (Iterable[str | Path]): the files to read.
+        read_func (Callable, optional): called with the open file object in a worker thread, e.g. json.load
+            or pandas.read_csv. Defaults to None, read the whole content.
+        binary (bool, optional): open the files in binary mode. Defaults to False.
+        encoding (str, optional): the encoding in text mode. Defaults to "utf-8".
+        max_workers (int, optional): the number of threads. Defaults to min(32, os.cpu_count() + 4).
+        readahead (bool, optional): advise the operating system to read each file ahead in full
+            by os.posix_fadvise, where available. Defaults to True.
+        return_exceptions (bool, optional): yield the exception of a failed read as its content
+            instead of raising it. Defaults to False.
+
+    Raises:
+        ValueError: if max_workers is not greater than 0.
+
+    Yields:
+        tuple: (path, content), the path normalized by path2linux, in the order of completion.
+
+    Examples:
+        >>> import json
+        >>> from pyufunc import read_many, get_files_by_ext
+        >>> configs = dict(read_many(get_files_by_ext("./scenarios", "json"), json.load))
+    """
+
+    max_workers = _default_max_workers() if max_workers is None else max_workers
+    if max_workers <= 0:
+        raise ValueError("The input max_workers should be greater than 0.")
+
+    items = ((path2linux(path), read_func, binary, encoding, readahead) for path in paths)
+    with contextlib.closing(_imap_unordered(_read_one, items, max_workers)) as completed:
+        for item, fut in completed:
+            try:
+                yield item[0], fut.result()
+            except Exception as e:
+                if not return_exceptions:
+                    raise
+                yield item[0], e
+
+
+def _write_tmp(path: str, data, write_func: Callable, binary: bool, encoding: str, do_fsync: bool) -> str:
+    """Write data to a temporary file next to path, return the path of the temporary file."""
+    if binary is None:
+        binary = isinstance(data, _BINARY_TYPES)
+    dir_name, file_name = os.path.split(path)
+    tmp_path = os.path.join(dir_name, f".{file_name}.{uuid.uuid4().hex[:8]}.tmp")
+    # not mkstemp, the file gets the permissions of the umask as a file created by open
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0), 0o666)
+    try:
+        with os.fdopen(fd, "wb" if binary else "w", encoding=None if binary else encoding) as f:
+            if write_func is None:
+                f.write(data)
+            else:
+                write_func(data, f)
+            if do_fsync:
+                f.flush()
+                os.fsync(f.fileno())
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.remove(tmp_path)
+        raise
+    return tmp_path
+
+
+def _commit_tmp(tmp_path: str, path: str, on_exists: str) -> str:
+    """Rename the temporary file to path, return the path written."""
+    try:
+        if on_exists == "overwrite":
+            os.replace(tmp_path, path)
+            return path
+        while True:
+            try:
+                # a hard link does not replace an existing file, also one created by another process
+                os.link(tmp_path, path)
+            except FileExistsError:
+                pass
+            except OSError:
+                # no hard links on the file system, e.g. FAT
+                if not os.path.exists(path):
+                    os.replace(tmp_path, path)
+                    return path
+            else:
+                os.remove(tmp_path)
+                return path
+            if on_exists == "error":
+                raise FileExistsError(f"The file {path} exists, set on_exists to 'overwrite' or 'rename'.")
+            path = create_unique_filename(path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.remove(tmp_path)
+        raise
+
+
+def _write_one(path: str, data, write_func: Callable, binary: bool, encoding: str,
+               do_fsync: bool, on_exists: str) -> str:
+    return _commit_tmp(_write_tmp(path, data, write_func, binary, encoding, do_fsync), path, on_exists)
+
+
+def _fsync_dir(dir_path: str) -> None:
+    """Make the renames in the directory durable, not supported on Windows."""
+    if os.name == "nt":
+        return
+    with contextlib.suppress(OSError):
+        fd = os.open(dir_path, os.O_RDONLY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+
+def write_many(items: Union[dict, Iterable[tuple]],
+               write_func: Callable = None,
+               *,
+               binary: bool = None,
+               encoding: str = "utf-8",
+               max_workers: int = None,
+               on_exists: str = "overwrite",
+               fsync: str = "each",
+               return_exceptions: bool = False) -> Iterator[tuple]:
+    """Write many files in a bounded thread pool, each by a temporary file and a rename.
+
+    A reader never sees a partial file. With fsync="each", each file is fsynced before its rename and
+    yielded as it completes. With fsync="batch", all files are written and fsynced to temporary files
+    first, the concurrent fsyncs share the commits of the file system, then renamed together, so the
+    batch is only visible after all its data are on disk, and not at all if a write failed.
+    The directories are fsynced once at the end, the results of a batch are yielded then.
+
+    Note:
+        The function is a generator, the files are written while it is iterated, e.g. by list(write_many(...)).
+
+    Location:
+        pyufunc/util_pathio/_bulk_io.py
+
+    Args:
+        items (dict | Iterable[tuple]): {path: data} or (path, data) pairs, the directories are created
+            if they do not exist.
+        write_func (Callable, optional): called as write_func(data, file) in a worker thread, as json.dump
+            or pickle.dump, e.g. lambda df, f: df.to_csv(f, index=False). Defaults to None, file.write(data).
+        binary (bool, optional): open the files in binary mode. Defaults to None, binary for bytes-like data.
+        encoding (str, optional): the encoding in text mode. Defaults to "utf-8".
+        max_workers (int, optional): the number of threads. Defaults to min(32, os.cpu_count() + 4).
+        on_exists (str, optional): if a file exists, "overwrite" it, "rename" the new file by
+            create_unique_filename, e.g. data(1).csv, or raise FileExistsError for "error".
+            Defaults to "overwrite".
+        fsync (str, optional): "each", "batch" or None for no fsync, the renames keep the files whole
+            but not durable after a power loss. Defaults to "each".
+        return_exceptions (bool, optional): yield the exception of a failed write as its written path
+            instead of raising it, the other files of a batch are still written. Defaults to False.
+
+    Raises:
+        ValueError: if on_exists or fsync is not supported, or max_workers is not greater than 0.
+
+    Yields:
+        tuple: (path, written path), the paths normalized by path2linux, in the order of completion.
+
+    Examples:
+        >>> import json
+        >>> from pyufunc import write_many
+        >>> results = {f"./output/zone_{i}.json": {"zone_id": i} for i in range(1000)}
+        >>> for path, written_path in write_many(results, json.dump, fsync="batch"):
+                print(written_path)
+    """
+
+    if on_exists not in _ON_EXISTS:
+        raise ValueError(f"The input on_exists should be one of {_ON_EXISTS}, got {on_exists}.")
+    if fsync not in _FSYNC_MODES:
+        raise ValueError(f"The input fsync should be one of {_FSYNC_MODES}, got {fsync}.")
+    max_workers = _default_max_workers() if max_workers is None else max_workers
+    if max_workers <= 0:
+        raise ValueError("The input max_workers should be greater than 0.")
+
+    items = items.items() if isinstance(items, dict) else items
+    dir_paths = set()
+
+    def _normalized_items(*extra_args):
+        for path, data in items:
+            path = path2linux(path)
+            dir_path = os.path.dirname(path)
+            if dir_path not in dir_paths:
+                os.makedirs(dir_path, exist_ok=True)
+                dir_paths.add(dir_path)
+            yield (path, data, write_func, binary, encoding, fsync is not None, *extra_args)
+
+    if fsync != "batch":
+        with contextlib.closing(_imap_unordered(_write_one, _normalized_items(on_exists), max_workers)) as completed:
+            for item, fut in completed:
+                try:
+                    yield item[0], fut.result()
+                except Exception as e:
+                    if not return_exceptions:
+                        raise
+                    yield item[0], e
+        if fsync is not None:
+            for dir_path in dir_paths:
+                _fsync_dir(dir_path)
+        return
+
+    # write and fsync all temporary files, nothing is renamed if a write failed
+    tmp_paths, errors = [], []
+    try:
+        with contextlib.closing(_imap_unordered(_write_tmp, _normalized_items(), max_workers)) as completed:
+            for item, fut in completed:
+                try:
+                    tmp_paths.append((item[0], fut.result()))
+                except Exception as e:
+                    # the other writes are collected, their temporary files are removed below
+                    errors.append((item[0], e))
+        if errors and not return_exceptions:
+            raise errors[0][1]
+    except BaseException:
+        for _, tmp_path in tmp_paths:
+            with contextlib.suppress(OSError):
+                os.remove(tmp_path)
+        raise
+
+    # the renames are cheap, in order and in this thread, so the unique names of a batch do not collide
+    results = []
+    for i, (path, tmp_path) in enumerate(tmp_paths):
+        try:
+            results.append((path, _commit_tmp(tmp_path, path, on_exists)))
+        except Exception as e:
+            if not return_exceptions:
+                for _, tmp_path in tmp_paths[i + 1:]:
+                    with contextlib.suppress(OSError):
+                        os.remove(tmp_path)
+                raise
+            results.append((path, e))
+    for dir_path in dir_paths:
+        _fsync_dir(dir_path)
+    yield from results
+    yield from errors
@@ -0,0 +1,293 @@
+# -*- coding:utf-8 -*-
+##############################################################
+# Created Date: Monday, October 19th 2026
+# Contact Info: luoxiangyong01@gmail.com
+# Author/Copyright: Mr. Xiangyong Luo
+##############################################################
+
+
+from __future__ import absolute_import
+import contextlib
+import fnmatch
+import hashlib
+import os
+import pickle
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Iterator, Union
+from pyufunc.pkg_configs import config_dir_index
+from pyufunc.util_pathio._path import path2linux
+from pyufunc.util_pathio._walk import _normalize_ext
+
+_INDEX_VERSION = 1
+
+# a directory modified within this time before its scan may change again in the same
+# mtime tick without a visible change, it is scanned again at the next refresh
+_RACY_MTIME_NS = 2_000_000_000
+
+# the indexes opened in this process: {(root, index_path): DirIndex}
+_DIR_INDEXES = {}
+_DIR_INDEXES_LOCK = threading.Lock()
+
+
+class DirIndex:
+    """An index of a directory tree on disk, which re-scans only the directories whose mtime changed.
+
+    The index keeps the modification time of each directory and the size, modification time and
+    hash of each file. Creating, removing or renaming a file changes the mtime of its directory,
+    so a refresh costs one stat per directory instead of listing every directory and
+    stat-ing every file.
+
+    Location:
+        pyufunc/util_pathio/_dir_index.py
+
+    Args:
+        root (str | Path): the root directory of the tree.
+        index_path (str | Path, optional): the file keeping the index between runs.
+            Defaults to None, the index is only kept in memory.
+        ignore (list | tuple, optional): fnmatch patterns of the names to skip. Defaults to None.
+        algorithm (str, optional): the hash algorithm of file_hash, see calculate_file_hash. Defaults to "auto".
+
+    Note:
+        A file rewritten in place does not change the mtime of its directory, call refresh(verify_files=True)
+        to also stat the files of the unchanged directories. file_hash always checks the file itself.
+
+    Examples:
+        >>> from pyufunc import DirIndex
+        >>> index = DirIndex("/data/network", index_path="/data/network.index")
+        >>> index.refresh().get_files("csv")  # the first run scans the tree
+        ['/data/network/link.csv', '/data/network/node.csv']
+        >>> index.refresh().total_size()  # later runs stat the directories only
+        1048576
+    """
+
+    def __init__(self,
+                 root: Union[str, Path],
+                 index_path: Union[str, Path] = None,
+                 *,
+                 ignore: Union[list, tuple] = None,
+                 algorithm: str = "auto"):
+        self.root = path2linux(root)
+        self.index_path = None if index_path is None else path2linux(index_path)
+        self.ignore = tuple(ignore or ())
+        self.algorithm = algorithm
+        self.num_rescanned = 0
+
+        # {relative dir path: [mtime_ns, sub dir names, symlinked dir names, {file name: [size, mtime_ns, hash]}]}
+        self._dirs = {}
+        self._is_changed = False
+        self._lock = threading.RLock()
+        self._header = {"version": _INDEX_VERSION, "root": self.root, "ignore": self.ignore}
+        self._load()
+
+    def _load(self):
+        if not (self.index_path and os.path.isfile(self.index_path)):
+            return
+        try:
+            with open(self.index_path, "rb") as f:
+                header, dirs = pickle.load(f)
+        except Exception:
+            # damaged or written by another version, rebuild it
+            return
+        if header == self._header:
+            self._dirs = dirs
+
+    def save(self):
+        """Write the index to index_path if it changed, by a temporary file and a rename."""
+        with self._lock:
+            if not (self.index_path and self._is_changed):
+                return
+            index_dir = os.path.dirname(self.index_path)
+            os.makedirs(index_dir, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=index_dir, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    pickle.dump((self._header, self._dirs), f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp_path, self.index_path)
+            except BaseException:
+                with contextlib.suppress(OSError):
+                    os.remove(tmp_path)
+                raise
+            self._is_changed = False
+
+    def _abs_path(self, rel_dir: str, name: str = "") -> str:
+        path = f"{self.root}/{rel_dir}" if rel_dir else self.root
+        return f"{path}/{name}" if name else path
+
+    def _scan_dir(self, rel_dir: str, dir_mtime_ns: int, scan_started: int, old_entry: list) -> list:
+        old_files = old_entry[3] if old_entry else {}
+        sub_dirs, linked_dirs, files = [], [], {}
+        with os.scandir(self._abs_path(rel_dir)) as entries:
+            for entry in entries:
+                if self.ignore and any(fnmatch.fnmatch(entry.name, pat) for pat in self.ignore):
+                    continue
+                try:
+                    if entry.is_dir():
+                        (linked_dirs if entry.is_symlink() else sub_dirs).append(entry.name)
+                        continue
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                old_file = old_files.get(entry.name)
+                file_hash = None
+                if old_file and old_file[0] == stat.st_size and old_file[1] == stat.st_mtime_ns:
+                    file_hash = old_file[2]
+                files[entry.name] = [stat.st_size, stat.st_mtime_ns, file_hash]
+
+        if dir_mtime_ns >= scan_started - _RACY_MTIME_NS:
+            dir_mtime_ns = -1
+        return [dir_mtime_ns, sub_dirs, linked_dirs, files]
+
+    def _verify_files(self, rel_dir: str, dir_entry: list):
+        for name, file_entry in dir_entry[3].items():
+            try:
+                stat = os.stat(self._abs_path(rel_dir, name))
+            except OSError:
+                # removed in a way the directory mtime did not show, scan it at the next refresh
+                dir_entry[0] = -1
+                continue
+            if file_entry[0] != stat.st_size or file_entry[1] != stat.st_mtime_ns:
+                file_entry[:] = [stat.st_size, stat.st_mtime_ns, None]
+                self._is_changed = True
+
+    def refresh(self, verify_files: bool = False, save: bool = True) -> "DirIndex":
+        """Update the index, only the directories whose mtime changed are listed again.
+
+        Args:
+            verify_files (bool, optional): also stat the files of the unchanged directories,
+                to find the files rewritten in place. Defaults to False.
+            save (bool, optional): write the index to index_path if it changed. Defaults to True.
+
+        Raises:
+            FileNotFoundError: if root does not exist.
+            NotADirectoryError: if root is not a directory.
+
+        Returns:
+            DirIndex: the index itself.
+        """
+        with self._lock:
+            scan_started = time.time_ns()
+            num_rescanned = 0
+            new_dirs = {}
+            stack = [""]
+            while stack:
+                rel_dir = stack.pop()
+                old_entry = self._dirs.get(rel_dir)
+                try:
+                    dir_mtime_ns = os.stat(self._abs_path(rel_dir)).st_mtime_ns
+                    if old_entry is None or old_entry[0] < 0 or old_entry[0] != dir_mtime_ns:
+                        dir_entry = self._scan_dir(rel_dir, dir_mtime_ns, scan_started, old_entry)
+                        num_rescanned += 1
+                    else:
+                        dir_entry = old_entry
+                        if verify_files:
+                            self._verify_files(rel_dir, dir_entry)
+                except (PermissionError, FileNotFoundError, NotADirectoryError):
+                    # like os.walk, the subdirectories which can not be read are skipped
+                    if not rel_dir:
+                        raise
+                    continue
+                new_dirs[rel_dir] = dir_entry
+                stack.extend(f"{rel_dir}/{name}" if rel_dir else name for name in reversed(dir_entry[1]))
+
+            if num_rescanned or new_dirs.keys() != self._dirs.keys():
+                self._is_changed = True
+            self._dirs = new_dirs
+            self.num_rescanned = num_rescanned
+        if save:
+            self.save()
+        return self
+
+    def iter_files(self, file_ext: Union[str, list, tuple] = None, incl_subdir: bool = True) -> Iterator[tuple]:
+        """Yield (path, size, mtime_ns) of the indexed files, in the order of walk_dir, without a refresh.
+
+        Args:
+            file_ext (str | list | tuple, optional): only the names ending with the extensions. Defaults to None.
+            incl_subdir (bool, optional): also the files in the subdirectories. Defaults to True.
+        """
+        file_ext = _normalize_ext(file_ext)
+        # a refresh replaces the dict, the lock is not held while the caller iterates
+        dirs = self._dirs
+        stack = [""]
+        while stack:
+            rel_dir = stack.pop()
+            dir_entry = dirs.get(rel_dir)
+            if dir_entry is None:
+                continue
+            for name, (size, mtime_ns, _) in list(dir_entry[3].items()):
+                if file_ext is None or name.endswith(file_ext):
+                    yield self._abs_path(rel_dir, name), size, mtime_ns
+            if incl_subdir:
+                stack.extend(f"{rel_dir}/{name}" if rel_dir else name for name in reversed(dir_entry[1]))
+
+    def get_files(self, file_ext: Union[str, list, tuple] = None, incl_subdir: bool = True) -> list:
+        """Get the paths of the indexed files, see get_files_by_ext.
+
+        Without incl_subdir, the sub folders matching file_ext are listed too, as by get_files_by_ext.
+        """
+        if incl_subdir:
+            return [path for path, *_ in self.iter_files(file_ext, incl_subdir=True)]
+
+        ext = _normalize_ext(file_ext)
+        dir_entry = self._dirs.get("")
+        if dir_entry is None:
+            return []
+        names = [*dir_entry[3], *dir_entry[1], *dir_entry[2]]
+        return [self._abs_path("", name) for name in names if ext is None or name.endswith(ext)]
+
+    def total_size(self) -> int:
+        """The total size of the indexed files in bytes."""
+        return sum(size for _, size, _ in self.iter_files())
+
+    def file_hash(self, file_path: Union[str, Path]) -> str:
+        """Get the hash of a file in the tree, which is only calculated if the file changed.
+
+        Args:
+            file_path (str | Path): the path of the file.
+
+        Raises:
+            ValueError: if file_path is not in the tree.
+
+        Returns:
+            str: the hash of the file.
+        """
+        # imported here, pyufunc.util_pathio._io imports this module
+        from pyufunc.util_pathio._io import calculate_file_hash
+
+        file_path = path2linux(file_path)
+        if not file_path.startswith(f"{self.root}/"):
+            raise ValueError(f"The input file_path should be in {self.root}, got {file_path}.")
+        rel_dir, _, name = file_path[len(self.root) + 1:].rpartition("/")
+
+        stat = os.stat(file_path)
+        with self._lock:
+            dir_entry = self._dirs.get(rel_dir)
+            file_entry = None if dir_entry is None else dir_entry[3].get(name)
+            if file_entry and file_entry[2] and file_entry[:2] == [stat.st_size, stat.st_mtime_ns]:
+                return file_entry[2]
+
+        file_hash = calculate_file_hash(file_path, algorithm=self.algorithm)
+        with self._lock:
+            if dir_entry is not None and self._dirs.get(rel_dir) is dir_entry:
+                dir_entry[3][name] = [stat.st_size, stat.st_mtime_ns, file_hash]
+                self._is_changed = True
+        return file_hash
+
+
+def _get_dir_index(dir_path: Union[str, Path], index: Union[bool, str, Path]) -> DirIndex:
+    """Get the refreshed index of dir_path used in this process, index is True for a file
+    in config_dir_index["index_dir"] or the path of the index file."""
+    root = path2linux(dir_path)
+    if index is True:
+        index_name = hashlib.blake2b(root.encode("utf-8"), digest_size=16).hexdigest()
+        index_path = path2linux(os.path.join(config_dir_index["index_dir"], f"{index_name}.pkl"))
+    else:
+        index_path = path2linux(index)
+
+    with _DIR_INDEXES_LOCK:
+        dir_index = _DIR_INDEXES.get((root, index_path))
+        if dir_index is None:
+            dir_index = _DIR_INDEXES[(root, index_path)] = DirIndex(root, index_path)
+    return dir_index.refresh()
@@ -5,12 +5,24 @@
 # Author/Copyright: Mr. Xiangyong Luo
 ##############################################################
 
+from __future__ import annotations
 from pyufunc.util_pathio._path import path2linux, check_file_existence
+from pyufunc.util_pathio._walk import walk_dir, _to_linux_path
+from pyufunc.util_pathio._dir_index import _get_dir_index
+from pyufunc.util_magic._import_package import is_module_importable
 import os
 from pathlib import Path
 import uuid
 import sys
 import hashlib
+import json
+import contextlib
+import io
+import mmap
+import tempfile
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable
 
 
 def get_file_size(filename: str | Path, unit: str = "kb") -> str:
@@ -60,12 +72,18 @@ def get_file_size(filename: str | Path, unit: str = "kb") -> str:
     return f"Filesize: {filename_short} {size_bytes / 1024} kb"
 
 
-def get_dir_size(directory: str, unit: str = "kb") -> str:
-    """Get the size of a directory in the specified unit.
+def get_dir_size(directory: str,
+                 unit: str = "kb",
+                 max_workers: int | None = None,
+                 index: bool | str | Path = False) -> str:
+    """Get the size of a directory, including its subdirectories, in the specified unit.
 
     Args:
         directory (str): The directory to get the size of.
         unit (str, optional): the unit for the directory ('kb', 'mb', 'gb', 'tb'). Defaults to "kb".
+        max_workers (int, optional): scan the subdirectories in a thread pool, see walk_dir. Defaults to None.
+        index (bool | str | Path, optional): answer from an index of the directory on disk, which only
+            re-scans the subdirectories modified since the last call, see DirIndex. Defaults to False.
 
     Returns:
         str: the size of the directory in the specified unit.
@@ -91,11 +109,12 @@ def get_dir_size(directory: str, unit: str = "kb") -> str:
     # if not os.path.isdir(directory):
     #     return f"Directory {directory_short} does not found, please check the directory path and try again"
 
-    # Get the size of the directory in bytes
-    size_bytes = sum(
-        os.path.getsize(os.path.join(directory, file))
-        for file in os.listdir(directory)
-    )
+    # Get the size of the files in the directory and its subdirectories in bytes,
+    # the stat results come with the directory listing on Windows and are cached on the entries
+    if index:
+        size_bytes = _get_dir_index(directory, index).total_size()
+    else:
+        size_bytes = sum(entry.stat().st_size for entry in walk_dir(directory, with_stat=True, max_workers=max_workers))
 
     # Convert the size to the specified unit
     if unit.lower() == 'kb':
@@ -212,18 +231,124 @@ def add_dir_to_env(path_dir: str | Path = os.getcwd()) -> None:
     return None
 
 
-def pickle_save(obj: object, filename: str | Path, base_dir: str = os.getcwd()) -> None:
+# the files with out-of-band buffers or compression end with a trailer and this magic, plain pickles end with b"."
+_PICKLE_MAGIC = b"PYUFPKL\x02"
+_PICKLE_COMPRESSIONS = (None, "lz4", "zstd")
+_MMAP_BUFFER_SIZE = 1024 * 1024
+_READ_CHUNK_SIZE = 16 * 1024 * 1024
+
+
+def _open_compressed_writer(f, compression: str | None, compression_level: int | None):
+    """Wrap the file in a streaming compressor, closing the wrapper keeps f open."""
+    if compression is None:
+        return contextlib.nullcontext(f)
+    if compression == "lz4":
+        import lz4.frame
+        return lz4.frame.LZ4FrameFile(f, mode="wb", compression_level=compression_level or 0)
+    import zstandard
+    return zstandard.ZstdCompressor(level=compression_level or 3).stream_writer(f, closefd=False)
+
+
+class _RawStream(io.RawIOBase):
+    """A raw reader over a stream, or over [offset, offset + size) of a file, for io.BufferedReader."""
+
+    def __init__(self, stream, offset: int = None, size: int = None):
+        self._stream = stream
+        self._remaining = size
+        if offset is not None:
+            stream.seek(offset)
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        view = memoryview(buffer).cast("B")
+        if self._remaining is not None:
+            view = view[:self._remaining]
+        num_read = self._stream.readinto(view) or 0
+        if self._remaining is not None:
+            self._remaining -= num_read
+        return num_read
+
+
+def _open_region_reader(f, region: list, compression: str | None):
+    """A buffered reader of the decompressed data of a region [offset, size] of f."""
+    raw = io.BufferedReader(_RawStream(f, *region), buffer_size=_MMAP_BUFFER_SIZE)
+    if compression is None:
+        return raw
+    if compression == "lz4":
+        import lz4.frame
+        stream = lz4.frame.LZ4FrameFile(raw, mode="rb")
+    else:
+        import zstandard
+        stream = zstandard.ZstdDecompressor().stream_reader(raw, closefd=False)
+    # Unpickler needs read, readinto and readline
+    return io.BufferedReader(_RawStream(stream), buffer_size=_MMAP_BUFFER_SIZE)
+
+
+def _alloc_buffer(size: int):
+    """An anonymous memory map is not zero-filled up front as a bytearray, the pages are mapped when read into."""
+    return mmap.mmap(-1, size) if size >= _MMAP_BUFFER_SIZE else bytearray(size)
+
+
+def _readinto_exact(stream, buffer):
+    view = memoryview(buffer)
+    while view:
+        # in chunks, the decompressors copy a read of the whole view
+        num_read = stream.readinto(view[:_READ_CHUNK_SIZE])
+        if not num_read:
+            raise EOFError("The pickle file is truncated.")
+        view = view[num_read:]
+    return buffer
+
+
+def _read_pickle_trailer(f) -> dict | None:
+    """Read the trailer at the end of a file written by pickle_save, None for a plain pickle."""
+    file_size = f.seek(0, os.SEEK_END)
+    if file_size < len(_PICKLE_MAGIC) + 4:
+        return None
+    f.seek(file_size - len(_PICKLE_MAGIC) - 4)
+    tail = f.read(len(_PICKLE_MAGIC) + 4)
+    if tail[4:] != _PICKLE_MAGIC:
+        return None
+    trailer_size = int.from_bytes(tail[:4], "little")
+    f.seek(file_size - len(_PICKLE_MAGIC) - 4 - trailer_size)
+    return json.loads(f.read(trailer_size))
+
+
+def pickle_save(obj: object,
+                filename: str | Path,
+                base_dir: str = None,
+                *,
+                protocol: int = 5,
+                compression: str | None = None,
+                compression_level: int | None = None) -> None:
     """Save an object to a file using the pickle module.
 
     The object could be a function, a class, a list, dictionary, a string, an int, float, tuple, set, or any other object that can be pickled.
 
+    The pickle stream is written to the file as it is built, never held in memory as a whole. With
+    protocol 5, the data of NumPy arrays and pandas objects are written as out-of-band buffers
+    straight from their memory, without copies into the pickle stream. The file is written to a
+    temporary file and renamed, so a crash never leaves a partial file.
+
     Args:
         obj: The object to save.
         filename (str | Path): The filename to save the object to.
-        base_dir (str, optional): The directory to save the file in. Defaults to the current working directory.
+        base_dir (str, optional): The directory to save the file in. Defaults to None, the current working directory.
+        protocol (int, optional): the pickle protocol, 5 for out-of-band buffers. Defaults to 5.
+        compression (str, optional): None, "lz4" (fast, requires the lz4 package) or "zstd"
+            (smaller, requires the zstandard package). Defaults to None.
+        compression_level (int, optional): the level of the compression. Defaults to None, the default level.
 
     Raises:
         AssertionError: filename must be a string or Path, not {type(filename)}
+        ValueError: if compression is not None, "lz4" or "zstd".
+        ImportError: if the package of the compression is not installed.
+
+    Note:
+        An object without out-of-band buffers saved without compression is a plain pickle file,
+        the other files should be loaded by pickle_load.
 
     Returns:
         None
@@ -231,23 +356,54 @@ def pickle_save(obj: object, filename: str | Path, base_dir: str = os.getcwd())
     Example:
         >>> from pyufunc import pickle_save
         >>> pickle_save(obj, "file.pkl")
+        >>> pickle_save(od_matrix, "od_matrix.pkl", compression="zstd")
     """
     import pickle
 
     # TDD, Test Driven Development: validate the input
     assert isinstance(filename, (str, Path)), f"filename must be a string or Path, not {type(filename)}"
+    if compression not in _PICKLE_COMPRESSIONS:
+        raise ValueError(f"The input compression should be one of {_PICKLE_COMPRESSIONS}, got {compression}.")
+    if compression is not None:
+        pkg_name = {"lz4": "lz4", "zstd": "zstandard"}[compression]
+        if not is_module_importable(pkg_name):
+            raise ImportError(f"The compression {compression} requires the {pkg_name} package, "
+                              f"please install it by: pip install {pkg_name}")
 
-    # format the filename to linux path
-    filename = path2linux(filename)
+    # format the file path to linux path, filename is relative to base_dir unless it is absolute
+    file_path = path2linux(os.path.join(os.getcwd() if base_dir is None else base_dir, filename))
 
     # Create the directory if it does not exist
-    os.makedirs(base_dir, exist_ok=True)
-
-    file_path = os.path.join(base_dir, filename)
-
-    # Save the object to the file
-    with open(file_path, "wb") as f:
-        pickle.dump(obj, f)
+    os.makedirs(os.path.dirname(file_path), exist_ok=True)
+
+    # Save the object to a temporary file in the same directory and rename it
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(file_path), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            # the arrays are kept as views of their memory, not copied into the pickle stream
+            buffers = []
+            with _open_compressed_writer(f, compression, compression_level) as stream:
+                pickle.Pickler(stream, protocol=protocol,
+                               buffer_callback=buffers.append if protocol >= 5 else None).dump(obj)
+            pickle_size = f.tell()
+
+            if buffers or compression:
+                buffers = [buf.raw() for buf in buffers]
+                with _open_compressed_writer(f, compression, compression_level) as stream:
+                    for buf in buffers:
+                        stream.write(buf)
+                trailer = json.dumps({"compression": compression,
+                                      "pickle": [0, pickle_size],
+                                      "buffers": [pickle_size, f.tell() - pickle_size],
+                                      "buffer_sizes": [buf.nbytes for buf in buffers]}).encode("utf-8")
+                f.write(trailer + len(trailer).to_bytes(4, "little") + _PICKLE_MAGIC)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.remove(tmp_path)
+        raise
 
     return None
 
@@ -255,11 +411,19 @@ def pickle_save(obj: object, filename: str | Path, base_dir: str = os.getcwd())
 def pickle_load(filename: str | Path) -> object:
     """Load an object from a file using the pickle module.
 
+    The files written by pickle_save with out-of-band buffers or compression are read by streaming
+    each buffer into its own memory, which becomes the memory of the NumPy array, without copies.
+    The pickle stream is unpickled as it is read.
+
     Args:
         filename (str | Path): The filename to load the object from.
 
+    Raises:
+        FileNotFoundError: if the file does not exist.
+        ImportError: if the package of the compression is not installed.
+
     Returns:
-        object: _description_
+        object: the object saved in the file.
     """
 
     import pickle
@@ -273,68 +437,294 @@ def pickle_load(filename: str | Path) -> object:
 
     # Load the object from the file
     with open(filename, "rb") as f:
-        obj = pickle.load(f)
-
-    return obj
-
-
-def calculate_file_hash(file_path: str, block_size: int = 65536) -> str:
-    """Calculate the hash of a file using the MD5 algorithm.
+        trailer = _read_pickle_trailer(f)
+        if trailer is None:
+            f.seek(0)
+            return pickle.load(f)
+
+        # the buffers first, the unpickler takes them at the start
+        compression = trailer["compression"]
+        with _open_region_reader(f, trailer["buffers"], compression) as stream:
+            buffers = [_readinto_exact(stream, _alloc_buffer(size)) for size in trailer["buffer_sizes"]]
+        with _open_region_reader(f, trailer["pickle"], compression) as stream:
+            return pickle.Unpickler(stream, buffers=buffers).load()
+
+
+def _new_hasher(algorithm: str):
+    """Create a hash object: "xxhash" (xxh3_128, requires the xxhash package), or any algorithm of hashlib."""
+    if algorithm == "xxhash":
+        import xxhash
+        return xxhash.xxh3_128()
+    return hashlib.new(algorithm)
+
+
+def _resolve_hash_algorithm(algorithm: str) -> str:
+    if algorithm == "auto":
+        # xxhash is several times faster than BLAKE2, which is faster than MD5 on 64-bit platforms
+        return "xxhash" if is_module_importable("xxhash") else "blake2b"
+    if algorithm != "xxhash" and algorithm not in hashlib.algorithms_available:
+        raise ValueError(f"The input algorithm should be 'auto', 'xxhash' or one of {sorted(hashlib.algorithms_available)}, "
+                         f"got {algorithm}.")
+    if algorithm == "xxhash" and not is_module_importable("xxhash"):
+        raise ImportError("The algorithm xxhash requires the xxhash package, please install it by: pip install xxhash")
+    return algorithm
+
+
+def calculate_file_hash(file_path: str, block_size: int = 65536, algorithm: str = "md5") -> str:
+    """Calculate the hash of a file, using the MD5 algorithm by default.
 
     Args:
         file_path (str): The path to the file to calculate the hash of.
         block_size (int): block hash size to avoid over memory. Defaults to 65536.
+        algorithm (str): "md5", "blake2b", "xxhash", any algorithm of hashlib, or "auto" for the fastest
+            one available. Defaults to "md5".
 
     Returns:
         str: The hash of the file.
     """
-    hash_alg = hashlib.md5()
+    hash_alg = _new_hasher(_resolve_hash_algorithm(algorithm))
     with open(file_path, 'rb') as file:
         for block in iter(lambda: file.read(block_size), b''):
             hash_alg.update(block)
     return hash_alg.hexdigest()
 
 
-def find_duplicate_files(root_folder: str) -> list:
+def _calculate_partial_hash(file_path: str, file_size: int, block_size: int, algorithm: str) -> str:
+    """Hash the first and the last block of a file, which differ for most files of the same size."""
+    hash_alg = _new_hasher(algorithm)
+    with open(file_path, 'rb') as file:
+        hash_alg.update(file.read(block_size))
+        if file_size > block_size:
+            file.seek(max(file_size - block_size, block_size))
+            hash_alg.update(file.read(block_size))
+    return hash_alg.hexdigest()
+
+
+class _FileHashCache:
+    """A JSON file of {path: [size, mtime_ns, partial hash, full hash]}, an entry is only used
+    if the size and the modification time of the file did not change."""
+
+    def __init__(self, cache_path: str | Path | None, algorithm: str, block_size: int):
+        self.cache_path = None if cache_path is None else path2linux(cache_path)
+        self.header = {"algorithm": algorithm, "block_size": block_size}
+        self.files = {}
+        self.is_changed = False
+        if self.cache_path and os.path.isfile(self.cache_path):
+            try:
+                with open(self.cache_path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                if data.get("header") == self.header:
+                    self.files = data["files"]
+            except (ValueError, KeyError, OSError):
+                # damaged or written by another version, rebuild it
+                self.files = {}
+
+    def get(self, path: str, size: int, mtime_ns: int, kind: int) -> str | None:
+        entry = self.files.get(path)
+        if entry is not None and entry[0] == size and entry[1] == mtime_ns:
+            return entry[kind]
+        return None
+
+    def set(self, path: str, size: int, mtime_ns: int, kind: int, file_hash: str):
+        entry = self.files.get(path)
+        if entry is None or entry[0] != size or entry[1] != mtime_ns:
+            entry = self.files[path] = [size, mtime_ns, None, None]
+        entry[kind] = file_hash
+        self.is_changed = True
+
+    def save(self, alive_paths: set):
+        if not (self.cache_path and self.is_changed):
+            return
+        # drop the files removed since the last run
+        files = {path: entry for path, entry in self.files.items() if path in alive_paths}
+        os.makedirs(os.path.dirname(os.path.abspath(self.cache_path)), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(self.cache_path)), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"header": self.header, "files": files}, f)
+            os.replace(tmp_path, self.cache_path)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.remove(tmp_path)
+            raise
+
+
+def _group_by_hash(groups: list, hash_func: Callable, max_workers: int) -> list:
+    """Split each group of (path, stat) by hash_func(path, stat), keep the groups with more than one file."""
+    items = [item for group in groups for item in group]
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        hashes = list(executor.map(lambda item: hash_func(*item), items))
+
+    item_hash = dict(zip((path for path, _ in items), hashes))
+    result = []
+    for group in groups:
+        sub_groups = defaultdict(list)
+        for path, stat in group:
+            if item_hash[path] is not None:
+                sub_groups[item_hash[path]].append((path, stat))
+        result.extend(sub for sub in sub_groups.values() if len(sub) > 1)
+    return result
+
+
+def _find_duplicate_groups(root_folder: str,
+                           algorithm: str = "auto",
+                           max_workers: int | None = None,
+                           cache_path: str | Path | None = None,
+                           block_size: int = 65536,
+                           min_size: int = 0) -> list[list[tuple]]:
+    """Find the groups of identical files, each group is a sorted list of (path, os.stat_result)."""
+
+    algorithm = _resolve_hash_algorithm(algorithm)
+    max_workers = max_workers or min(32, (os.cpu_count() or 1) + 4)
+    cache = _FileHashCache(cache_path, algorithm, block_size)
+
+    # Step 1: group by size, a file with a unique size has no duplicate and is never read
+    size_groups = defaultdict(list)
+    alive_paths = set()
+    for entry in walk_dir(path2linux(root_folder), with_stat=True, max_workers=max_workers):
+        if entry.is_symlink():
+            continue
+        path, stat = _to_linux_path(entry.path), entry.stat()
+        alive_paths.add(path)
+        if stat.st_size >= min_size:
+            size_groups[stat.st_size].append((path, stat))
+    groups = [sorted(group, key=lambda item: item[0]) for group in size_groups.values() if len(group) > 1]
+
+    def _hash_with_cache(kind: int, hash_file: Callable) -> Callable:
+        # the hard links of the same file are hashed once
+        inode_hashes = {}
+
+        def _hash(path: str, stat: os.stat_result) -> str | None:
+            file_hash = cache.get(path, stat.st_size, stat.st_mtime_ns, kind)
+            if file_hash is not None:
+                return file_hash
+            inode_key = (stat.st_dev, stat.st_ino, stat.st_size, stat.st_mtime_ns)
+            file_hash = inode_hashes.get(inode_key) if stat.st_ino else None
+            if file_hash is None:
+                try:
+                    file_hash = hash_file(path, stat)
+                except OSError:
+                    # removed or not readable
+                    return None
+                inode_hashes[inode_key] = file_hash
+            cache.set(path, stat.st_size, stat.st_mtime_ns, kind, file_hash)
+            return file_hash
+        return _hash
+
+    # Step 2: hash the first and the last block, which covers the whole content of small files
+    groups = _group_by_hash(
+        groups,
+        _hash_with_cache(2, lambda path, stat: _calculate_partial_hash(path, stat.st_size, block_size, algorithm)),
+        max_workers)
+
+    # Step 3: fully hash the remaining candidates larger than two blocks
+    small_groups = [group for group in groups if group[0][1].st_size <= 2 * block_size]
+    large_groups = [group for group in groups if group[0][1].st_size > 2 * block_size]
+    if large_groups:
+        large_groups = _group_by_hash(
+            large_groups,
+            _hash_with_cache(3, lambda path, stat: calculate_file_hash(path, algorithm=algorithm)),
+            max_workers)
+
+    cache.save(alive_paths)
+    return sorted(small_groups + large_groups, key=lambda group: group[0][0])
+
+
+def find_duplicate_files(root_folder: str,
+                         *,
+                         algorithm: str = "auto",
+                         max_workers: int | None = None,
+                         cache_path: str | Path | None = None,
+                         min_size: int = 0) -> list:
     """Find duplicate files in a directory and its subdirectories.
 
+    The files are grouped by size first, then the files of the same size are compared by a hash
+    of their first and last blocks, and only the remaining candidates are fully hashed, so most
+    files are never read. The hashing runs in a thread pool.
+
     Args:
         root_folder (str): The root folder to search for duplicate files in.
+        algorithm (str, optional): "auto" for xxhash if installed else BLAKE2, "xxhash", "blake2b",
+            "md5" or any algorithm of hashlib. Defaults to "auto".
+        max_workers (int, optional): the number of hashing threads. Defaults to min(32, cpu count + 4).
+        cache_path (str | Path, optional): a JSON file to keep the hashes, a re-run only hashes the
+            files with a new path, size or modification time. Defaults to None.
+        min_size (int, optional): skip the files smaller than min_size bytes. Defaults to 0.
 
     Returns:
-        list: A list of duplicate files
+        list: A list of duplicate files, in each group of identical files
+            all files except the first one in sorted order.
 
+    Example:
+        >>> from pyufunc import find_duplicate_files
+        >>> find_duplicate_files("./data", cache_path="./data_hashes.json")
+        ['./data/backup/link.csv', './data/copy_of_link.csv']
     """
-    file_hashes = {}
-    duplicates = []
-
-    for dirpath, _, filenames in os.walk(root_folder):
-        for filename in filenames:
-            file_path = os.path.join(dirpath, filename)
-            file_hash = calculate_file_hash(file_path)
-
-            if file_hash in file_hashes:
-                duplicates.append(file_path)
-            else:
-                file_hashes[file_hash] = file_path
+    groups = _find_duplicate_groups(root_folder, algorithm=algorithm, max_workers=max_workers,
+                                    cache_path=cache_path, min_size=min_size)
+    return sorted(path for group in groups for path, _ in group[1:])
 
-    return duplicates
 
-
-def remove_duplicate_files(root_folder: str) -> None:
+def remove_duplicate_files(root_folder: str,
+                           *,
+                           mode: str = "remove",
+                           dry_run: bool = False,
+                           **kwargs) -> list:
     """Remove duplicate files in a directory and its subdirectories.
 
     Args:
         root_folder (str): The root folder to search for duplicate files in.
+        mode (str, optional): "remove" to delete the duplicates, or "hardlink" to replace each duplicate
+            by a hard link to the first file of its group, which keeps all paths and frees the space.
+            Defaults to "remove".
+        dry_run (bool, optional): only print what would be done. Defaults to False.
+        kwargs: the keyword arguments of find_duplicate_files, e.g. algorithm, max_workers and cache_path.
+
+    Raises:
+        ValueError: if mode is not "remove" or "hardlink".
 
     Returns:
-        None
-    """
-    duplicates = find_duplicate_files(root_folder)
+        list: the duplicate files removed or hard linked, or which would be in the dry run.
 
-    for duplicate in duplicates:
-        os.remove(duplicate)
-        print(f'Removed duplicate file: {duplicate}')
+    Example:
+        >>> from pyufunc import remove_duplicate_files
+        >>> remove_duplicate_files("./data", mode="hardlink", dry_run=True)
+        [dry run] Would hardlink duplicate file: ./data/copy_of_link.csv -> ./data/backup/link.csv
+    """
+    if mode not in {"remove", "hardlink"}:
+        raise ValueError(f"The input mode should be 'remove' or 'hardlink', got {mode}.")
+
+    processed = []
+    for (original, original_stat), *duplicates in _find_duplicate_groups(root_folder, **kwargs):
+        for duplicate, stat in duplicates:
+            if mode == "hardlink":
+                if (stat.st_dev, stat.st_ino) == (original_stat.st_dev, original_stat.st_ino):
+                    # already a hard link of the original
+                    continue
+                if stat.st_dev != original_stat.st_dev:
+                    print(f"  :Info: {duplicate} is on another device than {original}, skipped.")
+                    continue
+
+            if dry_run:
+                action = "remove" if mode == "remove" else "hardlink"
+                print(f"[dry run] Would {action} duplicate file: {duplicate}"
+                      + (f" -> {original}" if mode == "hardlink" else ""))
+            elif mode == "remove":
+                os.remove(duplicate)
+                print(f'Removed duplicate file: {duplicate}')
+            else:
+                # link to a temporary name and rename it, the duplicate path never goes missing
+                tmp_path = f"{duplicate}.{uuid.uuid4().hex}.tmp"
+                os.link(original, tmp_path)
+                try:
+                    os.replace(tmp_path, duplicate)
+                except BaseException:
+                    with contextlib.suppress(OSError):
+                        os.remove(tmp_path)
+                    raise
+                print(f'Hardlinked duplicate file: {duplicate} -> {original}')
+            processed.append(duplicate)
+    return processed
 
 # def write_yaml_file(func=None, *, log_dir: str | Path = LOGGING_FOLDER, ):
 #     import yaml
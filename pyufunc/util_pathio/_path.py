@@ -8,11 +8,12 @@
 
 from __future__ import absolute_import
 from pathlib import Path
+import fnmatch
 import os
-import re
 import sys
 from typing import Callable, Union
 from pyufunc.pkg_configs import config_color
+from pyufunc.util_pathio._walk import walk_dir, _to_linux_path
 
 
 def path2linux(path: str | Path) -> str:
@@ -89,7 +90,10 @@ def path2uniform(path: str | Path) -> str:
         return str(path).replace("\\", "/")
 
 
-def get_filenames_by_ext(dir_path: str | Path, file_ext: str | list = "csv", incl_subdir: bool = False) -> list[str]:
+def get_filenames_by_ext(dir_path: str | Path,
+                         file_ext: str | list = "csv",
+                         incl_subdir: bool = False,
+                         index: bool | str | Path = False) -> list[str]:
     """Get a list of filenames in a folder by file extension
 
     Location:
@@ -105,6 +109,9 @@ def get_filenames_by_ext(dir_path: str | Path, file_ext: str | list = "csv", inc
         dir_path (str | Path): the path to the folder
         file_ext (str | list | tuple, optional): the file extension to be specified. Defaults to "csv".
         incl_subdir (bool, optional): Whether to traverse all files inside sub folder. Defaults to False.
+        index (bool | str | Path, optional): answer from an index of the folder on disk, which only
+            re-scans the sub folders modified since the last call, see DirIndex. True for an index file
+            in config_dir_index["index_dir"], or the path of the index file. Defaults to False.
 
     Returns:
         list[str]: a list of filenames with absolute paths
@@ -115,34 +122,25 @@ def get_filenames_by_ext(dir_path: str | Path, file_ext: str | list = "csv", inc
         ['C:/Users/Administrator/Desktop/test/test.py']
     """
 
-    # convert file extension to tuple
-    if isinstance(file_ext, str):
-        file_ext = (file_ext,)
-    if isinstance(file_ext, (list, tuple)):
-        file_ext = tuple(file_ext)
-
-    if not file_ext:
-        file_ext = ("*",)
+    if index:
+        # imported here, the index module imports this module
+        from pyufunc.util_pathio._dir_index import _get_dir_index
+        return _get_dir_index(dir_path, index).get_files(file_ext, incl_subdir)
 
+    # walk the folder once by os.scandir, the extension filter is applied to the names
+    dir_path = path2linux(dir_path)
     if incl_subdir:
-        files_list = []
-        for root, _, files in os.walk(dir_path):
-            files_list.extend([os.path.join(root, file) for file in files])
-
-        if file_ext[0] in {None, "*", "all"}:
-            return [path2linux(file) for file in files_list]
-
-        return [path2linux(file) for file in files_list if file.endswith(file_ext)]
+        entries = walk_dir(dir_path, file_ext)
+    else:
+        # the first layer of the folder, the sub folders matching the extension included
+        entries = walk_dir(dir_path, file_ext, max_level=1, include_dirs=True)
+    return [_to_linux_path(entry.path) for entry in entries]
 
-    # Files in the first layer of the folder
-    if file_ext[0] in {None, "*", "all"}:
-        return [path2linux(os.path.join(dir_path, file)) for file in os.listdir(dir_path)]
 
-    return [path2linux(os.path.join(dir_path, file)) for file in os.listdir(dir_path)
-            if file.endswith(file_ext)]
-
-
-def get_files_by_ext(dir_path: str | Path, file_ext: str | list = "csv", incl_subdir: bool = False) -> list[str]:
+def get_files_by_ext(dir_path: str | Path,
+                     file_ext: str | list = "csv",
+                     incl_subdir: bool = False,
+                     index: bool | str | Path = False) -> list[str]:
     """Get a list of filenames in a folder by file extension
 
     Location:
@@ -158,6 +156,9 @@ def get_files_by_ext(dir_path: str | Path, file_ext: str | list = "csv", incl_su
         dir_path (str | Path): the path to the folder
         file_ext (str | list | tuple, optional): the file extension to be specified. Defaults to "csv".
         incl_subdir (bool, optional): Whether to traverse all files inside sub folder. Defaults to False.
+        index (bool | str | Path, optional): answer from an index of the folder on disk, which only
+            re-scans the sub folders modified since the last call, see DirIndex. True for an index file
+            in config_dir_index["index_dir"], or the path of the index file. Defaults to False.
 
     Returns:
         list[str]: a list of filenames with absolute paths
@@ -169,34 +170,25 @@ def get_files_by_ext(dir_path: str | Path, file_ext: str | list = "csv", incl_su
 
     """
 
-    # convert file extension to tuple
-    if isinstance(file_ext, str):
-        file_ext = (file_ext,)
-    if isinstance(file_ext, (list, tuple)):
-        file_ext = tuple(file_ext)
-
-    if not file_ext:
-        file_ext = ("*",)
+    if index:
+        # imported here, the index module imports this module
+        from pyufunc.util_pathio._dir_index import _get_dir_index
+        return _get_dir_index(dir_path, index).get_files(file_ext, incl_subdir)
 
+    # walk the folder once by os.scandir, the extension filter is applied to the names
+    dir_path = path2linux(dir_path)
     if incl_subdir:
-        files_list = []
-        for root, _, files in os.walk(dir_path):
-            files_list.extend([os.path.join(root, file) for file in files])
+        entries = walk_dir(dir_path, file_ext)
+    else:
+        # the first layer of the folder, the sub folders matching the extension included
+        entries = walk_dir(dir_path, file_ext, max_level=1, include_dirs=True)
+    return [_to_linux_path(entry.path) for entry in entries]
 
-        if file_ext[0] in {None, "*", "all"}:
-            return [path2linux(file) for file in files_list]
 
-        return [path2linux(file) for file in files_list if file.endswith(file_ext)]
-
-    # Files in the first layer of the folder
-    if file_ext[0] in {None, "*", "all"}:
-        return [path2linux(os.path.join(dir_path, file)) for file in os.listdir(dir_path)]
-
-    return [path2linux(os.path.join(dir_path, file)) for file in os.listdir(dir_path)
-            if file.endswith(file_ext)]
-
-
-def check_files_in_dir(filenames: list[str | Path], dir_path: str | Path = "", incl_subdir: bool = False) -> bool:
+def check_files_in_dir(filenames: list[str | Path],
+                       dir_path: str | Path = "",
+                       incl_subdir: bool = False,
+                       index: bool | str | Path = False) -> bool:
     """Check if provided list of files exist in the given directory
 
     Location:
@@ -210,6 +202,9 @@ def check_files_in_dir(filenames: list[str | Path], dir_path: str | Path = "", i
         filenames (list[str  |  Path]): a list of filenames to be checked
         dir_path (str | Path, optional): the given directory. Defaults to "".
             if dir_path is not given, use the current working directory
+        incl_subdir (bool, optional): Whether to check the files inside sub folders. Defaults to False.
+        index (bool | str | Path, optional): use an index of the directory on disk, see get_files_by_ext.
+            Defaults to False.
 
     Returns:
         bool: True if all files exist in the given directory, otherwise False
@@ -226,7 +221,7 @@ def check_files_in_dir(filenames: list[str | Path], dir_path: str | Path = "", i
 
     # get all filenames in the given directory
     filenames_in_dir = get_filenames_by_ext(
-        dir_path, file_ext="*", incl_subdir=incl_subdir)
+        dir_path, file_ext="*", incl_subdir=incl_subdir, index=index)
 
     # format the input check filenames
     filenames = [path2linux(filename) for filename in filenames]
@@ -400,7 +395,8 @@ def show_dir_in_tree(dir_name: Union[str, Path],
 
     Args:
         kwargs: Arguments for ``root = Path(*args, **kwargs)``
-        pattern (str)   : Arguments for ``root.glob(pattern)``
+        pattern (str)   : Arguments for ``root.glob(pattern)``, e.g. "*.py" for the root folder only or
+            "**/*.py" for all folders. A pattern without wildcards, e.g. ".py", is matched in all folders.
         show_all (bool) : Whether not to ignore entries starting with .
         max_level (int) : Max display depth of the directory tree.
 
@@ -459,10 +455,10 @@ def show_dir_in_tree(dir_name: Union[str, Path],
         return func
 
     class Tree:
-        def __init__(self, filepaths=[], show_all=False, max_level=-1):
+        def __init__(self, filepaths=frozenset(), show_all=False, max_level=-1):
             """Initialize Tree class.
             Args:
-                filepaths (list): Filepaths which is to be printed.
+                filepaths (set): Filepaths which is to be printed, with their parent folders.
                 show_all (bool) : Whether not to ignore entries starting with .
                 max_level (int) : Max display depth of the directory tree.
             """
@@ -480,12 +476,6 @@ def show_dir_in_tree(dir_name: Union[str, Path],
             else:
                 self.num_files += 1
 
-        @staticmethod
-        def path_join(dir_name: str, *filename: str) -> str:
-            """Join two or more pathname components, inserting '/' as needed, and remove './' at the beginning."""
-
-            return re.sub(pattern=r"^\.\/", repl="", string=os.path.join(dir_name, *filename))
-
         def run(self, dirname):
             """Run ``tree`` command.
 
@@ -506,16 +496,8 @@ def show_dir_in_tree(dir_name: Union[str, Path],
                 depth (int)        : current depth.
                 print_prefix (str) : Prefix for clean output.
             """
-            filenames = sorted(
-                [
-                    fn
-                    for fn in os.listdir(dirname)
-                    if len(self.filepaths) != 0 and any(
-                        fp.startswith(self.path_join(dirname, fn))
-                        for fp in self.filepaths
-                    )
-                ]
-            )
+            # the matched paths and their parent folders, a set lookup per entry
+            filenames = sorted(fn for fn in os.listdir(dirname) if os.path.join(dirname, fn) in self.filepaths)
             num_filenames = len(filenames)
 
             prefixes = ("├── ", "│   ")
@@ -543,15 +525,31 @@ def show_dir_in_tree(dir_name: Union[str, Path],
     if not isinstance(pattern, str):
         raise ValueError("pattern should be a string.")
 
-    # check pattern
-    if "**/*" not in pattern:
+    # check pattern, a plain suffix such as ".py" matches in all folders
+    if not any(char in pattern for char in "*?["):
         pattern = f"**/*{pattern}"
 
     args = (dir_name, )
     root = Path(*args, **kwargs)
-    filepaths = [str(p) for p in root.glob(pattern)]
-    tree = Tree(filepaths=filepaths, show_all=show_all, max_level=max_level)
-    tree.run(str(root))
+    name_pattern = pattern[3:] if pattern.startswith("**/") else ""
+    if name_pattern and "/" not in name_pattern and "**" not in name_pattern:
+        # match the names while walking the tree once, e.g. "**/*.py"
+        filepaths = [entry.path for entry in walk_dir(str(root), include_dirs=True)
+                     if fnmatch.fnmatch(entry.name, name_pattern)]
+    else:
+        # the other patterns as Path.glob, e.g. "*.py" in the root only or "a/**/*.py"
+        filepaths = [os.path.join(str(root), str(p.relative_to(root))) for p in root.glob(pattern)]
+
+    # a folder is shown if any matched path is inside it
+    visible_paths = set()
+    root_str = str(root)
+    for filepath in filepaths:
+        while filepath not in visible_paths and filepath != root_str:
+            visible_paths.add(filepath)
+            filepath = os.path.dirname(filepath)
+
+    tree = Tree(filepaths=visible_paths, show_all=show_all, max_level=max_level)
+    tree.run(root_str)
 
 
 def add_pkg_to_sys_path(pkg_name: str, verbose: bool = True) -> bool:
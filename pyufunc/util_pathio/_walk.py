@@ -0,0 +1,144 @@
+# -*- coding:utf-8 -*-
+##############################################################
+# Created Date: Monday, October 19th 2026
+# Contact Info: luoxiangyong01@gmail.com
+# Author/Copyright: Mr. Xiangyong Luo
+##############################################################
+
+
+from __future__ import absolute_import
+import fnmatch
+import os
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from pathlib import Path
+from typing import Iterator, Union
+
+_ALL_EXT = {None, "*", "all"}
+
+
+def _to_linux_path(path: str) -> str:
+    """Convert the path of a DirEntry under a path2linux root, only the separators on Windows differ."""
+    return path if os.sep == "/" else path.replace("\\", "/")
+
+
+def _normalize_ext(file_ext: Union[str, list, tuple, None]) -> Union[tuple, None]:
+    """Convert file_ext to a tuple for str.endswith, None for all files."""
+    if isinstance(file_ext, (list, tuple, set)):
+        file_ext = tuple(file_ext)
+    elif file_ext not in _ALL_EXT:
+        file_ext = (file_ext,)
+    if not file_ext or file_ext in _ALL_EXT or file_ext[0] in _ALL_EXT:
+        return None
+    return file_ext
+
+
+def _scan_one_dir(dir_path: str, level: int, file_ext: tuple, ignore: tuple, include_dirs: bool,
+                  follow_symlinks: bool, with_stat: bool, max_level: int) -> tuple:
+    """Scan one directory, return the matched entries and the (path, level) of the subdirectories to scan."""
+    matched = []
+    sub_dirs = []
+    try:
+        with os.scandir(dir_path) as entries:
+            for entry in entries:
+                name = entry.name
+                if ignore and any(fnmatch.fnmatch(name, pat) for pat in ignore):
+                    continue
+                try:
+                    # like os.walk, a symlink to a directory is a directory, but not followed by default
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+                if is_dir:
+                    if max_level < 0 or level < max_level:
+                        if follow_symlinks or not entry.is_symlink():
+                            sub_dirs.append((entry.path, level + 1))
+                    if not include_dirs:
+                        continue
+                if file_ext is not None and not name.endswith(file_ext):
+                    continue
+                if with_stat:
+                    try:
+                        # cached on the entry, in the worker thread if any
+                        entry.stat()
+                    except OSError:
+                        continue
+                matched.append(entry)
+    except (PermissionError, FileNotFoundError, NotADirectoryError):
+        # like os.walk, the subdirectories which can not be read are skipped
+        if level == 1:
+            raise
+    return matched, sub_dirs
+
+
+def walk_dir(dir_path: Union[str, Path],
+             file_ext: Union[str, list, tuple, None] = None,
+             *,
+             max_level: int = -1,
+             ignore: Union[str, list, tuple, None] = None,
+             include_dirs: bool = False,
+             follow_symlinks: bool = False,
+             with_stat: bool = False,
+             max_workers: int = None) -> Iterator[os.DirEntry]:
+    """Walk a directory tree by os.scandir and yield the matched entries as they are found.
+
+    The tree is walked iteratively without recursion. The os.DirEntry objects keep the file type
+    from the directory listing and cache their stat results, so e.g. entry.stat().st_size
+    needs at most one system call per file.
+
+    Location:
+        pyufunc/util_pathio/_walk.py
+
+    Args:
+        dir_path (str | Path): the root directory, the paths of the entries start with it.
+        file_ext (str | list | tuple, optional): only yield the names ending with the extensions,
+            e.g. "csv" or [".py", ".pyx"]. Defaults to None, "*" or "all" for all files.
+        max_level (int, optional): the levels to walk, 1 for the root only. Defaults to -1, all levels.
+        ignore (str | list | tuple, optional): fnmatch patterns of the names to skip, an ignored directory
+            is not walked, e.g. [".git", "__pycache__", "*.tmp"]. Defaults to None.
+        include_dirs (bool, optional): also yield the directories. Defaults to False.
+        follow_symlinks (bool, optional): walk into the symlinks to directories. Defaults to False.
+        with_stat (bool, optional): call entry.stat() while scanning, in the worker threads if max_workers
+            is set. The entries which can not be stat are skipped. Defaults to False.
+        max_workers (int, optional): scan the subdirectories in a thread pool, which helps on network
+            file systems and cold caches. The order of the entries is not deterministic. Defaults to None.
+
+    Raises:
+        FileNotFoundError: if dir_path does not exist.
+        NotADirectoryError: if dir_path is not a directory.
+
+    Yields:
+        os.DirEntry: the matched files, and the directories if include_dirs.
+
+    Examples:
+        >>> from pyufunc import walk_dir
+        >>> sum(entry.stat().st_size for entry in walk_dir("./data", "csv", ignore=[".git"], with_stat=True))
+        1048576
+    """
+
+    dir_path = os.fspath(dir_path)
+    if isinstance(ignore, str):
+        ignore = (ignore,)
+    scan_args = (_normalize_ext(file_ext), tuple(ignore or ()), include_dirs, follow_symlinks,
+                 with_stat, max_level)
+
+    if not max_workers or max_workers <= 1:
+        stack = [(dir_path, 1)]
+        while stack:
+            matched, sub_dirs = _scan_one_dir(*stack.pop(), *scan_args)
+            yield from matched
+            # depth first, in the listing order
+            stack.extend(reversed(sub_dirs))
+        return
+
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    try:
+        pending = {executor.submit(_scan_one_dir, dir_path, 1, *scan_args)}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for fut in done:
+                matched, sub_dirs = fut.result()
+                pending.update(executor.submit(_scan_one_dir, *sub_dir, *scan_args) for sub_dir in sub_dirs)
+                yield from matched
+    finally:
+        # also reached if the caller stopped early
+        executor.shutdown(wait=True, cancel_futures=True)
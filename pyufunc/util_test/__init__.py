@@ -11,16 +11,21 @@
 # TODO: pytest for warning
 
 
-from ._pytest import (
-    pytest_show_naming_convention,
-    pytest_show_assert,
-    pytest_show_raise,
-    pytest_show_warning,
-    pytest_show_fixture,
-    pytest_show_parametrize,
-    pytest_show_database,
-    pytest_show_skip_xfail
-)
+from typing import TYPE_CHECKING
+from pyufunc.pkg_func_index import lazy_module
+
+# the public names are imported on first access, see pyufunc.pkg_func_index
+if TYPE_CHECKING:
+    from ._pytest import (
+        pytest_show_naming_convention,
+        pytest_show_assert,
+        pytest_show_raise,
+        pytest_show_warning,
+        pytest_show_fixture,
+        pytest_show_parametrize,
+        pytest_show_database,
+        pytest_show_skip_xfail
+    )
 
 
 __all__ = [
@@ -34,3 +39,5 @@ __all__ = [
     "pytest_show_database",
     "pytest_show_skip_xfail"
 ]
+
+__getattr__, __dir__ = lazy_module(__name__)
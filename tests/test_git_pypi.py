@@ -0,0 +1,76 @@
+# -*- coding:utf-8 -*-
+##############################################################
+# Created Date: Monday, October 19th 2026
+# Contact Info: luoxiangyong01@gmail.com
+# Author/Copyright: Mr. Xiangyong Luo
+##############################################################
+
+from __future__ import absolute_import
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import pytest
+
+from _path_setup import add_pkg_to_sys_path
+add_pkg_to_sys_path("pyufunc", False)
+
+from pyufunc import pypi_downloads_bulk
+from pyufunc.util_git_pypi._pypi import _extract_total_downloads, _PYPI_DOWNLOADS_CACHE
+
+_FIXTURE_PAGES = {
+    "/projects/pandas": ('<html><body><div><span>Total downloads</span></div>'
+                         '<div class="value"><b>4,051,345,849</b></div></body></html>'),
+    "/projects/numpy": ('<html><body><h2>Total downloads</h2>'
+                        '<div>12,345</div></body></html>'),
+}
+
+
+class _FixtureHandler(BaseHTTPRequestHandler):
+    request_count = 0
+
+    def do_GET(self):
+        _FixtureHandler.request_count += 1
+        page = _FIXTURE_PAGES.get(self.path)
+        self.send_response(200 if page else 404)
+        self.end_headers()
+        self.wfile.write((page or "Not Found").encode("utf-8"))
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture(scope="module")
+def fixture_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _FixtureHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/projects/{{pkg_name}}"
+    server.shutdown()
+
+
+class TestPypiDownloadsBulk:
+    def test_extract_total_downloads(self):
+        assert _extract_total_downloads(_FIXTURE_PAGES["/projects/pandas"]) == {"Total downloads": 4051345849.0}
+        assert _extract_total_downloads("<html></html>") == {}
+
+    def test_bulk_downloads(self, fixture_url):
+        res = pypi_downloads_bulk(["pandas", "numpy", "pandas123"], url=fixture_url, cache_ttl=0, verbose=False)
+        assert res == {"pandas": {"Total downloads": 4051345849.0},
+                       "numpy": {"Total downloads": 12345.0},
+                       "pandas123": 0}
+
+    def test_bulk_downloads_cache(self, fixture_url):
+        _PYPI_DOWNLOADS_CACHE.clear()
+        pypi_downloads_bulk(["pandas", "numpy"], url=fixture_url, verbose=False)
+        count = _FixtureHandler.request_count
+        res = pypi_downloads_bulk(["numpy", "pandas"], url=fixture_url, verbose=False)
+        assert _FixtureHandler.request_count == count
+        assert list(res) == ["numpy", "pandas"]
+
+    def test_expired_results_are_removed(self, fixture_url):
+        _PYPI_DOWNLOADS_CACHE.clear()
+        _PYPI_DOWNLOADS_CACHE[(fixture_url, "old")] = (0, {"Total downloads": 1.0})
+        pypi_downloads_bulk(["pandas"], url=fixture_url, verbose=False)
+        assert list(_PYPI_DOWNLOADS_CACHE) == [(fixture_url, "pandas")]
+
+    def test_invalid_pkg_names(self):
+        with pytest.raises(TypeError):
+            pypi_downloads_bulk("pandas")
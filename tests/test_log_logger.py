@@ -0,0 +1,197 @@
+# -*- coding:utf-8 -*-
+##############################################################
+# Created Date: Monday, October 19th 2026
+# Contact Info: luoxiangyong01@gmail.com
+# Author/Copyright: Mr. Xiangyong Luo
+##############################################################
+
+from __future__ import absolute_import
+import logging
+import multiprocessing
+import os
+import subprocess
+import sys
+import threading
+import pytest
+
+from _path_setup import add_pkg_to_sys_path
+add_pkg_to_sys_path("pyufunc", False)
+
+from pyufunc.util_log._lg_logger import KuaiLogger
+from pyufunc.util_log._lg_async_writer import AsyncLogWriter
+from pyufunc.util_log._lg_collector import LogCollector, CollectorFileWriter
+from multiprocessing.connection import Listener
+from pathlib import Path
+
+
+def _read_log_lines(log_dir) -> list:
+    return [line for f in sorted(log_dir.iterdir()) for line in f.read_text(encoding="utf8").splitlines()]
+
+
+def _log_from_process(address, proc_id: int, num_msgs: int):
+    logger = KuaiLogger(f"p{proc_id}", level=logging.INFO, is_add_file_handler=True,
+                        formatter_template="{name} - {message}", log_collector_address=address)
+    for i in range(num_msgs):
+        logger.info(i)
+    logger.flush()
+
+
+class TestKuaiLoggerFormat:
+    def test_frame_fields(self, tmp_path):
+        logger = KuaiLogger("test_format", level=logging.INFO, is_add_file_handler=True,
+                            log_path=str(tmp_path), log_filename="format.log",
+                            formatter_template="{name} - {filename}:{lineno} - {funcName} - {levelname} - {message}")
+        logger.log(logging.INFO, "hello", stacklevel=2)
+        lineno = sys._getframe().f_lineno - 1
+        assert _read_log_lines(tmp_path) == [
+            f"test_format - test_log_logger.py:{lineno} - test_frame_fields - INFO - hello"]
+
+    def test_color_by_level(self):
+        assert KuaiLogger._add_color("msg", logging.ERROR) == "\033[0;35mmsg\033[0m"
+        assert KuaiLogger._add_color("msg", 5) == "msg"
+
+
+class TestAsyncKuaiLogger:
+    def test_async_log_is_flushed(self, tmp_path):
+        logger = KuaiLogger("test_async", level=logging.INFO, is_add_file_handler=True,
+                            log_path=str(tmp_path), log_filename="async.log",
+                            formatter_template="{levelname} - {message}", is_async=True)
+        for i in range(1000):
+            logger.info(i)
+        logger.debug("not logged")
+        logger.flush()
+        assert _read_log_lines(tmp_path) == [f"INFO - {i}" for i in range(1000)]
+
+    def test_drop_policy(self):
+        release = threading.Event()
+        written = []
+
+        def slow_handler(batch):
+            release.wait()
+            written.extend(batch)
+
+        writer = AsyncLogWriter(slow_handler, max_size=10, batch_size=1, flush_interval=0.01, overflow="drop")
+        results = [writer.put(i) for i in range(100)]
+        release.set()
+        writer.close()
+        assert results.count(False) == writer.dropped > 0
+        assert len(written) == 100 - writer.dropped
+
+    def test_invalid_overflow(self):
+        with pytest.raises(ValueError):
+            AsyncLogWriter(print, overflow="unknown")
+
+
+class TestLogCollector:
+    def test_multi_process_logging(self, tmp_path):
+        collector = LogCollector("collector.log", log_path=str(tmp_path))
+        procs = [multiprocessing.Process(target=_log_from_process, args=(collector.address, i, 2000))
+                 for i in range(3)]
+        for proc in procs:
+            proc.start()
+        for proc in procs:
+            proc.join()
+        collector.close()
+
+        lines = _read_log_lines(tmp_path)
+        assert sorted(lines) == sorted(f"p{p} - {i}" for p in range(3) for i in range(2000))
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="a Unix socket address")
+    def test_collector_down(self, tmp_path, capsys):
+        address = str(tmp_path / "collector.sock")
+        writer = CollectorFileWriter(address, flush_interval=60, max_buffered=5)
+        logger = KuaiLogger("test_collector_down", level=logging.INFO, is_add_file_handler=True,
+                            formatter_template="{message}", log_collector_address=address)
+        logger._fw = writer
+
+        # logging does not raise, the error is reported once and the logs are kept
+        for i in range(3):
+            logger.info(i)
+        assert writer.flush() is False and writer.flush() is False
+        assert capsys.readouterr().out.count("failed to send logs") == 1
+        for i in range(3, 7):
+            logger.info(i)
+
+        # the kept logs are sent once the collector is up, the oldest were dropped
+        with Listener(address, authkey=multiprocessing.current_process().authkey) as listener:
+            received = []
+            thread = threading.Thread(target=lambda: received.append(listener.accept().recv()))
+            thread.start()
+            assert writer.flush() is True
+            thread.join(5)
+        assert received == ["2\n3\n4\n5\n6\n"]
+        assert "2 logs were dropped" in capsys.readouterr().out
+
+
+class TestKuaiLoggerThrottle:
+    @staticmethod
+    def _file_logger(tmp_path, formatter_template="{levelname} - {message}", **kwargs):
+        return KuaiLogger("test_throttle", level=logging.INFO, is_add_file_handler=True,
+                          log_path=str(tmp_path), log_filename="throttle.log",
+                          formatter_template=formatter_template, **kwargs)
+
+    def test_dedup_window(self, tmp_path):
+        logger = self._file_logger(tmp_path, dedup_window=60)
+        for _ in range(1000):
+            logger.warning("disk full")
+        logger.info("other")
+        logger.flush()
+        assert _read_log_lines(tmp_path) == ["WARNING - disk full", "INFO - other",
+                                             "WARNING - disk full [repeated 999 times in 60s]"]
+        assert logger.throttle_stats["deduplicated"] == 999
+
+    @pytest.mark.parametrize("is_async", [False, True])
+    def test_dedup_summary_at_exit(self, tmp_path, is_async):
+        script = ("import logging\n"
+                  "from pyufunc.util_log._lg_logger import KuaiLogger\n"
+                  "logger = KuaiLogger('test_exit', level=logging.INFO, is_add_file_handler=True, "
+                  f"log_path={str(tmp_path)!r}, log_filename='exit.log', formatter_template='{{message}}', "
+                  f"dedup_window=60, is_async={is_async})\n"
+                  "for _ in range(5):\n"
+                  "    logger.warning('disk full')\n")
+        subprocess.run([sys.executable, "-c", script], check=True, capture_output=True,
+                       env={**os.environ, "PYTHONPATH": str(Path(__file__).resolve().parents[1])})
+        # the process exits without a flush, the repeat count is still written
+        assert _read_log_lines(tmp_path) == ["disk full", "disk full [repeated 4 times in 60s]"]
+
+    def test_dedup_summary_call_site(self, tmp_path):
+        logger = self._file_logger(tmp_path, formatter_template="{filename}:{funcName}:{lineno} - {message}",
+                                   dedup_window=60)
+
+        def disk_check():
+            for _ in range(3):
+                logger.log(logging.WARNING, "disk full", stacklevel=2)
+            return sys._getframe().f_lineno - 1
+
+        lineno = disk_check()
+        logger.flush()
+        # the summary points at the deduplicated call site, not into the logger
+        assert _read_log_lines(tmp_path) == [f"test_log_logger.py:disk_check:{lineno} - disk full",
+                                             f"test_log_logger.py:disk_check:{lineno} - disk full "
+                                             "[repeated 2 times in 60s]"]
+
+    def test_rate_limit(self, tmp_path):
+        logger = self._file_logger(tmp_path, rate_limit=0.001, rate_burst=5)
+        for i in range(100):
+            logger.info(i)
+        assert _read_log_lines(tmp_path) == [f"INFO - {i}" for i in range(5)]
+        assert logger.throttle_stats["rate_limited"] == 95
+
+    def test_call_site_rate_limit(self, tmp_path):
+        logger = self._file_logger(tmp_path, call_site_rate_limit=0.001, rate_burst=2)
+        for i in range(10):
+            logger.info(f"a{i}")
+            logger.info(f"b{i}")
+        assert _read_log_lines(tmp_path) == ["INFO - a0", "INFO - b0", "INFO - a1", "INFO - b1"]
+
+    def test_sample_rates(self, tmp_path):
+        logger = self._file_logger(tmp_path, sample_rates={logging.INFO: 0, logging.ERROR: 1})
+        for i in range(100):
+            logger.info(i)
+            logger.error(i)
+        assert _read_log_lines(tmp_path) == [f"ERROR - {i}" for i in range(100)]
+        assert logger.throttle_stats["sampled_out"] == 100
+
+    def test_invalid_sample_rate(self):
+        with pytest.raises(ValueError):
+            KuaiLogger("test_invalid_sample", sample_rates={logging.INFO: 2})
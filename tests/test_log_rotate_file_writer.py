@@ -0,0 +1,73 @@
+# -*- coding:utf-8 -*-
+##############################################################
+# Created Date: Monday, October 19th 2026
+# Contact Info: luoxiangyong01@gmail.com
+# Author/Copyright: Mr. Xiangyong Luo
+##############################################################
+
+from __future__ import absolute_import
+
+from _path_setup import add_pkg_to_sys_path
+add_pkg_to_sys_path("pyufunc", False)
+
+from pyufunc.util_log._lg_rotate_file_writer import FileWriter, build_current_date_str, read_log_lines
+
+
+class TestFileWriter:
+    def test_rollover_by_size(self, tmp_path):
+        fw = FileWriter("test.log", log_path=str(tmp_path), max_bytes=100, back_count=10)
+        for _ in range(10):
+            fw.write_2_file("x" * 49 + "\n")
+
+        date_str = build_current_date_str()
+        names = sorted(f.name for f in tmp_path.iterdir())
+        assert names == [f"{date_str}.{sn:04d}.test.log" for sn in range(1, 6)]
+        assert all(f.stat().st_size == 100 for f in tmp_path.iterdir())
+
+    def test_resume_latest_file(self, tmp_path):
+        FileWriter("test.log", log_path=str(tmp_path), max_bytes=100).write_2_file("a" * 80 + "\n")
+        fw = FileWriter("test.log", log_path=str(tmp_path), max_bytes=100)
+        fw.write_2_file("b\n")
+        assert fw.file_path.name.endswith(".0001.test.log")
+        fw.write_2_file("c" * 50 + "\n")
+        assert fw.file_path.name.endswith(".0002.test.log")
+
+    def test_back_count(self, tmp_path):
+        for i in range(1, 6):
+            (tmp_path / f"2020-01-0{i}.0001.test.log").touch()
+        fw = FileWriter("test.log", log_path=str(tmp_path), max_bytes=10, back_count=3)
+        for _ in range(3):
+            fw.write_2_file("x" * 9 + "\n")
+        assert fw.flush_tasks(10)
+        assert len(list(tmp_path.iterdir())) == 3
+        assert fw.file_path.exists()
+
+    def test_compress_segments(self, tmp_path):
+        fw = FileWriter("test.log", log_path=str(tmp_path), max_bytes=1000, compress="gzip")
+        for i in range(500):
+            fw.write_2_file(f"line {i:04d}\n")
+        assert fw.flush_tasks(10)
+
+        names = sorted(f.name for f in tmp_path.iterdir())
+        assert names[-1] == fw.file_path.name
+        assert all(name.endswith(".test.log.gz") for name in names[:-1])
+        assert list(read_log_lines(tmp_path, "test.log")) == [f"line {i:04d}\n" for i in range(500)]
+
+    def test_max_total_bytes(self, tmp_path):
+        fw = FileWriter("test.log", log_path=str(tmp_path), max_bytes=100, back_count=100, max_total_bytes=350)
+        for _ in range(20):
+            fw.write_2_file("x" * 49 + "\n")
+        assert fw.flush_tasks(10)
+        assert sum(f.stat().st_size for f in tmp_path.iterdir()) <= 350
+        assert fw.file_path.exists()
+
+    def test_max_total_bytes_below_max_bytes(self, tmp_path):
+        # e.g. daily segments, the budget keeps the history that fits instead of reserving max_bytes
+        fw = FileWriter("test.log", log_path=str(tmp_path), max_bytes=10 ** 6, back_count=100, max_total_bytes=250)
+        for _ in range(5):
+            fw.write_2_file("x" * 99 + "\n")
+            with fw._lock:
+                fw._rollover()
+        fw.write_2_file("x" * 49 + "\n")
+        assert fw.flush_tasks(10)
+        assert sorted(f.stat().st_size for f in tmp_path.iterdir()) == [50, 100, 100]
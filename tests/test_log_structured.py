@@ -0,0 +1,79 @@
+# -*- coding:utf-8 -*-
+##############################################################
+# Created Date: Monday, October 19th 2026
+# Contact Info: luoxiangyong01@gmail.com
+# Author/Copyright: Mr. Xiangyong Luo
+##############################################################
+
+from __future__ import absolute_import
+import logging
+import pytest
+
+from _path_setup import add_pkg_to_sys_path
+add_pkg_to_sys_path("pyufunc", False)
+
+from pyufunc.util_log._lg_logger import KuaiLogger
+from pyufunc.util_log._lg_structured import read_structured_logs, encode_structured_records
+
+
+def _write_logs(tmp_path, structured_format, **kwargs):
+    loggers = {name: KuaiLogger(name, level=logging.DEBUG, is_add_json_file_handler=True,
+                                json_log_path=str(tmp_path), log_filename="app.log",
+                                formatter_template="{levelname} - {message}",
+                                structured_format=structured_format, **kwargs)
+               for name in ("app", "db")}
+    for i in range(100):
+        loggers["app"].info(i, extra={"i": i})
+        loggers["db"].error(f"{i} 错误")
+    for logger in loggers.values():
+        logger.flush()
+
+
+class TestStructuredLogs:
+    @pytest.mark.parametrize("structured_format", ["jsonl", "binary"])
+    def test_read_with_filters(self, tmp_path, structured_format):
+        _write_logs(tmp_path, structured_format)
+
+        records = list(read_structured_logs(tmp_path, "app.log", structured_format))
+        assert len(records) == 200
+        assert records[0]["name"] in ("app", "db")
+        assert list(records[0])[:4] == ["ts", "levelno", "name", "message"]
+
+        app_records = list(read_structured_logs(tmp_path, "app.log", structured_format, names="app"))
+        assert [rec["message"] for rec in app_records] == [str(i) for i in range(100)]
+        assert [rec["extra"]["i"] for rec in app_records] == list(range(100))
+        assert app_records[0]["levelname"] == "INFO"
+
+        errors = list(read_structured_logs(tmp_path, "app.log", structured_format, level="ERROR"))
+        assert [rec["message"] for rec in errors] == [f"{i} 错误" for i in range(100)]
+
+        middle_ts = app_records[50]["ts"]
+        recent = list(read_structured_logs(tmp_path, "app.log", structured_format, names=["app"], start=middle_ts))
+        assert recent == app_records[50:]
+        assert list(read_structured_logs(tmp_path, "app.log", structured_format, end=records[0]["ts"])) == []
+
+    def test_async_logger_and_compressed_segments(self, tmp_path):
+        logger = KuaiLogger("app", level=logging.INFO, is_add_json_file_handler=True, json_log_path=str(tmp_path),
+                            log_filename="app.log", structured_format="binary", is_async=True,
+                            max_bytes=2000, compress="gzip")
+        for i in range(200):
+            logger.warning(i)
+            # each batch is written at once, flush to get several segments
+            if i % 20 == 19:
+                logger.flush()
+        assert logger._fw_json.flush_tasks(10)
+        assert any(f.name.endswith(".gz") for f in tmp_path.iterdir())
+        records = read_structured_logs(tmp_path, "app.log", "binary", level=logging.WARNING)
+        assert [rec["message"] for rec in records] == [str(i) for i in range(200)]
+
+    def test_partial_last_record(self, tmp_path):
+        record = (logging.INFO, "msg", {}, None, None, 1.0)
+        for structured_format in ("jsonl", "binary"):
+            data = encode_structured_records("app", [record] * 2, structured_format)
+            (tmp_path / f"2026-01-01.0001.{structured_format}.log").write_bytes(data[:-3])
+            records = list(read_structured_logs(tmp_path, f"{structured_format}.log", structured_format))
+            assert records == [{"ts": 1.0, "levelno": logging.INFO, "name": "app", "message": "msg"}]
+
+    def test_invalid_format(self):
+        with pytest.raises(ValueError):
+            KuaiLogger("invalid", structured_format="xml")
@@ -0,0 +1,60 @@
+# -*- coding:utf-8 -*-
+##############################################################
+# Created Date: Monday, October 19th 2026
+# Contact Info: luoxiangyong01@gmail.com
+# Author/Copyright: Mr. Xiangyong Luo
+##############################################################
+
+from __future__ import absolute_import
+import importlib
+import json
+
+from _path_setup import add_pkg_to_sys_path
+add_pkg_to_sys_path("pyufunc", False)
+
+from pyufunc import requires, import_package, is_module_importable
+from pyufunc.util_magic import _import_package
+
+
+class TestDependencyCache:
+    def test_find_spec_is_cached(self, monkeypatch):
+        calls = []
+        find_spec = importlib.util.find_spec
+        monkeypatch.setattr(importlib.util, "find_spec", lambda name: calls.append(name) or find_spec(name))
+        monkeypatch.setattr(_import_package, "_FIND_SPEC_CACHE", {})
+
+        # an imported module is not looked up
+        assert is_module_importable("json")
+        assert is_module_importable("tabnanny")
+        assert is_module_importable("tabnanny")
+        assert not is_module_importable("not_a_module_xyz")
+        assert not is_module_importable("not_a_module_xyz.sub")
+        assert calls == ["tabnanny", "not_a_module_xyz", "not_a_module_xyz.sub"]
+
+    def test_import_package_fast_path(self, monkeypatch):
+        assert import_package("json", verbose=False) is json
+        monkeypatch.setattr(importlib, "import_module", lambda name: None)
+        assert import_package("json", verbose=False) is json
+        assert import_package(("python-json", "json"), verbose=False) is json
+
+    def test_requires_checks_at_first_call(self, capsys):
+        @requires("not_a_module_xyz", verbose=True)
+        def needs_missing():
+            return "ran"
+
+        @requires("json", "csv")
+        def needs_stdlib(value):
+            """doc"""
+            return value
+
+        assert capsys.readouterr().out == ""
+        assert needs_stdlib(3) == 3 and needs_stdlib.__doc__ == "doc"
+        assert needs_missing() == "ran"
+        assert "missing dependency not_a_module_xyz" in capsys.readouterr().out
+
+    def test_requires_keeps_classes(self):
+        @requires("json", verbose=False)
+        class Finder:
+            pass
+
+        assert isinstance(Finder(), Finder)
@@ -0,0 +1,79 @@
+# -*- coding:utf-8 -*-
+##############################################################
+# Created Date: Monday, October 19th 2026
+# Contact Info: luoxiangyong01@gmail.com
+# Author/Copyright: Mr. Xiangyong Luo
+##############################################################
+
+from __future__ import absolute_import
+import json
+import time
+import pytest
+
+from _path_setup import add_pkg_to_sys_path
+add_pkg_to_sys_path("pyufunc", False)
+
+from pyufunc import func_time, func_running_time, get_func_time_stats, export_func_time_stats, reset_func_time_stats
+from pyufunc.pkg_configs import config_func_time
+from pyufunc.util_magic._func_time_decorator import _QuantileSketch
+
+
+@func_time
+def _sleep(seconds):
+    time.sleep(seconds)
+    return seconds
+
+
+@func_running_time
+def _fail():
+    raise ValueError("fail")
+
+
+@pytest.fixture(autouse=True)
+def _print_off():
+    reset_func_time_stats()
+    print_mode = config_func_time["print_mode"]
+    config_func_time["print_mode"] = "off"
+    yield
+    config_func_time["print_mode"] = print_mode
+
+
+class TestFuncTime:
+    def test_registry(self, capsys):
+        for _ in range(9):
+            _sleep(0.001)
+        _sleep(0.05)
+        assert capsys.readouterr().out == ""
+
+        stats = get_func_time_stats(f"{__name__}._sleep")
+        assert stats["count"] == 10
+        assert 0.001 <= stats["p50_s"] < 0.01
+        assert stats["p99_s"] >= 0.045
+        assert stats["total_s"] >= 0.059
+        assert stats["min_s"] <= stats["mean_s"] <= stats["max_s"]
+
+    def test_print_per_call(self, capsys):
+        config_func_time["print_mode"] = "call"
+        assert _sleep(0.001) == 0.001
+        assert "finished function: _sleep, total: 0.00" in capsys.readouterr().out
+
+    def test_exception_is_recorded(self):
+        with pytest.raises(ValueError):
+            _fail()
+        assert get_func_time_stats(f"{__name__}._fail")["count"] == 1
+
+    def test_export_json(self, tmp_path):
+        _sleep(0)
+        json_str = export_func_time_stats(tmp_path / "stats.json")
+        assert json.loads(json_str) == json.loads((tmp_path / "stats.json").read_text())
+        assert json.loads(json_str)[f"{__name__}._sleep"]["count"] == 1
+        with pytest.raises(KeyError):
+            get_func_time_stats("unknown")
+
+    def test_quantile_sketch(self):
+        sketch = _QuantileSketch()
+        for value in range(1, 10001):
+            sketch.add(value)
+        for q in (0.5, 0.95, 0.99):
+            assert abs(sketch.quantile(q) - q * 10000) / (q * 10000) < 0.02
+        assert len(sketch._buckets) < 500
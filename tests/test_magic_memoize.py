@@ -0,0 +1,130 @@
+# -*- coding:utf-8 -*-
+##############################################################
+# Created Date: Monday, October 19th 2026
+# Contact Info: luoxiangyong01@gmail.com
+# Author/Copyright: Mr. Xiangyong Luo
+##############################################################
+
+from __future__ import absolute_import
+import shutil
+import tempfile
+import time
+import numpy as np
+import pandas as pd
+import pytest
+from shapely.geometry import Point
+
+from _path_setup import add_pkg_to_sys_path
+add_pkg_to_sys_path("pyufunc", False)
+
+from pyufunc import memoize, memoize_key, run_parallel
+
+_DISK_DIR = tempfile.mkdtemp(prefix="pyufunc_memoize_")
+
+
+@memoize(cache_dir=_DISK_DIR)
+def _square(x):
+    return x * x
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _remove_disk_dir():
+    yield
+    shutil.rmtree(_DISK_DIR, ignore_errors=True)
+
+
+class TestMemoize:
+    def test_lru(self):
+        calls = []
+
+        @memoize(maxsize=2)
+        def double(x):
+            calls.append(x)
+            return 2 * x
+
+        assert [double(x) for x in (1, 2, 1, 3, 2, 1)] == [2, 4, 2, 6, 4, 2]
+        # 2 was the least recently used when 3 came in, then 1 when 2 came back
+        assert calls == [1, 2, 3, 2, 1]
+        assert double.cache_info() == {"hits": 1, "misses": 5, "disk_hits": 0, "maxsize": 2, "currsize": 2}
+        double.cache_clear()
+        assert double.cache_info()["currsize"] == 0
+
+    def test_ttl(self):
+        calls = []
+
+        @memoize(ttl=0.05)
+        def now(x):
+            calls.append(x)
+            return time.monotonic()
+
+        assert now(1) == now(1)
+        time.sleep(0.06)
+        now(1)
+        assert calls == [1, 1]
+
+    def test_content_keys(self):
+        arr = np.arange(12.0).reshape(3, 4)
+        assert memoize_key(arr) == memoize_key(arr.copy())
+        assert memoize_key(arr) != memoize_key(arr.T.copy())
+        assert memoize_key(arr[:, ::2]) == memoize_key(np.ascontiguousarray(arr[:, ::2]))
+
+        df = pd.DataFrame({"a": [1, 2], "b": ["x", "y"]})
+        assert memoize_key(df) == memoize_key(df.copy())
+        assert memoize_key(df) != memoize_key(df.assign(a=[1, 3]))
+        assert memoize_key(Point(1, 2)) == memoize_key(Point(1, 2)) != memoize_key(Point(2, 1))
+        assert memoize_key({"b": 1, "a": [1, 2]}, k={1, 2}) == memoize_key({"a": [1, 2], "b": 1}, k={2, 1})
+
+        @memoize
+        def total(values):
+            return float(np.sum(values))
+
+        assert total(arr) == total(arr.copy()) == 66.0
+        assert total.cache_info()["hits"] == 1
+        with pytest.raises(TypeError):
+            total(bytearray(b"x"))
+
+    def test_disk_tier_across_processes(self):
+        _square.cache_clear(disk=True)
+        assert run_parallel(_square, range(20), num_processes=2) == [x * x for x in range(20)]
+        # computed and saved by the workers, read back from disk here
+        assert [_square(x) for x in range(20)] == [x * x for x in range(20)]
+        assert _square.cache_info()["disk_hits"] == 20
+        assert _square.cache_info()["misses"] == 0
+
+    def test_damaged_disk_entry_is_a_miss(self, tmp_path):
+        @memoize(cache_dir=tmp_path)
+        def inc(x):
+            return x + 1
+
+        assert inc(1) == 2
+        (entry,) = tmp_path.rglob("*.pkl")
+        # a nested function, the folder name is valid on Windows
+        assert not any(char in entry.parent.name for char in '<>:"|?*')
+        entry.write_bytes(b"damaged")
+        inc.cache_clear()
+        assert inc(1) == 2
+        assert inc.cache_info()["misses"] == 1
+
+    def test_disk_hit_keeps_the_remaining_ttl(self, tmp_path):
+        calls = []
+
+        @memoize(ttl=0.3, cache_dir=tmp_path)
+        def now(x):
+            calls.append(x)
+            return time.monotonic()
+
+        now(1)
+        time.sleep(0.2)
+        # read back from disk with 0.1 seconds left, not a new ttl of 0.3
+        now.cache_clear()
+        now(1)
+        assert now.cache_info()["disk_hits"] == 1
+        time.sleep(0.15)
+        now(1)
+        assert calls == [1, 1]
+
+    def test_invalid_inputs(self):
+        with pytest.raises(ValueError):
+            memoize(maxsize=0)
+        with pytest.raises(ValueError):
+            memoize(ttl=-1)
@@ -0,0 +1,65 @@
+# -*- coding:utf-8 -*-
+##############################################################
+# Created Date: Monday, October 19th 2026
+# Contact Info: luoxiangyong01@gmail.com
+# Author/Copyright: Mr. Xiangyong Luo
+##############################################################
+
+from __future__ import absolute_import
+import numpy as np
+import pytest
+
+from _path_setup import add_pkg_to_sys_path
+add_pkg_to_sys_path("pyufunc", False)
+
+from pyufunc import parallel_array_map, calc_distance_on_unit_haversine, WorkerPool
+
+
+def _row_norms(points):
+    return np.linalg.norm(points, axis=1)
+
+
+def _scale_rows(points):
+    return points * 2
+
+
+def _fail_on_negative(values):
+    if (values < 0).any():
+        raise ValueError("negative value")
+    return values
+
+
+class TestParallelArrayMap:
+    def test_haversine(self):
+        rng = np.random.default_rng(0)
+        lon1, lat1, lon2, lat2 = rng.uniform(-90, 90, (4, 10001))
+        dist = parallel_array_map(calc_distance_on_unit_haversine, (lon1, lat1, lon2, lat2), num_processes=2)
+        np.testing.assert_allclose(dist, calc_distance_on_unit_haversine(lon1, lat1, lon2, lat2))
+
+    def test_output_shape_and_dtype(self):
+        points = np.arange(300, dtype=np.float32).reshape(100, 3)
+        np.testing.assert_allclose(parallel_array_map(_row_norms, points, num_processes=2), _row_norms(points))
+        scaled = parallel_array_map(_scale_rows, points, num_processes=2, num_chunks=7)
+        assert scaled.dtype == np.float32
+        np.testing.assert_array_equal(scaled, points * 2)
+
+    def test_with_worker_pool(self):
+        points = np.arange(30, dtype=np.float64).reshape(10, 3)
+        with WorkerPool(2) as pool:
+            for _ in range(3):
+                np.testing.assert_array_equal(parallel_array_map(_scale_rows, points, pool=pool), points * 2)
+
+    def test_empty_input(self):
+        assert parallel_array_map(_scale_rows, np.empty((0, 3))).shape == (0, 3)
+
+    def test_error_is_raised(self):
+        values = np.arange(100)
+        values[70] = -1
+        with pytest.raises(ValueError, match="negative"):
+            parallel_array_map(_fail_on_negative, values, num_processes=2)
+
+    def test_invalid_inputs(self):
+        with pytest.raises(TypeError):
+            parallel_array_map(_scale_rows, [1, 2, 3])
+        with pytest.raises(ValueError):
+            parallel_array_map(_scale_rows, (np.ones(3), np.ones(4)))
@@ -0,0 +1,114 @@
+# -*- coding:utf-8 -*-
+##############################################################
+# Created Date: Monday, October 19th 2026
+# Contact Info: luoxiangyong01@gmail.com
+# Author/Copyright: Mr. Xiangyong Luo
+##############################################################
+
+from __future__ import absolute_import
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+import pytest
+
+from _path_setup import add_pkg_to_sys_path
+add_pkg_to_sys_path("pyufunc", False)
+
+from pyufunc import (profile_block, profile_func, get_profile_stacks, get_profile_pstats,
+                     export_collapsed_stacks, reset_profile_stats, func_time, run_parallel)
+from pyufunc.pkg_configs import config_func_time, config_profile
+import pyufunc
+
+_SCRIPT = """
+import os, time
+from pyufunc import profile_block
+print("PYUFUNC_PROFILE_RUN" in os.environ)
+with profile_block("load"):
+    time.sleep(0.05)
+"""
+
+
+def _busy(seconds):
+    time_end = time.perf_counter() + seconds
+    while time.perf_counter() < time_end:
+        pass
+    return seconds
+
+
+@func_time
+def _busy_timed(seconds):
+    return _busy(seconds)
+
+
+@profile_func(mode="cprofile")
+def _busy_cprofile(seconds):
+    return _busy(seconds)
+
+
+@pytest.fixture(autouse=True)
+def _profile_config(tmp_path):
+    reset_profile_stats()
+    old_config = dict(config_profile)
+    print_mode = config_func_time["print_mode"]
+    config_profile.update(funcs="", mode="sample", interval=0.001, profile_dir=str(tmp_path))
+    config_func_time["print_mode"] = "off"
+    yield
+    config_profile.update(old_config)
+    config_func_time["print_mode"] = print_mode
+    reset_profile_stats()
+
+
+class TestProfiling:
+    def test_sample_block(self, tmp_path):
+        with profile_block("load"):
+            _busy(0.2)
+        stacks = get_profile_stacks()
+        assert sum(count for stack, count in stacks.items() if stack.startswith(f"load;{__name__}:_busy")) > 10
+
+        collapsed = export_collapsed_stacks(tmp_path / "out.collapsed")
+        assert collapsed == (tmp_path / "out.collapsed").read_text()
+        stack, count = collapsed.splitlines()[0].rsplit(" ", 1)
+        assert stack.startswith("load") and int(count) > 0
+
+    def test_cprofile(self):
+        assert _busy_cprofile(0.01) == 0.01
+        stats = get_profile_pstats()
+        assert any(func_name == "_busy" for _, _, func_name in stats.stats)
+        assert get_profile_stacks() == {}
+
+    def test_func_time_selected_by_config(self):
+        _busy_timed(0.05)
+        assert get_profile_stacks() == {}
+
+        config_profile["funcs"] = "other, _busy_*"
+        _busy_timed(0.2)
+        stacks = get_profile_stacks()
+        assert stacks and all(stack.startswith(f"{__name__}:_busy_timed") for stack in stacks)
+
+    def test_merge_run_parallel_workers(self):
+        config_profile["funcs"] = "_busy_timed"
+        assert run_parallel(_busy_timed, [0.1] * 4, num_processes=2, backend="process") == [0.1] * 4
+        assert get_profile_stacks(include_workers=False) == {}
+        stacks = get_profile_stacks()
+        assert sum(stacks.values()) > 20
+
+    def test_invalid_mode(self):
+        with pytest.raises(ValueError):
+            profile_block(mode="trace")
+
+    def test_no_dump_without_opt_in(self, tmp_path):
+        env = {key: value for key, value in os.environ.items() if not key.startswith("PYUFUNC_PROFILE")}
+        env["PYTHONPATH"] = str(Path(pyufunc.__file__).resolve().parents[1])
+        out = subprocess.run([sys.executable, "-c", _SCRIPT], cwd=tmp_path, env=env,
+                             check=True, capture_output=True, text=True).stdout
+        # the import does not touch the environment, nothing is written at exit
+        assert out == "False\n"
+        assert os.listdir(tmp_path) == []
+
+        env["PYUFUNC_PROFILE_DUMP"] = "1"
+        out = subprocess.run([sys.executable, "-c", _SCRIPT], cwd=tmp_path, env=env,
+                             check=True, capture_output=True, text=True).stdout
+        assert "sampled stacks saved" in out
+        assert [path.suffix for path in (tmp_path / "pyufunc_profile").iterdir()] == [".collapsed"]
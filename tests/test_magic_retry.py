@@ -0,0 +1,153 @@
+# -*- coding:utf-8 -*-
+##############################################################
+# Created Date: Monday, October 19th 2026
+# Contact Info: luoxiangyong01@gmail.com
+# Author/Copyright: Mr. Xiangyong Luo
+##############################################################
+
+from __future__ import absolute_import
+import asyncio
+import time
+import pytest
+
+from _path_setup import add_pkg_to_sys_path
+add_pkg_to_sys_path("pyufunc", False)
+
+from pyufunc import retry, RetryBudget, CircuitBreaker, CircuitOpenError
+
+
+class _Flaky:
+    """Fail the first num_failures calls."""
+
+    def __init__(self, num_failures: int, error: Exception = ConnectionError("down")):
+        self.num_failures = num_failures
+        self.error = error
+        self.num_calls = 0
+
+    def __call__(self, value=1):
+        self.num_calls += 1
+        if self.num_calls <= self.num_failures:
+            raise self.error
+        return value
+
+
+class TestRetry:
+    def test_retry_until_success(self):
+        flaky = _Flaky(2)
+        assert retry(flaky, max_attempts=3, base_delay=0.001)(5) == 5
+        assert flaky.num_calls == 3
+
+    def test_raise_when_exhausted(self):
+        flaky = _Flaky(5)
+        with pytest.raises(ConnectionError):
+            retry(flaky, max_attempts=3, base_delay=0.001)()
+        assert flaky.num_calls == 3
+
+    def test_not_retryable(self):
+        flaky = _Flaky(1, ValueError("bad input"))
+        with pytest.raises(ValueError):
+            retry(flaky, exceptions=(ConnectionError,), base_delay=0.001)()
+        assert flaky.num_calls == 1
+
+        flaky = _Flaky(1, ConnectionError("404"))
+        with pytest.raises(ConnectionError):
+            retry(flaky, retry_on_exception=lambda e: "404" not in str(e), base_delay=0.001)()
+        assert flaky.num_calls == 1
+
+    def test_retry_on_result(self):
+        statuses = iter([429, 504, 200])
+        func = retry(lambda: next(statuses), retry_on_result=lambda status: status != 200, base_delay=0.001)
+        assert func() == 200
+
+        # the last result is returned when the retries are exhausted
+        assert retry(lambda: 429, max_attempts=2, retry_on_result=lambda s: s == 429, base_delay=0.001)() == 429
+
+    def test_backoff_delays(self, monkeypatch):
+        delays = []
+        monkeypatch.setattr(time, "sleep", delays.append)
+        with pytest.raises(ConnectionError):
+            retry(_Flaky(10), max_attempts=6, base_delay=1, max_delay=5, jitter=False)()
+        assert delays == [1, 2, 4, 5, 5]
+
+        delays.clear()
+        with pytest.raises(ConnectionError):
+            retry(_Flaky(100), max_attempts=50, base_delay=1, max_delay=5)()
+        assert all(0 <= delay <= min(5, 2 ** i) for i, delay in enumerate(delays))
+
+    def test_max_total_time(self):
+        flaky = _Flaky(100)
+        time_start = time.monotonic()
+        with pytest.raises(ConnectionError):
+            retry(flaky, max_attempts=100, base_delay=0.02, max_delay=0.02, jitter=False, max_total_time=0.1)()
+        assert time.monotonic() - time_start < 0.2
+        assert 2 <= flaky.num_calls <= 6
+
+    def test_budget(self):
+        budget = RetryBudget(ratio=0.5, capacity=2)
+        flaky = _Flaky(100)
+        func = retry(flaky, max_attempts=10, base_delay=0, budget=budget)
+        with pytest.raises(ConnectionError):
+            func()
+        # 2 tokens at the start, the deposit of the call is capped by the capacity
+        assert flaky.num_calls == 3
+        with pytest.raises(ConnectionError):
+            func()
+        assert flaky.num_calls == 4
+        with pytest.raises(ConnectionError):
+            func()
+        assert flaky.num_calls == 6
+
+    def test_async(self):
+        flaky = _Flaky(2)
+
+        @retry(max_attempts=3, base_delay=0.001)
+        async def fetch(value):
+            return flaky(value)
+
+        assert asyncio.iscoroutinefunction(fetch)
+        assert asyncio.run(fetch(7)) == 7
+        assert flaky.num_calls == 3
+
+    def test_invalid_inputs(self):
+        with pytest.raises(ValueError):
+            retry(max_attempts=0)
+        with pytest.raises(ValueError):
+            retry(base_delay=-1)
+
+
+class TestCircuitBreaker:
+    def test_open_and_recover(self):
+        breaker = CircuitBreaker(failure_threshold=3, recovery_timeout=0.05, name="api")
+        flaky = _Flaky(4)
+        func = retry(flaky, max_attempts=2, base_delay=0, circuit_breaker=breaker)
+
+        with pytest.raises(ConnectionError):
+            func()
+        assert breaker.state == "closed"
+
+        # the third failure opens the breaker, the fourth call does not reach the function
+        with pytest.raises(CircuitOpenError):
+            func()
+        assert flaky.num_calls == 3
+        assert breaker.state == "open"
+
+        # the trial call fails and opens the breaker again
+        time.sleep(0.06)
+        assert breaker.state == "half_open"
+        with pytest.raises(CircuitOpenError):
+            func()
+        assert flaky.num_calls == 4
+
+        time.sleep(0.06)
+        assert func(9) == 9
+        assert breaker.state == "closed"
+
+    def test_decorator(self):
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=60)
+        flaky = breaker(_Flaky(1))
+        with pytest.raises(ConnectionError):
+            flaky()
+        with pytest.raises(CircuitOpenError):
+            flaky()
+        breaker.reset()
+        assert flaky(3) == 3
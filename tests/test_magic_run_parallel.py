@@ -0,0 +1,141 @@
+# -*- coding:utf-8 -*-
+##############################################################
+# Created Date: Monday, October 19th 2026
+# Contact Info: luoxiangyong01@gmail.com
+# Author/Copyright: Mr. Xiangyong Luo
+##############################################################
+
+from __future__ import absolute_import
+import asyncio
+import time
+import pytest
+
+from _path_setup import add_pkg_to_sys_path
+add_pkg_to_sys_path("pyufunc", False)
+
+from pyufunc import run_parallel
+from pyufunc.util_magic._run_parallel_decorator import _next_chunksize, _profile_backend
+
+
+def _square(x):
+    return x * x
+
+
+def _sleep_reverse(x):
+    # later inputs complete first
+    time.sleep(0.01 * (3 - x))
+    return x
+
+
+def _raise_on_five(x):
+    if x == 5:
+        raise ValueError("five")
+    return x
+
+
+async def _square_async(x):
+    await asyncio.sleep(0.001)
+    return x * x
+
+
+async def _raise_on_five_async(x):
+    return _raise_on_five(x)
+
+
+def _sleep(x):
+    time.sleep(0.5)
+    return x
+
+
+class TestRunParallel:
+    def test_list_input(self):
+        assert run_parallel(_square, list(range(100)), num_processes=2) == [x * x for x in range(100)]
+
+    def test_generator_input(self):
+        results = run_parallel(_square, (x for x in range(1000)), num_processes=2, stream=True)
+        assert not isinstance(results, list)
+        assert list(results) == [x * x for x in range(1000)]
+
+    def test_unordered(self):
+        results = list(run_parallel(_sleep_reverse, range(4), num_processes=4, chunksize=1,
+                                    stream=True, ordered=False))
+        assert sorted(results) == [0, 1, 2, 3]
+        assert results[0] == 3
+
+    def test_small_input_and_chunksize(self):
+        assert run_parallel(_square, [3], num_processes=8, chunksize=10) == [9]
+        assert run_parallel(_square, [], num_processes=2) == []
+
+    def test_error_is_raised(self):
+        with pytest.raises(ValueError, match="five"):
+            run_parallel(_raise_on_five, range(10), num_processes=2)
+
+    def test_next_chunksize(self):
+        # 1 ms per item aims at 50 items per chunk, but grows at most 4 times per step
+        assert _next_chunksize(1, 1, 0.001, 1000) == 4
+        assert _next_chunksize(40, 40, 0.04, 1000) == 50
+        assert _next_chunksize(100, 100, 1.0, 1000) == 5
+        assert _next_chunksize(100, 100, 0, 300) == 300
+
+    def test_invalid_inputs(self):
+        with pytest.raises(TypeError):
+            run_parallel(_square, 10)
+        with pytest.raises(ValueError):
+            run_parallel(_square, range(10), num_processes=0)
+        with pytest.raises(ValueError):
+            run_parallel(_square, range(10), chunksize=-1)
+        with pytest.raises(ValueError):
+            run_parallel(_square, range(10), max_in_flight=0)
+
+
+class TestRunParallelBackends:
+    @pytest.mark.parametrize("backend", ["process", "thread", "serial", "auto"])
+    def test_same_results(self, backend):
+        expected = [x * x for x in range(200)]
+        assert run_parallel(_square, range(200), num_processes=2, backend=backend) == expected
+        assert sorted(run_parallel(_square, iter(range(200)), backend=backend, ordered=False)) == expected
+
+    def test_lambda_on_thread(self):
+        assert run_parallel(lambda x: x + 1, range(10), backend="thread") == list(range(1, 11))
+
+    def test_asyncio(self):
+        time_start = time.monotonic()
+        results = run_parallel(_square_async, range(500), num_processes=100, backend="asyncio")
+        assert results == [x * x for x in range(500)]
+        # 500 sleeps of 1 ms with 100 at once
+        assert time.monotonic() - time_start < 0.4
+        assert run_parallel(_square_async, range(10), backend="auto") == [x * x for x in range(10)]
+
+    def test_start_method(self):
+        assert run_parallel(_square, range(10), num_processes=2, start_method="forkserver") == \
+            [x * x for x in range(10)]
+
+    @pytest.mark.parametrize("backend", ["process", "thread", "serial"])
+    def test_same_errors(self, backend):
+        with pytest.raises(ValueError, match="five"):
+            run_parallel(_raise_on_five, range(10), num_processes=2, backend=backend)
+
+    def test_same_errors_asyncio(self):
+        with pytest.raises(ValueError, match="five"):
+            run_parallel(_raise_on_five_async, range(10), backend="asyncio")
+
+    @pytest.mark.parametrize("backend", ["process", "thread"])
+    def test_timeout(self, backend):
+        time_start = time.monotonic()
+        with pytest.raises(TimeoutError):
+            run_parallel(_sleep, range(20), num_processes=2, backend=backend, timeout=0.2)
+        assert time.monotonic() - time_start < 0.5
+
+    def test_profile_backend(self):
+        assert _profile_backend(_square, iter(range(100)))[0] == "serial"
+        backend, results = _profile_backend(lambda x: time.sleep(0.002) or x, iter(range(100)))
+        assert backend == "thread"
+        assert results == list(range(8))
+
+    def test_invalid_backend(self):
+        with pytest.raises(ValueError):
+            run_parallel(_square, range(10), backend="gpu")
+        with pytest.raises(TypeError):
+            run_parallel(_square_async, range(10), backend="thread")
+        with pytest.raises(TypeError):
+            run_parallel(_square, range(10), backend="asyncio")
@@ -0,0 +1,90 @@
+# -*- coding:utf-8 -*-
+##############################################################
+# Created Date: Monday, October 19th 2026
+# Contact Info: luoxiangyong01@gmail.com
+# Author/Copyright: Mr. Xiangyong Luo
+##############################################################
+
+from __future__ import absolute_import
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import pytest
+
+from _path_setup import add_pkg_to_sys_path
+add_pkg_to_sys_path("pyufunc", False)
+
+from pyufunc import TimeoutExecutor, timeout_process
+
+
+def _sleep(seconds):
+    time.sleep(seconds)
+    return os.getpid()
+
+
+def _fail():
+    raise KeyError("missing")
+
+
+def _crash():
+    os._exit(3)
+
+
+@timeout_process(0.5)
+def _sleep_limited(seconds):
+    time.sleep(seconds)
+    return seconds
+
+
+@pytest.fixture(scope="module")
+def executor():
+    with TimeoutExecutor(2) as executor:
+        yield executor
+
+
+class TestTimeoutExecutor:
+    def test_result_and_exception(self, executor):
+        assert executor.run(pow, 2, 10, timeout=5) == 1024
+        with pytest.raises(KeyError):
+            executor.run(_fail)
+
+    def test_timeout_kills_and_replaces_worker(self, executor):
+        num_replaced = executor.num_replaced
+        time_start = time.perf_counter()
+        with pytest.raises(TimeoutError, match="_sleep exceed 0.2 seconds"):
+            executor.run(_sleep, 30, timeout=0.2)
+        assert time.perf_counter() - time_start < 5
+        assert executor.num_replaced == num_replaced + 1
+        assert executor.run(_sleep, 0, timeout=5) > 0
+
+    def test_concurrent_deadlines_from_threads(self, executor):
+        # each thread has its own deadline, the calls run two at a time
+        cases = [(0.01, 5), (30, 0.3), (0.01, 5), (30, 0.5), (0.01, None), (0.01, 5)]
+        with ThreadPoolExecutor(len(cases)) as threads:
+            futures = [threads.submit(executor.run, _sleep, seconds, timeout=limit) for seconds, limit in cases]
+        for (seconds, _), fut in zip(cases, futures):
+            if seconds > 1:
+                assert isinstance(fut.exception(), TimeoutError)
+            else:
+                assert fut.result() > 0
+
+    def test_worker_crash(self, executor):
+        with pytest.raises(BrokenProcessPool):
+            executor.run(_crash, timeout=5)
+        assert executor.run(pow, 3, 2) == 9
+
+    def test_decorator(self):
+        assert _sleep_limited(0.01) == 0.01
+        with pytest.raises(TimeoutError, match="_sleep_limited exceed 0.5 seconds"):
+            _sleep_limited(30)
+
+    def test_invalid_inputs(self, executor):
+        with pytest.raises(ValueError):
+            executor.submit(pow, 2, 2, timeout=0)
+        with pytest.raises(ValueError):
+            TimeoutExecutor(0)
+        closed = TimeoutExecutor(1)
+        closed.close()
+        with pytest.raises(RuntimeError):
+            closed.submit(pow, 2, 2)
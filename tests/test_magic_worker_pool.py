@@ -0,0 +1,74 @@
+# -*- coding:utf-8 -*-
+##############################################################
+# Created Date: Monday, October 19th 2026
+# Contact Info: luoxiangyong01@gmail.com
+# Author/Copyright: Mr. Xiangyong Luo
+##############################################################
+
+from __future__ import absolute_import
+import os
+import time
+import numpy as np
+import pytest
+
+from _path_setup import add_pkg_to_sys_path
+add_pkg_to_sys_path("pyufunc", False)
+
+from pyufunc import WorkerPool, get_shared, run_parallel
+
+_LOADED = {}
+
+
+def _load_table(offset):
+    _LOADED["table"] = {i: i + offset for i in range(100)}
+
+
+def _lookup(i):
+    return _LOADED["table"][i] + get_shared("bonus")
+
+
+def _row_sum(i):
+    return float(get_shared("matrix")[i].sum())
+
+
+def _is_writeable(_):
+    return get_shared("matrix").flags.writeable
+
+
+def _pid(_):
+    time.sleep(0.01)
+    return os.getpid()
+
+
+class TestWorkerPool:
+    def test_initializer_and_shared_objects(self):
+        with WorkerPool(2, shared={"bonus": 1000}, initializer=_load_table, initargs=(10,)) as pool:
+            assert pool.map(_lookup, range(100)) == [i + 1010 for i in range(100)]
+
+    def test_shared_numpy_array(self):
+        matrix = np.arange(200 * 50, dtype=np.float64).reshape(200, 50)
+        with WorkerPool(2, shared={"matrix": matrix}) as pool:
+            assert pool.map(_row_sum, range(200)) == [float(row.sum()) for row in matrix]
+            results = run_parallel(_row_sum, range(200), pool=pool, stream=True, ordered=False)
+            assert sorted(results) == sorted(float(row.sum()) for row in matrix)
+            assert not any(pool.map(_is_writeable, range(2)))
+            assert len(pool._shm_list) == 1
+        assert pool._shm_list == []
+
+    def test_workers_are_reused(self):
+        with WorkerPool(2) as pool:
+            pids = set(pool.map(_pid, range(20), chunksize=1))
+            assert pids == set(pool.map(_pid, range(20), chunksize=1))
+            assert len(pids) == 2
+
+    def test_pool_survives_errors(self):
+        with WorkerPool(2, shared={"bonus": 0}, initializer=_load_table, initargs=(0,)) as pool:
+            with pytest.raises(KeyError):
+                pool.map(_lookup, range(200))
+            assert pool.submit(_lookup, 5).result() == 5
+
+    def test_invalid_inputs(self):
+        with pytest.raises(ValueError):
+            WorkerPool(0)
+        with pytest.raises(TypeError):
+            WorkerPool(2, shared=[1, 2])
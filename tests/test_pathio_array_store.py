@@ -0,0 +1,81 @@
+# -*- coding:utf-8 -*-
+##############################################################
+# Created Date: Monday, October 19th 2026
+# Contact Info: luoxiangyong01@gmail.com
+# Author/Copyright: Mr. Xiangyong Luo
+##############################################################
+
+from __future__ import absolute_import
+import json
+import os
+import pytest
+
+from _path_setup import add_pkg_to_sys_path
+add_pkg_to_sys_path("pyufunc", False)
+
+from pyufunc import save_arrays, load_arrays
+
+np = pytest.importorskip("numpy")
+
+
+class TestArrayStore:
+    def test_round_trip(self, tmp_path):
+        arrays = {"skim": np.arange(12, dtype=np.float32).reshape(3, 4),
+                  "ids": np.array([3, 1, 2], dtype=">i4"),
+                  "empty": np.zeros((0, 2)),
+                  "scalar": np.float64(2.5),
+                  "columns": np.arange(20).reshape(4, 5)[:, ::2]}
+        store = save_arrays(arrays, tmp_path / "store")
+
+        loaded = load_arrays(store)
+        assert list(loaded) == list(arrays)
+        for name, arr in arrays.items():
+            assert isinstance(loaded[name], np.memmap)
+            assert loaded[name].dtype == np.asarray(arr).dtype
+            np.testing.assert_array_equal(loaded[name], arr)
+
+        assert not loaded["skim"].flags.writeable
+        with pytest.raises(ValueError):
+            loaded["skim"][0, 0] = 1
+
+    def test_mmap_modes(self, tmp_path):
+        save_arrays({"a": np.arange(5), "b": np.ones(3)}, tmp_path)
+
+        loaded = load_arrays(tmp_path, names=["b"], mmap_mode=None)
+        assert list(loaded) == ["b"]
+        assert type(loaded["b"]) is np.ndarray
+
+        # copy-on-write, the file is not changed
+        load_arrays(tmp_path, mmap_mode="c")["a"][0] = 100
+        assert load_arrays(tmp_path)["a"][0] == 0
+
+        with pytest.raises(KeyError):
+            load_arrays(tmp_path, names=["c"])
+        with pytest.raises(ValueError):
+            load_arrays(tmp_path, mmap_mode="r+")
+
+    def test_overwrite(self, tmp_path):
+        save_arrays({"a": np.arange(5)}, tmp_path)
+        old_a = load_arrays(tmp_path)["a"]
+
+        save_arrays({"b": np.ones(2)}, tmp_path)
+        assert list(load_arrays(tmp_path)) == ["b"]
+        # the files of the previous save are removed, the maps opened before keep their data
+        assert sorted(os.listdir(tmp_path)) == sorted(["manifest.json", *(
+            entry["file"] for entry in json.loads((tmp_path / "manifest.json").read_text())["arrays"].values())])
+        np.testing.assert_array_equal(old_a, np.arange(5))
+
+        with pytest.raises(FileExistsError):
+            save_arrays({"c": np.ones(2)}, tmp_path, overwrite=False)
+
+    def test_invalid_inputs(self, tmp_path):
+        with pytest.raises(TypeError):
+            save_arrays([np.ones(2)], tmp_path)
+        with pytest.raises(TypeError):
+            save_arrays({1: np.ones(2)}, tmp_path)
+        with pytest.raises(ValueError):
+            save_arrays({"../a": np.ones(2)}, tmp_path)
+        with pytest.raises(ValueError):
+            save_arrays({"a": np.array([{}, []], dtype=object)}, tmp_path)
+        with pytest.raises(FileNotFoundError):
+            load_arrays(tmp_path / "missing")
@@ -0,0 +1,99 @@
+# -*- coding:utf-8 -*-
+##############################################################
+# Created Date: Monday, October 19th 2026
+# Contact Info: luoxiangyong01@gmail.com
+# Author/Copyright: Mr. Xiangyong Luo
+##############################################################
+
+from __future__ import absolute_import
+import json
+import os
+import pytest
+
+from _path_setup import add_pkg_to_sys_path
+add_pkg_to_sys_path("pyufunc", False)
+
+from pyufunc import read_many, write_many, path2linux
+
+
+def _list_tmp_files(dir_path) -> list:
+    return [name for name in os.listdir(dir_path) if name.endswith(".tmp")]
+
+
+class TestReadMany:
+    def test_read(self, tmp_path):
+        for i in range(50):
+            (tmp_path / f"{i}.json").write_text(json.dumps({"zone_id": i}), encoding="utf-8")
+        paths = [tmp_path / f"{i}.json" for i in range(50)]
+
+        contents = dict(read_many(paths, json.load, max_workers=4))
+        assert contents == {path2linux(path): {"zone_id": i} for i, path in enumerate(paths)}
+
+        # a lazy iterable, in binary mode without readahead
+        contents = dict(read_many((str(path) for path in paths), binary=True, readahead=False))
+        assert contents[path2linux(paths[3])] == b'{"zone_id": 3}'
+
+    def test_errors(self, tmp_path):
+        (tmp_path / "a.txt").write_text("a")
+        paths = [tmp_path / "a.txt", tmp_path / "missing.txt"]
+        with pytest.raises(FileNotFoundError):
+            list(read_many(paths))
+
+        contents = dict(read_many(paths, return_exceptions=True))
+        assert contents[path2linux(paths[0])] == "a"
+        assert isinstance(contents[path2linux(paths[1])], FileNotFoundError)
+
+        with pytest.raises(ValueError):
+            list(read_many(paths, max_workers=0))
+
+
+class TestWriteMany:
+    @pytest.mark.parametrize("fsync", [None, "each", "batch"])
+    def test_write(self, tmp_path, fsync):
+        items = {tmp_path / "sub" / f"{i}.txt": f"line {i}\n" for i in range(40)}
+        items[tmp_path / "data.bin"] = b"\x00\x01"
+
+        written = dict(write_many(items, fsync=fsync, max_workers=4))
+        assert written == {path2linux(path): path2linux(path) for path in items}
+        for path, data in items.items():
+            assert (path.read_bytes() if isinstance(data, bytes) else path.read_text()) == data
+        assert not _list_tmp_files(tmp_path) and not _list_tmp_files(tmp_path / "sub")
+
+    def test_write_func(self, tmp_path):
+        items = [(tmp_path / "a.json", {"a": 1}), (tmp_path / "b.json", [1, 2])]
+        list(write_many(items, json.dump))
+        assert json.loads((tmp_path / "b.json").read_text()) == [1, 2]
+
+    @pytest.mark.parametrize("fsync", ["each", "batch"])
+    def test_on_exists(self, tmp_path, fsync):
+        (tmp_path / "a.csv").write_text("old")
+
+        # the new files and the files of the same batch get unique names
+        items = [(tmp_path / "a.csv", "new 1"), (tmp_path / "a.csv", "new 2")]
+        written = sorted(path for _, path in write_many(items, on_exists="rename", fsync=fsync))
+        assert written == [path2linux(tmp_path / "a(1).csv"), path2linux(tmp_path / "a(2).csv")]
+        assert (tmp_path / "a.csv").read_text() == "old"
+        assert sorted((tmp_path / name).read_text() for name in ("a(1).csv", "a(2).csv")) == ["new 1", "new 2"]
+
+        with pytest.raises(FileExistsError):
+            list(write_many({tmp_path / "a.csv": "new"}, on_exists="error", fsync=fsync))
+        assert (tmp_path / "a.csv").read_text() == "old"
+        assert not _list_tmp_files(tmp_path)
+
+    def test_batch_is_all_or_nothing(self, tmp_path):
+        items = {tmp_path / f"{i}.txt": "text" for i in range(20)}
+        items[tmp_path / "bad.txt"] = 1
+
+        with pytest.raises(TypeError):
+            list(write_many(items, fsync="batch", max_workers=4))
+        assert os.listdir(tmp_path) == []
+
+        written = dict(write_many(items, fsync="batch", return_exceptions=True))
+        assert isinstance(written.pop(path2linux(tmp_path / "bad.txt")), TypeError)
+        assert len(written) == 20 and not (tmp_path / "bad.txt").exists()
+
+    def test_invalid_inputs(self, tmp_path):
+        with pytest.raises(ValueError):
+            list(write_many({tmp_path / "a.txt": "a"}, on_exists="skip"))
+        with pytest.raises(ValueError):
+            list(write_many({tmp_path / "a.txt": "a"}, fsync="always"))
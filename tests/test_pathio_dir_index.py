@@ -0,0 +1,95 @@
+# -*- coding:utf-8 -*-
+##############################################################
+# Created Date: Monday, October 19th 2026
+# Contact Info: luoxiangyong01@gmail.com
+# Author/Copyright: Mr. Xiangyong Luo
+##############################################################
+
+from __future__ import absolute_import
+import os
+import time
+from pathlib import Path
+import pytest
+
+from _path_setup import add_pkg_to_sys_path
+add_pkg_to_sys_path("pyufunc", False)
+
+from pyufunc import DirIndex, get_files_by_ext, check_files_in_dir, get_dir_size, path2linux
+from pyufunc.pkg_configs import config_dir_index
+
+
+def _age_dirs(root: Path, seconds: float = 60):
+    """Move the mtime of the directories back, so they are not modified in the current mtime tick."""
+    mtime = time.time() - seconds
+    for path in [root, *root.rglob("*")]:
+        if path.is_dir():
+            os.utime(path, (mtime, mtime))
+
+
+@pytest.fixture
+def tree(tmp_path) -> Path:
+    root = tmp_path / "root"
+    for sub in ("a", "b", "a/c"):
+        (root / sub).mkdir(parents=True)
+    (root / "x.csv").write_text("1,2\n")
+    (root / "a" / "y.csv").write_text("3,4\n")
+    (root / "a" / "c" / "z.txt").write_text("text")
+    _age_dirs(root)
+    return root
+
+
+class TestDirIndex:
+    def test_refresh_only_modified_dirs(self, tree, tmp_path):
+        index_path = tmp_path / "index.pkl"
+        index = DirIndex(tree, index_path).refresh()
+        assert index.num_rescanned == 4 and index_path.is_file()
+        root = path2linux(tree)
+        assert index.get_files("csv") == [f"{root}/x.csv", f"{root}/a/y.csv"]
+
+        # a new process loads the index and only stats the directories
+        index = DirIndex(tree, index_path).refresh()
+        assert index.num_rescanned == 0
+        assert index.get_files("csv") == [f"{root}/x.csv", f"{root}/a/y.csv"]
+
+        (tree / "a" / "c" / "new.csv").write_text("5,6\n")
+        (tree / "x.csv").unlink()
+        index.refresh()
+        assert index.num_rescanned == 2
+        assert sorted(index.get_files("csv")) == [f"{root}/a/c/new.csv", f"{root}/a/y.csv"]
+        assert index.total_size() == sum(path.stat().st_size for path in tree.rglob("*") if path.is_file())
+
+    def test_verify_files_and_hash(self, tree):
+        index = DirIndex(tree).refresh()
+        file_path = tree / "a" / "y.csv"
+        file_hash = index.file_hash(file_path)
+        assert index.file_hash(file_path) == file_hash
+
+        # rewritten in place, the directory mtime does not change
+        size_bytes = index.total_size()
+        file_path.write_text("3,4,5\n")
+        assert index.refresh().total_size() == size_bytes
+        assert index.num_rescanned == 0
+        assert index.refresh(verify_files=True).total_size() == size_bytes + 2
+        assert index.file_hash(file_path) != file_hash
+
+        with pytest.raises(ValueError):
+            index.file_hash(tree.parent / "outside.csv")
+
+    def test_missing_root(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            DirIndex(tmp_path / "missing").refresh()
+
+
+class TestIndexedQueries:
+    def test_same_results_as_walk(self, tree, tmp_path, monkeypatch):
+        monkeypatch.setitem(config_dir_index, "index_dir", str(tmp_path / "indexes"))
+        for incl_subdir in (True, False):
+            for file_ext in ("csv", "*"):
+                assert sorted(get_files_by_ext(tree, file_ext, incl_subdir, index=True)) == sorted(
+                    get_files_by_ext(tree, file_ext, incl_subdir))
+        assert len(os.listdir(tmp_path / "indexes")) == 1
+
+        dir_path = path2linux(tree)
+        assert get_dir_size(dir_path, index=tmp_path / "size.pkl") == get_dir_size(dir_path)
+        assert check_files_in_dir(["y.csv", "z.txt"], tree, incl_subdir=True, index=True)
+        assert not check_files_in_dir(["y.csv"], tree, index=True)
@@ -1,8 +1,11 @@
+import pickle
 import pytest
 from pathlib import Path
 import shutil
 
-from pyufunc.util_pathio._io import get_file_size, get_dir_size
+from pyufunc.util_pathio import _io
+from pyufunc.util_pathio._io import (get_file_size, get_dir_size, find_duplicate_files, remove_duplicate_files,
+                                     pickle_save, pickle_load)
 from pyufunc import path2linux
 
 
@@ -82,4 +85,122 @@ class TestGetDirSize:
     def test_directory_not_found(self):
         with pytest.raises(AssertionError) as excinfo:
             get_dir_size("nonexistent_directory", "kb")
-        assert "Directory nonexistent_directory does not found" in str(excinfo.value)
\ No newline at end of file
+        assert "Directory nonexistent_directory does not found" in str(excinfo.value)
+
+
+class TestFindDuplicateFiles:
+    @staticmethod
+    def create_files(tmp_path: Path) -> Path:
+        root = tmp_path / "data"
+        (root / "sub").mkdir(parents=True)
+        block = bytes(range(256)) * 256
+        (root / "a.bin").write_bytes(block * 3)
+        (root / "sub" / "a_copy.bin").write_bytes(block * 3)
+        # same size, same first and last blocks, different middle
+        (root / "b.bin").write_bytes(block + b"\1" * len(block) + block)
+        (root / "c.txt").write_text("same")
+        (root / "sub" / "c_copy.txt").write_text("same")
+        (root / "unique.txt").write_text("unique content")
+        return root
+
+    def test_find_duplicates(self, tmp_path):
+        root = self.create_files(tmp_path)
+        duplicates = find_duplicate_files(str(root))
+        assert duplicates == [path2linux(root / "sub" / "a_copy.bin"), path2linux(root / "sub" / "c_copy.txt")]
+        assert find_duplicate_files(str(root), algorithm="md5", max_workers=1) == duplicates
+
+    def test_cache_skips_unchanged_files(self, tmp_path, monkeypatch):
+        root = self.create_files(tmp_path)
+        cache_path = tmp_path / "hashes.json"
+        duplicates = find_duplicate_files(str(root), cache_path=cache_path)
+        assert cache_path.is_file()
+
+        def _fail(*args, **kwargs):
+            raise AssertionError("unchanged files should not be hashed again")
+
+        monkeypatch.setattr(_io, "_calculate_partial_hash", _fail)
+        monkeypatch.setattr(_io, "calculate_file_hash", _fail)
+        assert find_duplicate_files(str(root), cache_path=cache_path) == duplicates
+
+    def test_remove_dry_run_and_hardlink(self, tmp_path, capsys):
+        root = self.create_files(tmp_path)
+        copy_path = root / "sub" / "a_copy.bin"
+
+        assert remove_duplicate_files(str(root), dry_run=True) == find_duplicate_files(str(root))
+        assert copy_path.is_file()
+        assert "[dry run] Would remove" in capsys.readouterr().out
+
+        remove_duplicate_files(str(root), mode="hardlink")
+        assert copy_path.stat().st_ino == (root / "a.bin").stat().st_ino
+        assert copy_path.read_bytes() == (root / "a.bin").read_bytes()
+        # hard links of the same file are not processed again
+        assert remove_duplicate_files(str(root), mode="hardlink") == []
+
+        remove_duplicate_files(str(root))
+        assert not copy_path.exists() and (root / "a.bin").is_file()
+
+    def test_invalid_inputs(self, tmp_path):
+        with pytest.raises(ValueError):
+            remove_duplicate_files(str(tmp_path), mode="move")
+        with pytest.raises(ValueError):
+            find_duplicate_files(str(tmp_path), algorithm="unknown")
+
+
+class TestPickleSaveLoad:
+    def test_out_of_band_round_trip(self, tmp_path):
+        np = pytest.importorskip("numpy")
+        pd = pytest.importorskip("pandas")
+        obj = {"matrix": np.arange(300 * 300, dtype="float64").reshape(300, 300),
+               "fortran": np.asfortranarray(np.ones((3, 4))),
+               "links": pd.DataFrame({"link_id": range(1000), "name": ["a"] * 1000}),
+               "meta": [1, "two"]}
+        pickle_save(obj, "sub/obj.pkl", base_dir=str(tmp_path))
+        file_path = tmp_path / "sub" / "obj.pkl"
+        assert file_path.read_bytes().endswith(_io._PICKLE_MAGIC)
+
+        loaded = pickle_load(file_path)
+        assert (loaded["matrix"] == obj["matrix"]).all() and loaded["matrix"].flags.writeable
+        assert loaded["fortran"].flags.f_contiguous
+        assert loaded["links"].equals(obj["links"]) and loaded["meta"] == obj["meta"]
+        assert [path.name for path in file_path.parent.iterdir()] == ["obj.pkl"]
+
+    def test_plain_pickle_compatible(self, tmp_path):
+        pickle_save({"a": 1}, tmp_path / "plain.pkl")
+        with open(tmp_path / "plain.pkl", "rb") as f:
+            assert pickle.load(f) == {"a": 1}
+        assert pickle_load(tmp_path / "plain.pkl") == {"a": 1}
+
+    @pytest.mark.parametrize("compression, pkg_name", [("lz4", "lz4"), ("zstd", "zstandard")])
+    def test_compression(self, tmp_path, compression, pkg_name):
+        pytest.importorskip(pkg_name)
+        np = pytest.importorskip("numpy")
+        obj = {"zeros": np.zeros(10 ** 6), "text": "x" * 1000}
+        pickle_save(obj, tmp_path / "obj.pkl", compression=compression)
+        assert (tmp_path / "obj.pkl").stat().st_size < 10 ** 6
+        loaded = pickle_load(tmp_path / "obj.pkl")
+        assert (loaded["zeros"] == 0).all() and loaded["text"] == obj["text"]
+
+    def test_python_objects_with_compression(self, tmp_path):
+        pytest.importorskip("zstandard")
+        # no out-of-band buffers, the pickle stream is compressed as it is written
+        obj = [{"link_id": i, "name": f"link {i}"} for i in range(10000)]
+        pickle_save(obj, tmp_path / "obj.pkl", compression="zstd")
+        assert (tmp_path / "obj.pkl").read_bytes().endswith(_io._PICKLE_MAGIC)
+        assert pickle_load(tmp_path / "obj.pkl") == obj
+
+    def test_default_base_dir_is_the_current_dir(self, tmp_path, monkeypatch):
+        # the current directory at the call, not at the import
+        monkeypatch.chdir(tmp_path)
+        pickle_save({"a": 1}, "x.pkl")
+        assert (tmp_path / "x.pkl").is_file()
+        assert pickle_load("x.pkl") == {"a": 1}
+
+    def test_atomic_write(self, tmp_path):
+        pickle_save([1, 2], tmp_path / "obj.pkl")
+        with pytest.raises(Exception):
+            pickle_save(lambda x: x, tmp_path / "obj.pkl")
+        assert pickle_load(tmp_path / "obj.pkl") == [1, 2]
+        assert [path.name for path in tmp_path.iterdir()] == ["obj.pkl"]
+
+        with pytest.raises(ValueError):
+            pickle_save([1], tmp_path / "obj.pkl", compression="gzip")
@@ -0,0 +1,95 @@
+# -*- coding:utf-8 -*-
+##############################################################
+# Created Date: Monday, October 19th 2026
+# Contact Info: luoxiangyong01@gmail.com
+# Author/Copyright: Mr. Xiangyong Luo
+##############################################################
+
+from __future__ import absolute_import
+import os
+from pathlib import Path
+import pytest
+
+from _path_setup import add_pkg_to_sys_path
+add_pkg_to_sys_path("pyufunc", False)
+
+from pyufunc import (walk_dir, get_files_by_ext, get_filenames_by_ext, get_dir_size,
+                     count_lines_of_code, show_dir_in_tree, path2linux)
+
+
+@pytest.fixture
+def tree(tmp_path) -> Path:
+    root = tmp_path / "root"
+    (root / "a" / "b").mkdir(parents=True)
+    (root / ".git").mkdir()
+    (root / "x.py").write_text("import os\nprint(os)\n")
+    (root / "a" / "y.py").write_text("one\ntwo\nno newline")
+    (root / "a" / "b" / "z.csv").write_text("c1,c2\n1,2\n")
+    (root / "a" / "b" / "bin.py").write_bytes(b"\0\1\2\n\n")
+    (root / ".git" / "config").write_text("[core]\n")
+    return root
+
+
+def _rel_paths(entries, root: Path) -> list:
+    return sorted(os.path.relpath(entry.path, root).replace("\\", "/") for entry in entries)
+
+
+class TestWalkDir:
+    def test_files_and_filters(self, tree):
+        assert _rel_paths(walk_dir(tree), tree) == [
+            ".git/config", "a/b/bin.py", "a/b/z.csv", "a/y.py", "x.py"]
+        assert _rel_paths(walk_dir(tree, "py", ignore=["b"]), tree) == ["a/y.py", "x.py"]
+        assert _rel_paths(walk_dir(tree, [".csv", ".py"], ignore=".*", max_level=2), tree) == ["a/y.py", "x.py"]
+        assert _rel_paths(walk_dir(tree, max_level=1, include_dirs=True), tree) == [".git", "a", "x.py"]
+
+    def test_threads_and_stat(self, tree):
+        entries = list(walk_dir(tree, with_stat=True, max_workers=4))
+        assert _rel_paths(entries, tree) == _rel_paths(walk_dir(tree), tree)
+        assert sum(entry.stat().st_size for entry in entries) == sum(
+            path.stat().st_size for path in tree.rglob("*") if path.is_file())
+
+        # stopping early does not leave the threads running
+        assert next(walk_dir(tree, max_workers=4)).name
+
+    def test_missing_root(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            list(walk_dir(tmp_path / "missing"))
+
+
+class TestWalkDirUsers:
+    def test_get_files_by_ext(self, tree):
+        root = path2linux(tree)
+        assert sorted(get_files_by_ext(tree, "py", incl_subdir=True)) == [
+            f"{root}/a/b/bin.py", f"{root}/a/y.py", f"{root}/x.py"]
+        assert get_filenames_by_ext(tree, "py") == [f"{root}/x.py"]
+        # the first layer lists the sub folders too
+        assert sorted(get_files_by_ext(tree, "*")) == [f"{root}/.git", f"{root}/a", f"{root}/x.py"]
+
+    def test_get_dir_size(self, tree):
+        size_bytes = sum(path.stat().st_size for path in tree.rglob("*") if path.is_file())
+        assert get_dir_size(path2linux(tree), "kb") == f"Directory size: root {size_bytes / 1024} kb"
+        assert get_dir_size(path2linux(tree), "kb", max_workers=2) == f"Directory size: root {size_bytes / 1024} kb"
+
+    def test_count_lines_of_code(self, tree):
+        # the binary file is skipped, the last line without a newline is counted
+        assert count_lines_of_code(tree, ext="py") == 2 + 3
+        assert count_lines_of_code(tree / "a" / "y.py") == 3
+        assert count_lines_of_code(tree) == 2 + 3 + 2 + 1
+
+    @pytest.mark.parametrize("pattern", ["**/*.csv", ".csv"])
+    def test_show_dir_in_tree(self, tree, capsys, pattern):
+        show_dir_in_tree(tree, pattern)
+        out = capsys.readouterr().out
+        assert "z.csv" in out and "x.py" not in out
+        assert out.splitlines()[1:4] == ["└── \x1b[34ma\x1b[0m", "    └── \x1b[34mb\x1b[0m", "        └── z.csv"]
+
+    def test_show_dir_in_tree_glob_patterns(self, tree, capsys):
+        # as Path.glob, a pattern without "**/" matches in the root folder only
+        show_dir_in_tree(tree, "*.py")
+        out = capsys.readouterr().out
+        assert "x.py" in out and "y.py" not in out and "bin.py" not in out
+
+        # a recursive pattern under a sub folder does not match outside of it
+        show_dir_in_tree(tree, "a/**/*.py")
+        out = capsys.readouterr().out
+        assert "y.py" in out and "bin.py" in out and "x.py" not in out
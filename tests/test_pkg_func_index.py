@@ -0,0 +1,71 @@
+# -*- coding:utf-8 -*-
+##############################################################
+# Created Date: Monday, October 19th 2026
+# Contact Info: luoxiangyong01@gmail.com
+# Author/Copyright: Mr. Xiangyong Luo
+##############################################################
+
+from __future__ import absolute_import
+import importlib
+import socket
+import subprocess
+import sys
+from pathlib import Path
+import pytest
+
+from _path_setup import add_pkg_to_sys_path
+add_pkg_to_sys_path("pyufunc", False)
+
+import pyufunc
+from pyufunc.pkg_func_index import FUNC_INDEX, build_func_index
+from pyufunc import pkg_configs
+
+_IMPORT_CHECK = """
+import socket, sys
+def _no_dns(*args):
+    raise AssertionError("gethostbyname called at import")
+socket.gethostbyname = _no_dns
+import pyufunc
+assert pyufunc.find_util_func_by_keyword("group_dt", verbose=False)
+assert pyufunc.show_util_func_by_category(verbose=False).count("  - ") == len(pyufunc.__all__)
+loaded = [name for name in sys.modules if name.startswith("pyufunc.util_") or name in ("pandas", "numpy")]
+assert not loaded, loaded
+"""
+
+
+class TestFuncIndex:
+    def test_index_is_up_to_date(self):
+        # regenerate by: python -m pyufunc.pkg_func_index
+        assert build_func_index() == FUNC_INDEX
+
+    def test_all_names_resolve(self):
+        for subpkg, names in FUNC_INDEX.items():
+            package = importlib.import_module(f"pyufunc.{subpkg}")
+            for name in names:
+                assert getattr(pyufunc, name) is getattr(package, name)
+        assert set(pyufunc.__all__) == {name for names in FUNC_INDEX.values() for name in names} | {
+            "show_util_func_by_category", "show_util_func_by_keyword", "find_util_func_by_keyword"}
+        assert "path2linux" in dir(pyufunc) and "path2linux" in dir(pyufunc.util_pathio)
+
+    def test_unknown_name(self):
+        with pytest.raises(AttributeError):
+            pyufunc.not_a_function
+        with pytest.raises(ImportError):
+            from pyufunc.util_magic import not_a_function  # noqa: F401
+
+    def test_import_is_lazy(self):
+        subprocess.run([sys.executable, "-c", _IMPORT_CHECK], check=True,
+                       cwd=Path(__file__).resolve().parents[1])
+
+
+class TestLazyConfigs:
+    def test_computer_ip(self):
+        assert "computer_ip" in dir(pyufunc)
+        assert pyufunc.computer_ip == socket.gethostbyname(socket.gethostname())
+
+    def test_host_log_fmt(self):
+        # a plain dict, the host format is built on first access of pkg_configs.log_fmt_host
+        log_fmt = pkg_configs.config_logging["log_fmt"]
+        assert type(log_fmt) is dict and list(log_fmt) == list(range(1, 9))
+        assert f"({pyufunc.computer_ip},{pkg_configs.computer_name})" in pkg_configs.log_fmt_host
+        assert "%(process)d" in pkg_configs.log_fmt_host